@@ -11,6 +11,7 @@ import pandas as pd
 import requests
 
 from app.config.settings import Settings
+from app.libs.linux.ssh_pool import get_ssh_pool
 
 from .context import DataSetContext
 from .exceptions import ConfigurationError, DataConnectorError, DataRetrievalError
@@ -336,23 +337,25 @@ class DataConnector:
         LOGGER.debug("Downloading SFTP file %s from %s:%s", remote_path, host, port)
 
         try:
-            import paramiko
+            import paramiko  # noqa: F401
         except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
             raise DataConnectorError("paramiko is required for SFTP access") from exc
 
-        transport = paramiko.Transport((host, port))
-        try:
-            if key_filename:
-                private_key = paramiko.RSAKey.from_private_key_file(key_filename)
-                transport.connect(username=username, pkey=private_key)
-            else:
-                transport.connect(username=username, password=password)
-
-            with paramiko.SFTPClient.from_transport(transport) as client:
-                with client.open(remote_path, "rb") as remote_file:
-                    body = remote_file.read()
-        finally:
-            transport.close()
+        # Authenticate with the configured key or password only, and accept
+        # hosts missing from known_hosts, as this connector always has
+        with get_ssh_pool().sftp(
+            host,
+            username,
+            port=port,
+            password=None if key_filename else password,
+            key_filename=key_filename,
+            missing_host_key_policy="auto-add",
+            allow_agent=False,
+            look_for_keys=False,
+        ) as client:
+            with client.open(remote_path, "rb") as remote_file:
+                remote_file.prefetch()
+                body = remote_file.read()
 
         temp_path = self._output_dir / f".tmp_{context.slug()}"
         return read_bytes(
@@ -8,7 +8,6 @@ from typing import Any, Callable, Dict, Iterable, List, Mapping, TypeVar
 
 import openpyxl
 import pandas as pd
-import paramiko
 from neo4j import GraphDatabase, exceptions as neo4j_exceptions
 from openpyxl.styles import Alignment, Font
 
@@ -18,6 +17,7 @@ from app.config.settings import (
     SettingsError,
     load_settings,
 )
+from app.libs.linux.ssh_pool import get_ssh_pool
 
 T = TypeVar("T")
 
@@ -221,22 +221,22 @@ class SSHCSVHeaderFetcher:
                 f"No file_path defined for domain '{domain_name}' on server '{server}'"
             )
         results = {domain_type: {}}
-        ssh: paramiko.SSHClient | None = None
         try:
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            ssh.connect(server_host, username=ssh_user, password=ssh_pass)
-            _stdin, stdout, _stderr = ssh.exec_command(f"head -n 1 {file_path}")
-            header_str = stdout.read().decode().strip()
+            # The fetcher has always accepted hosts missing from known_hosts
+            _status, stdout, _stderr = get_ssh_pool().exec_command(
+                server_host,
+                f"head -n 1 {file_path}",
+                ssh_user,
+                password=ssh_pass,
+                missing_host_key_policy="auto-add",
+            )
+            header_str = stdout.decode().strip()
             cols = [col.strip() for col in header_str.split(",") if col.strip()]
             results[domain_type][domain_name] = cols
         except Exception as exc:
             raise RuntimeError(
                 f"Failed to fetch headers from {server_host}:{file_path}: {exc}"
             ) from exc
-        finally:
-            if ssh is not None:
-                ssh.close()
         return results
 
     def autosize(self, ws, min_width=16, pad=2, wrap=True):
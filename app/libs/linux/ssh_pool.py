@@ -0,0 +1,393 @@
+"""Process-wide pool of SSH transports shared by SFTP and remote-command callers."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Tuple
+
+try:  # pragma: no cover - import guard
+    import paramiko
+except ModuleNotFoundError as exc:  # pragma: no cover - import guard
+    if exc.name != "paramiko":
+        raise
+    paramiko = None  # type: ignore[assignment]
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_KEEPALIVE_SECONDS = 30
+DEFAULT_IDLE_TIMEOUT_SECONDS = 300
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 30
+# OpenSSH servers allow 10 sessions per connection by default (MaxSessions)
+DEFAULT_MAX_SESSIONS = 8
+
+# Missing-host-key policies by name; "reject" matches ssh's StrictHostKeyChecking
+HOST_KEY_POLICIES = {
+    "reject": "RejectPolicy",
+    "auto-add": "AutoAddPolicy",
+    "warn": "WarningPolicy",
+}
+DEFAULT_HOST_KEY_POLICY = "reject"
+
+PoolKey = Tuple[str, int, str, str]
+
+
+def _require_paramiko() -> Any:
+    if paramiko is None:  # pragma: no cover - defensive branch
+        raise ModuleNotFoundError("paramiko is required for SSH/SFTP access")
+    return paramiko
+
+
+@dataclass
+class _PooledTransport:
+    slots: threading.BoundedSemaphore
+    client: Any = None
+    error: BaseException | None = None
+    ready: threading.Event = field(default_factory=threading.Event)
+    leases: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+    @property
+    def transport(self) -> Any:
+        return self.client.get_transport() if self.client is not None else None
+
+    def is_active(self) -> bool:
+        transport = self.transport
+        return transport is not None and transport.is_active()
+
+
+def _close_at_exit(pool_ref: "weakref.ReferenceType[SSHConnectionPool]") -> None:
+    pool = pool_ref()
+    if pool is not None:
+        pool.close_all()
+
+
+class SSHConnectionPool:
+    """Share one authenticated SSH transport per ``(host, port, user)``.
+
+    Connections are opened like ``ssh`` does by default: the server's host
+    key must be in the known_hosts file (unknown hosts are rejected), and
+    authentication tries the configured key file or password, then the SSH
+    agent and the default ``~/.ssh`` keys. Callers may relax this per
+    connection with ``missing_host_key_policy`` (see ``HOST_KEY_POLICIES``),
+    ``allow_agent`` and ``look_for_keys``; transports opened under different
+    host-key policies are never shared. Each SFTP client or remote command
+    runs on its own channel of the shared transport, so repeated calls to the
+    same server cost one handshake. At most ``max_sessions`` channels are
+    open per server at once; further callers wait for a free slot.
+
+    Handshakes run outside the pool lock, so a slow or unreachable server
+    only holds up callers of that server. Transports send keepalives while
+    pooled and are closed once they have been unused for ``idle_timeout``
+    seconds, by the next lease or release or by a background reaper, and
+    at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        *,
+        keepalive: int = DEFAULT_KEEPALIVE_SECONDS,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT_SECONDS,
+        known_hosts_file: str | None = None,
+    ) -> None:
+        self.keepalive = keepalive
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max(1, max_sessions)
+        self.connect_timeout = connect_timeout
+        self.known_hosts_file = known_hosts_file
+        self._entries: dict[PoolKey, _PooledTransport] = {}
+        self._lock = threading.Lock()
+        self._reaper: threading.Thread | None = None
+        self._stop_reaper = threading.Event()
+        self.connect_count = 0
+        atexit.register(_close_at_exit, weakref.ref(self))
+
+    def _connect(
+        self,
+        host: str,
+        port: int,
+        username: str | None,
+        password: str | None,
+        key_filename: str | None,
+        missing_host_key_policy: str,
+        allow_agent: bool,
+        look_for_keys: bool,
+    ) -> Any:
+        """Open, verify and authenticate a new SSH client connection."""
+
+        ssh = _require_paramiko()
+        client = ssh.SSHClient()
+        try:
+            # known_hosts_file None means the user's ~/.ssh/known_hosts
+            client.load_system_host_keys(self.known_hosts_file)
+            client.set_missing_host_key_policy(
+                getattr(ssh, HOST_KEY_POLICIES[missing_host_key_policy])()
+            )
+            client.connect(
+                host,
+                port=port,
+                username=username,
+                password=password,
+                key_filename=key_filename,
+                allow_agent=allow_agent,
+                look_for_keys=look_for_keys,
+                timeout=self.connect_timeout,
+            )
+            client.get_transport().set_keepalive(self.keepalive)
+        except Exception:
+            client.close()
+            raise
+        LOGGER.debug("Opened SSH connection to %s@%s:%s", username, host, port)
+        return client
+
+    def _take_idle(self, now: float) -> list[Tuple[PoolKey, _PooledTransport]]:
+        """Remove unused transports that have been idle too long or have died.
+
+        Must be called with the lock held; the caller closes the returned
+        entries after releasing it.
+        """
+
+        idle = []
+        for key, entry in list(self._entries.items()):
+            if entry.leases:
+                continue
+            if now - entry.last_used >= self.idle_timeout or not entry.is_active():
+                idle.append((key, entry))
+                del self._entries[key]
+        return idle
+
+    @staticmethod
+    def _close(entries: list[Tuple[PoolKey, _PooledTransport]]) -> None:
+        for key, entry in entries:
+            LOGGER.debug("Closing idle SSH transport to %s@%s:%s", key[2], key[0], key[1])
+            entry.client.close()
+
+    def evict_idle(self) -> None:
+        """Close every unused transport that has been idle for ``idle_timeout``."""
+
+        with self._lock:
+            idle = self._take_idle(time.monotonic())
+        self._close(idle)
+
+    def _reap(self) -> None:
+        # Check twice per idle_timeout, but at most once a minute
+        interval = min(max(self.idle_timeout / 2, 0.05), 60.0)
+        while not self._stop_reaper.wait(interval):
+            self.evict_idle()
+            with self._lock:
+                if not self._entries:
+                    self._reaper = None
+                    return
+
+    def _start_reaper(self) -> None:
+        """Start the background reaper if it is not running (call with the lock held)."""
+
+        if self._reaper is None:
+            self._stop_reaper.clear()
+            self._reaper = threading.Thread(
+                target=self._reap, name="ssh-pool-reaper", daemon=True
+            )
+            self._reaper.start()
+
+    def _lease(
+        self,
+        host: str,
+        port: int,
+        username: str | None,
+        password: str | None,
+        key_filename: str | None,
+        missing_host_key_policy: str,
+        allow_agent: bool,
+        look_for_keys: bool,
+    ) -> _PooledTransport:
+        if missing_host_key_policy not in HOST_KEY_POLICIES:
+            raise ValueError(
+                f"Unknown missing_host_key_policy '{missing_host_key_policy}', "
+                f"expected one of: {', '.join(HOST_KEY_POLICIES)}"
+            )
+        key = (host, port, username or "", missing_host_key_policy)
+        with self._lock:
+            stale = self._take_idle(time.monotonic())
+            entry = self._entries.get(key)
+            if entry is not None and entry.ready.is_set() and not entry.is_active():
+                stale.append((key, entry))
+                entry = None
+            # Reserve the slot so concurrent callers wait for this handshake
+            owner = entry is None
+            if owner:
+                entry = _PooledTransport(slots=threading.BoundedSemaphore(self.max_sessions))
+                self._entries[key] = entry
+            entry.leases += 1
+        self._close(stale)
+
+        if owner:
+            try:
+                client = self._connect(
+                    host, port, username, password, key_filename,
+                    missing_host_key_policy, allow_agent, look_for_keys,
+                )
+            except BaseException as exc:
+                with self._lock:
+                    entry.error = exc
+                    entry.leases -= 1
+                    if self._entries.get(key) is entry:
+                        del self._entries[key]
+                entry.ready.set()
+                raise
+            with self._lock:
+                entry.client = client
+                self.connect_count += 1
+                self._start_reaper()
+            entry.ready.set()
+        else:
+            entry.ready.wait()
+            if entry.error is not None:
+                with self._lock:
+                    entry.leases -= 1
+                raise entry.error
+
+        entry.slots.acquire()
+        return entry
+
+    def _release(self, entry: _PooledTransport) -> None:
+        entry.slots.release()
+        now = time.monotonic()
+        with self._lock:
+            entry.leases -= 1
+            entry.last_used = now
+            idle = self._take_idle(now)
+            # Dropped from the pool (close_all, or replaced) while leased
+            orphaned = not entry.leases and all(entry is not other for other in self._entries.values())
+        self._close(idle)
+        if orphaned:
+            entry.client.close()
+
+    @contextmanager
+    def transport(
+        self,
+        host: str,
+        username: str | None = None,
+        *,
+        port: int = 22,
+        password: str | None = None,
+        key_filename: str | None = None,
+        missing_host_key_policy: str = DEFAULT_HOST_KEY_POLICY,
+        allow_agent: bool = True,
+        look_for_keys: bool = True,
+    ) -> Iterator[Any]:
+        """Yield the pooled transport for a server while holding one session slot."""
+
+        entry = self._lease(
+            host, port, username, password, key_filename,
+            missing_host_key_policy, allow_agent, look_for_keys,
+        )
+        try:
+            yield entry.transport
+        finally:
+            self._release(entry)
+
+    @contextmanager
+    def sftp(
+        self,
+        host: str,
+        username: str | None = None,
+        *,
+        port: int = 22,
+        password: str | None = None,
+        key_filename: str | None = None,
+        missing_host_key_policy: str = DEFAULT_HOST_KEY_POLICY,
+        allow_agent: bool = True,
+        look_for_keys: bool = True,
+    ) -> Iterator[Any]:
+        """Yield an SFTP client on a new channel of the pooled transport."""
+
+        ssh = _require_paramiko()
+        with self.transport(
+            host,
+            username,
+            port=port,
+            password=password,
+            key_filename=key_filename,
+            missing_host_key_policy=missing_host_key_policy,
+            allow_agent=allow_agent,
+            look_for_keys=look_for_keys,
+        ) as transport:
+            client = ssh.SFTPClient.from_transport(transport)
+            try:
+                yield client
+            finally:
+                client.close()
+
+    def exec_command(
+        self,
+        host: str,
+        command: str,
+        username: str | None = None,
+        *,
+        port: int = 22,
+        password: str | None = None,
+        key_filename: str | None = None,
+        missing_host_key_policy: str = DEFAULT_HOST_KEY_POLICY,
+        allow_agent: bool = True,
+        look_for_keys: bool = True,
+        timeout: float | None = None,
+    ) -> Tuple[int, bytes, bytes]:
+        """Run *command* on a pooled connection and return ``(status, stdout, stderr)``."""
+
+        with self.transport(
+            host,
+            username,
+            port=port,
+            password=password,
+            key_filename=key_filename,
+            missing_host_key_policy=missing_host_key_policy,
+            allow_agent=allow_agent,
+            look_for_keys=look_for_keys,
+        ) as transport:
+            channel = transport.open_session(timeout=timeout)
+            try:
+                if timeout is not None:
+                    channel.settimeout(timeout)
+                channel.exec_command(command)
+                stdout = channel.makefile("rb").read()
+                stderr = channel.makefile_stderr("rb").read()
+                status = channel.recv_exit_status()
+            finally:
+                channel.close()
+        return status, stdout, stderr
+
+    def close_all(self) -> None:
+        """Close every pooled transport and stop the reaper."""
+
+        self._stop_reaper.set()
+        with self._lock:
+            entries = [entry for entry in self._entries.values() if entry.client is not None]
+            self._entries.clear()
+            self._reaper = None
+        for entry in entries:
+            entry.client.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_default_pool: SSHConnectionPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def get_ssh_pool() -> SSHConnectionPool:
+    """Return the process-wide SSH connection pool."""
+
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = SSHConnectionPool()
+        return _default_pool
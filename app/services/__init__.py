@@ -12,16 +12,29 @@ from .connectors import (
     ConnectorFactory,
     ColumnMapResolver,
     DataMapResolver,
+    FetchCache,
     FetchResult,
     LinuxConnector,
     SFTPConnector,
     SettingsLoader,
+    SourceStat,
 )
 from .processors import (
     ColumnCutter,
+    ColumnProjection,
     DataProcessor,
     FileSplitter,
+    PartitionBuffer,
     ProcessResult,
+    SplitManifest,
+    SplitPartitioner,
+    StreamingCutSplitter,
+    WriterPool,
+)
+from .cypher_registry import (
+    CypherQuery,
+    CypherRegistry,
+    get_cypher_registry,
 )
 from .neo4j_loader import (
     LoadResult,
@@ -44,15 +57,27 @@ __all__ = [
     "ConnectorFactory",
     "ColumnMapResolver",
     "DataMapResolver",
+    "FetchCache",
     "FetchResult",
     "LinuxConnector",
     "SFTPConnector",
     "SettingsLoader",
+    "SourceStat",
     # Processors
     "ColumnCutter",
+    "ColumnProjection",
     "DataProcessor",
     "FileSplitter",
+    "PartitionBuffer",
     "ProcessResult",
+    "SplitManifest",
+    "SplitPartitioner",
+    "StreamingCutSplitter",
+    "WriterPool",
+    # Cypher Registry
+    "CypherQuery",
+    "CypherRegistry",
+    "get_cypher_registry",
     # Neo4j Loader
     "LoadResult",
     "Neo4jLoader",
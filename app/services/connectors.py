@@ -2,24 +2,91 @@
 from __future__ import annotations
 
 import csv
+import errno
+import fcntl
 import json
 import logging
 import os
+import shlex
 import shutil
 import subprocess
+import tempfile
+import time
+import zlib
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Protocol
+from typing import Any, Callable, Dict, Iterator, List, Optional, Protocol, Tuple
 
 import yaml
 
+from app.libs.linux.ssh_pool import get_ssh_pool
+
+try:
+    import paramiko
+    HAS_PARAMIKO = True
+except ImportError:
+    HAS_PARAMIKO = False
+    paramiko = None
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+    xxhash = None
+
+from .processors import ColumnProjection
+
 logger = logging.getLogger(__name__)
 
 # Get project root directory (parent of app/)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 CONF_DIR = PROJECT_ROOT / "conf"
 
+# ioctl request to clone a file's extents (reflink) on Btrfs, XFS and similar
+FICLONE = 0x40049409
+
+# Bytes requested per copy_file_range / sendfile call
+KERNEL_COPY_CHUNK_SIZE = 64 * 1024 * 1024
+
+# Read size when checksumming or resuming a fetch
+FETCH_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Bytes per SFTP read request; paramiko pipelines these via readv
+SFTP_REQUEST_SIZE = 32768
+
+# Read requests kept in flight per SFTP channel (64 x 32 KiB = 2 MiB buffered)
+DEFAULT_SFTP_MAX_REQUESTS = 64
+
+# Files smaller than this are downloaded over a single SFTP channel
+DEFAULT_SFTP_PARALLEL_MIN_BYTES = 64 * 1024 * 1024
+
+# Read size for the output of a remote projection command
+REMOTE_STREAM_CHUNK_SIZE = 256 * 1024
+
+# gzip level used on the source host for remote projections (favours CPU over ratio)
+DEFAULT_REMOTE_COMPRESSLEVEL = 1
+
+# Commands that decompress a source on the remote host, by file suffix
+REMOTE_DECOMPRESS_COMMANDS = {
+    ".gz": "gzip -dc",
+    ".bz2": "bzip2 -dc",
+    ".zst": "zstd -dc",
+    ".lz4": "lz4 -dc",
+}
+
+# Timeout for the scp fallback used when paramiko is unavailable
+DEFAULT_SCP_TIMEOUT_SECONDS = 300
+
+# Errors meaning a copy strategy is unsupported here, so the next one is tried
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV, errno.EPERM, errno.EACCES, errno.ENOTSUP, errno.EOPNOTSUPP,
+    errno.EINVAL, errno.ENOSYS, errno.EBADF, errno.EMLINK,
+}
+
 
 @dataclass
 class ConnectorConfig:
@@ -40,6 +107,157 @@ class FetchResult:
     local_path: Optional[Path] = None
     error: Optional[str] = None
     bytes_transferred: int = 0
+    method: Optional[str] = None
+    elapsed_seconds: float = 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Transfer throughput, or 0.0 if nothing was timed."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.bytes_transferred / self.elapsed_seconds
+
+
+@dataclass
+class SourceStat:
+    """Identity of a source file used to decide whether a fetch can be skipped."""
+    size: int
+    mtime: float
+    checksum: Optional[str] = None
+
+
+class FetchCache:
+    """Sidecar record of the source a dropbox file was fetched from.
+
+    Stored as ``<destination>.fetch.json``. The record is written with
+    ``complete: false`` before a transfer starts and completed afterwards,
+    so an interrupted transfer can be resumed while the source is unchanged.
+    ``variant`` distinguishes fetches that store something other than the raw
+    source (such as a remote column projection); records of a different variant
+    are never reused.
+    """
+
+    def __init__(self, destination_path: Path, variant: Optional[str] = None):
+        """
+        Initialize the fetch cache for a destination file.
+
+        Args:
+            destination_path: Local path the source is fetched to
+            variant: Tag for the form the source is stored in (None for a raw copy)
+        """
+        self.destination_path = destination_path
+        self.variant = variant
+        self.sidecar_path = destination_path.with_name(f"{destination_path.name}.fetch.json")
+
+    def _load(self) -> Dict[str, Any]:
+        """Return the sidecar record, or an empty dict if missing or unreadable."""
+        try:
+            with self.sidecar_path.open("r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, record: Dict[str, Any]) -> None:
+        """Atomically write the sidecar record."""
+        self.sidecar_path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.sidecar_path.with_name(f"{self.sidecar_path.name}.tmp")
+        with temp.open("w", encoding="utf-8") as f:
+            json.dump(record, f)
+        os.replace(temp, self.sidecar_path)
+
+    def _same_source(self, record: Dict[str, Any], source_path: str, stat: SourceStat) -> bool:
+        """Whether the record describes the given source in its current state."""
+        if record.get("source") != source_path or record.get("variant") != self.variant:
+            return False
+        if record.get("size") != stat.size or record.get("mtime") != stat.mtime:
+            return False
+        if stat.checksum and record.get("checksum") not in (None, stat.checksum):
+            return False
+        return True
+
+    def is_current(self, source_path: str, stat: SourceStat) -> bool:
+        """Whether the destination is a complete fetch of the unchanged source."""
+        record = self._load()
+        return (
+            record.get("complete", False)
+            and self._same_source(record, source_path, stat)
+            and self.destination_path.exists()
+            and self.destination_path.stat().st_size == record.get("local_size", stat.size)
+        )
+
+    def resume_offset(self, source_path: str, stat: SourceStat) -> int:
+        """Return the size of a partial fetch of the unchanged source, or 0."""
+        if self.variant is not None:
+            # A transformed destination's size is not an offset into the source
+            return 0
+        record = self._load()
+        if record.get("complete", True) or not self._same_source(record, source_path, stat):
+            return 0
+        if not self.destination_path.exists():
+            return 0
+        size = self.destination_path.stat().st_size
+        return size if size < stat.size else 0
+
+    def mark_started(self, source_path: str, stat: SourceStat) -> None:
+        """Record that a transfer of the source has started."""
+        self._save(dict(asdict(stat), source=source_path, variant=self.variant, complete=False))
+
+    def mark_complete(self, source_path: str, stat: SourceStat) -> None:
+        """Record that the destination holds the complete source."""
+        self._save(dict(
+            asdict(stat),
+            source=source_path,
+            variant=self.variant,
+            local_size=self.destination_path.stat().st_size,
+            complete=True
+        ))
+
+
+def _shell_char(char: str) -> str:
+    """Quote a single delimiter character for a POSIX shell command line."""
+    if char.isprintable() and not char.isspace():
+        return shlex.quote(char)
+    # Control characters such as \x01 are produced with printf (no bash $'...' needed)
+    return f"\"$(printf '\\{ord(char):03o}')\""
+
+
+def _remote_projection_command(
+    source_path: str,
+    projection: ColumnProjection,
+    delimiter: str = "\x01",
+    output_delimiter: str = ",",
+    compress: bool = False,
+    compresslevel: int = DEFAULT_REMOTE_COMPRESSLEVEL
+) -> str:
+    """
+    Build the shell pipeline that projects a source file's columns on its host.
+
+    Args:
+        source_path: Path of the source file on the remote host
+        projection: Column projection to apply
+        delimiter: Single-character source field delimiter
+        output_delimiter: Single-character delimiter for the projected output
+        compress: Whether to gzip the projected stream before it is sent
+        compresslevel: gzip level used when compressing
+
+    Returns:
+        Command line for a POSIX shell
+    """
+    if len(delimiter) != 1 or len(output_delimiter) != 1:
+        raise ValueError("Remote projection requires single-character delimiters")
+
+    quoted_path = shlex.quote(source_path)
+    cut = f"cut -d {_shell_char(delimiter)} -f {projection.cut_fields}"
+    decompress = REMOTE_DECOMPRESS_COMMANDS.get(Path(source_path).suffix.lower())
+    if decompress:
+        command = f"{decompress} -- {quoted_path} | {cut}"
+    else:
+        command = f"{cut} -- {quoted_path}"
+    if output_delimiter != delimiter:
+        command += f" | tr {_shell_char(delimiter)} {_shell_char(output_delimiter)}"
+    if compress:
+        command += f" | gzip -c -{compresslevel}"
+    return command
 
 
 class BaseConnector(ABC):
@@ -59,12 +277,111 @@ class BaseConnector(ABC):
         """Test if the connection is available."""
         pass
 
+    def stat(self, source_path: str) -> Optional[SourceStat]:
+        """Return the size and mtime of the source, or None if unsupported."""
+        return None
+
+    def fetch_from(self, source_path: str, destination_path: Path, offset: int) -> FetchResult:
+        """Append the source from ``offset`` onwards to a partial destination.
+
+        Connectors that cannot resume transfer the whole file again.
+        """
+        return self.fetch(source_path, destination_path)
+
+
+def _shares_inode(path: Path) -> bool:
+    """Whether ``path`` is hardlinked, so writing to it would change another file."""
+    try:
+        return path.stat().st_nlink > 1
+    except FileNotFoundError:
+        return False
+
+
+def _hardlink(source: Path, destination: Path) -> None:
+    """Hardlink ``source`` at ``destination``."""
+    os.link(source, destination)
+
+
+def _reflink(source: Path, destination: Path) -> None:
+    """Clone ``source`` into ``destination`` without copying data (FICLONE)."""
+    with source.open("rb") as src, destination.open("wb") as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+
+
+def _kernel_copy(source: Path, destination: Path, use_sendfile: bool = False) -> None:
+    """Copy ``source`` to ``destination`` in the kernel, without user-space buffers."""
+    with source.open("rb") as src, destination.open("wb") as dst:
+        remaining = os.fstat(src.fileno()).st_size
+        offset = 0
+        while remaining > 0:
+            count = min(remaining, KERNEL_COPY_CHUNK_SIZE)
+            if use_sendfile:
+                copied = os.sendfile(dst.fileno(), src.fileno(), offset, count)
+            else:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), count)
+            if copied == 0:
+                break
+            offset += copied
+            remaining -= copied
+
+
+def _link_or_copy(source: Path, destination: Path) -> str:
+    """Place ``source`` at ``destination`` using the cheapest supported method.
+
+    Tries a hardlink, a reflink, ``copy_file_range``, ``sendfile`` and finally
+    ``shutil.copyfile``, moving on whenever the filesystem or kernel does not
+    support a method. The file is built under a temporary name and renamed
+    over the destination, so an existing destination (which may be a hardlink
+    of another file) is never written to.
+
+    Returns:
+        Name of the method that succeeded
+    """
+    strategies = [("hardlink", _hardlink), ("reflink", _reflink)]
+    if hasattr(os, "copy_file_range"):
+        strategies.append(("copy_file_range", _kernel_copy))
+    if hasattr(os, "sendfile"):
+        strategies.append(
+            ("sendfile", lambda src, dst: _kernel_copy(src, dst, use_sendfile=True))
+        )
+    strategies.append(("copy", shutil.copyfile))
+
+    temp = destination.with_name(f".{destination.name}.fetch")
+    try:
+        for method, strategy in strategies:
+            if temp.exists():
+                temp.unlink()
+            try:
+                strategy(source, temp)
+            except OSError as e:
+                if e.errno not in _UNSUPPORTED_ERRNOS or method == "copy":
+                    raise
+                logger.debug(f"{method} not available for {source} -> {destination}: {e}")
+                continue
+            if method != "hardlink":
+                shutil.copystat(source, temp)
+            os.replace(temp, destination)
+            return method
+    finally:
+        if temp.exists():
+            temp.unlink()
+
 
 class LinuxConnector(BaseConnector):
-    """Connector for local Linux filesystem or mounted NAS."""
+    """Connector for local Linux filesystem or mounted NAS.
+
+    ``fetch_mode`` in the connector params selects how the file is fetched:
+    ``"copy"`` (default) places it in the destination by hardlink, reflink or
+    kernel copy, whichever is cheapest; ``"in_place"`` copies nothing and
+    returns the source path so later stages read the source directly.
+
+    A hardlinked destination shares the source's inode, so it is never opened
+    for writing: full fetches replace it by rename, and a resume onto a
+    hardlinked destination fetches the whole file again instead of appending.
+    """
 
     def fetch(self, source_path: str, destination_path: Path) -> FetchResult:
-        """Copy a file from local/mounted filesystem."""
+        """Fetch a file from local/mounted filesystem."""
         try:
             source = Path(source_path)
             if not source.exists():
@@ -73,34 +390,126 @@ class LinuxConnector(BaseConnector):
                     error=f"Source file not found: {source_path}"
                 )
 
+            if self.config.params.get("fetch_mode", "copy") == "in_place":
+                logger.info(f"Reading {source_path} in place")
+                return FetchResult(success=True, local_path=source, method="in_place")
+
+            if destination_path.exists() and os.path.samefile(source, destination_path):
+                # Same path, or hardlinked by an earlier fetch
+                same_path = source.resolve() == destination_path.resolve()
+                logger.info(f"{destination_path} is already the source file")
+                return FetchResult(
+                    success=True,
+                    local_path=destination_path,
+                    method="in_place" if same_path else "hardlink"
+                )
+
             # Ensure destination directory exists
             destination_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Copy the file
-            shutil.copy2(source, destination_path)
+            method = _link_or_copy(source, destination_path)
             file_size = destination_path.stat().st_size
+            bytes_transferred = file_size if method in ("copy_file_range", "sendfile", "copy") else 0
 
-            logger.info(f"Successfully copied {source_path} to {destination_path} ({file_size} bytes)")
+            logger.info(f"Fetched {source_path} to {destination_path} by {method} ({file_size} bytes)")
             return FetchResult(
                 success=True,
                 local_path=destination_path,
-                bytes_transferred=file_size
+                bytes_transferred=bytes_transferred,
+                method=method
             )
         except Exception as e:
             logger.error(f"Failed to copy file: {e}")
             return FetchResult(success=False, error=str(e))
 
+    def stat(self, source_path: str) -> Optional[SourceStat]:
+        """Return the source size and mtime, with an xxhash if ``fetch_checksum`` is set."""
+        source = Path(source_path)
+        if not source.exists():
+            return None
+        st = source.stat()
+        checksum = None
+        if self.config.params.get("fetch_checksum"):
+            if HAS_XXHASH:
+                digest = xxhash.xxh3_64()
+                with source.open("rb") as f:
+                    for chunk in iter(lambda: f.read(FETCH_CHUNK_SIZE), b""):
+                        digest.update(chunk)
+                checksum = digest.hexdigest()
+            else:
+                logger.warning("fetch_checksum requires xxhash; comparing size and mtime only")
+        return SourceStat(size=st.st_size, mtime=st.st_mtime, checksum=checksum)
+
+    def fetch_from(self, source_path: str, destination_path: Path, offset: int) -> FetchResult:
+        """Append the remainder of a local source to a partial destination."""
+        try:
+            if _shares_inode(destination_path):
+                # Appending would write into the source (or another linked file)
+                logger.info(f"{destination_path} is hardlinked, fetching it again instead of resuming")
+                return self.fetch(source_path, destination_path)
+
+            with open(source_path, "rb") as src, destination_path.open("ab") as dst:
+                if os.path.samestat(os.fstat(src.fileno()), os.fstat(dst.fileno())):
+                    raise RuntimeError(f"Refusing to append {source_path} to itself")
+                src.seek(offset)
+                shutil.copyfileobj(src, dst, FETCH_CHUNK_SIZE)
+            shutil.copystat(source_path, destination_path)
+            file_size = destination_path.stat().st_size
+            logger.info(f"Resumed {source_path} at byte {offset} ({file_size - offset} bytes)")
+            return FetchResult(
+                success=True,
+                local_path=destination_path,
+                bytes_transferred=file_size - offset,
+                method="resume"
+            )
+        except Exception as e:
+            logger.error(f"Failed to resume copy: {e}")
+            return FetchResult(success=False, error=str(e))
+
     def test_connection(self) -> bool:
         """Test if the source path is accessible."""
         return True  # Local filesystem is always accessible
 
 
 class SFTPConnector(BaseConnector):
-    """Connector for SFTP file transfers."""
-
-    def __init__(self, config: ConnectorConfig, settings: Dict[str, Any]):
+    """Connector for SFTP file transfers.
+
+    Uses paramiko when installed: connections come from the process-wide SSH
+    pool, reads are pipelined with ``readv``, and files of at least ``sftp_parallel_min_bytes``
+    are downloaded as ``sftp_parallel_parts`` byte ranges over separate SFTP
+    channels. Each channel keeps at most ``sftp_max_requests`` reads in flight.
+    Without paramiko, files are fetched with ``scp``.
+
+    With ``fetch_checksum`` set, ``stat`` also hashes the file on the source
+    host with ``sha256sum`` (a full read of the remote file on every check).
+
+    ``fetch_projected`` instead runs the column cut on the source host and
+    streams back only the kept columns (enabled per source with the
+    ``remote_projection`` connector param, plus ``remote_projection_compress``
+    to gzip the stream in transit).
+
+    ``sftp_factory`` may be given to supply SFTP clients directly (for example
+    an in-process stand-in server); it must return objects with paramiko's
+    ``SFTPClient`` ``stat``/``open``/``close`` interface.
+    """
+
+    def __init__(
+        self,
+        config: ConnectorConfig,
+        settings: Dict[str, Any],
+        sftp_factory: Optional[Callable[[], Any]] = None
+    ):
         super().__init__(config, settings)
         self.server_settings = self._get_server_settings()
+        self.sftp_factory = sftp_factory
+        params = config.params
+        self.port = int(params.get("port", 22))
+        self.parallel_parts = max(1, int(params.get("sftp_parallel_parts", 1)))
+        self.parallel_min_bytes = int(
+            params.get("sftp_parallel_min_bytes", DEFAULT_SFTP_PARALLEL_MIN_BYTES)
+        )
+        self.max_requests = max(1, int(params.get("sftp_max_requests", DEFAULT_SFTP_MAX_REQUESTS)))
+        self.scp_timeout = float(params.get("scp_timeout", DEFAULT_SCP_TIMEOUT_SECONDS))
 
     def _get_server_settings(self) -> Dict[str, str]:
         """Get server credentials from settings."""
@@ -115,25 +524,150 @@ class SFTPConnector(BaseConnector):
 
         return linux_servers.get(server_name, {})
 
+    @property
+    def uses_sftp(self) -> bool:
+        """Whether transfers go through an SFTP client rather than scp."""
+        return self.sftp_factory is not None or HAS_PARAMIKO
+
+    @contextmanager
+    def _sftp(self) -> Iterator[Any]:
+        """Yield an SFTP client on a channel of the pooled connection to this server."""
+        if self.sftp_factory is not None:
+            client = self.sftp_factory()
+            try:
+                yield client
+            finally:
+                client.close()
+            return
+
+        with get_ssh_pool().sftp(
+            self.config.server_name,
+            self.server_settings.get("user"),
+            port=self.port,
+            password=self.server_settings.get("pass"),
+            key_filename=self.config.params.get("key_filename")
+        ) as client:
+            yield client
+
+    def _remote_size(self, source_path: str) -> int:
+        """Return the size of the remote file."""
+        with self._sftp() as sftp:
+            return sftp.stat(source_path).st_size
+
+    def _download_range(self, source_path: str, fd: int, start: int, end: int) -> int:
+        """Download ``[start, end)`` of the remote file into ``fd`` at the same offsets.
+
+        Returns:
+            Number of bytes written
+        """
+        with self._sftp() as sftp, sftp.open(source_path, "rb") as remote:
+            chunks = [
+                (offset, min(SFTP_REQUEST_SIZE, end - offset))
+                for offset in range(start, end, SFTP_REQUEST_SIZE)
+            ]
+            position = start
+            for data in remote.readv(chunks, max_concurrent_prefetch_requests=self.max_requests):
+                os.pwrite(fd, data, position)
+                position += len(data)
+        return position - start
+
+    def _download(self, source_path: str, destination_path: Path, start: int, size: int) -> int:
+        """Download the remote file from ``start`` to ``size`` into the destination.
+
+        Returns:
+            Number of bytes written
+        """
+        remaining = size - start
+        parts = self.parallel_parts if remaining >= self.parallel_min_bytes else 1
+        fd = os.open(destination_path, os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            if parts == 1:
+                # Sequential writes keep a partial file a valid prefix for resuming
+                os.ftruncate(fd, start)
+                return self._download_range(source_path, fd, start, size)
+
+            # Parallel ranges fill the file out of order, so it is sized up front
+            # (an interrupted parallel download is not resumable as a prefix)
+            os.ftruncate(fd, size)
+
+            part_size = -(-remaining // parts)
+            ranges: List[Tuple[int, int]] = [
+                (offset, min(offset + part_size, size))
+                for offset in range(start, size, part_size)
+            ]
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                written = executor.map(
+                    lambda r: self._download_range(source_path, fd, r[0], r[1]), ranges
+                )
+                return sum(written)
+        finally:
+            os.close(fd)
+
+    def _transfer(
+        self,
+        source_path: str,
+        destination_path: Path,
+        offset: int,
+        method: str
+    ) -> FetchResult:
+        """Download the remote file from ``offset`` and build the fetch result."""
+        started = time.monotonic()
+        destination_path.parent.mkdir(parents=True, exist_ok=True)
+        size = self._remote_size(source_path)
+        if offset > size:
+            offset = 0
+        transferred = self._download(source_path, destination_path, offset, size)
+        elapsed = time.monotonic() - started
+
+        result = FetchResult(
+            success=True,
+            local_path=destination_path,
+            bytes_transferred=transferred,
+            method=method,
+            elapsed_seconds=elapsed
+        )
+        if offset + transferred != size:
+            result.success = False
+            result.error = f"Incomplete transfer: {offset + transferred} of {size} bytes"
+            return result
+
+        logger.info(
+            f"Fetched {source_path} via SFTP ({transferred} bytes in {elapsed:.1f}s, "
+            f"{result.bytes_per_second / (1024 * 1024):.1f} MiB/s)"
+        )
+        return result
+
     def fetch(self, source_path: str, destination_path: Path) -> FetchResult:
         """Fetch a file via SFTP."""
         try:
-            server_settings = self.server_settings
-            if not server_settings:
+            if not self.server_settings and self.sftp_factory is None:
                 return FetchResult(
                     success=False,
                     error=f"No server settings found for {self.config.server_name}"
                 )
+            if not self.uses_sftp:
+                return self._fetch_with_scp(source_path, destination_path)
 
-            user = server_settings.get("user")
+            if destination_path.exists():
+                destination_path.unlink()
+            return self._transfer(source_path, destination_path, 0, "sftp")
+        except Exception as e:
+            logger.error(f"SFTP fetch failed: {e}")
+            return FetchResult(success=False, error=str(e))
+
+    def _fetch_with_scp(self, source_path: str, destination_path: Path) -> FetchResult:
+        """Fetch a file with the scp command (used when paramiko is unavailable)."""
+        try:
+            user = self.server_settings.get("user")
             host = self.config.server_name
 
             # Ensure destination directory exists
             destination_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Use scp for file transfer (assumes SSH keys are set up)
+            started = time.monotonic()
             cmd = ["scp", f"{user}@{host}:{source_path}", str(destination_path)]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=self.scp_timeout)
 
             if result.returncode != 0:
                 return FetchResult(
@@ -142,11 +676,13 @@ class SFTPConnector(BaseConnector):
                 )
 
             file_size = destination_path.stat().st_size
-            logger.info(f"Successfully fetched {source_path} via SFTP ({file_size} bytes)")
+            logger.info(f"Successfully fetched {source_path} via SCP ({file_size} bytes)")
             return FetchResult(
                 success=True,
                 local_path=destination_path,
-                bytes_transferred=file_size
+                bytes_transferred=file_size,
+                method="scp",
+                elapsed_seconds=time.monotonic() - started
             )
         except subprocess.TimeoutExpired:
             return FetchResult(success=False, error="SFTP transfer timed out")
@@ -154,9 +690,221 @@ class SFTPConnector(BaseConnector):
             logger.error(f"SFTP fetch failed: {e}")
             return FetchResult(success=False, error=str(e))
 
+    def stat(self, source_path: str) -> Optional[SourceStat]:
+        """Return the remote size and mtime, with a SHA-256 if ``fetch_checksum`` is set."""
+        if not self.server_settings and self.sftp_factory is None:
+            return None
+        try:
+            if self.uses_sftp:
+                with self._sftp() as sftp:
+                    attrs = sftp.stat(source_path)
+                size, mtime = attrs.st_size, float(attrs.st_mtime)
+            else:
+                user = self.server_settings.get("user")
+                host = self.config.server_name
+                cmd = ["ssh", f"{user}@{host}", "stat", "-c", "%s %Y", source_path]
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+                if result.returncode != 0:
+                    return None
+                size_text, mtime_text = result.stdout.split()
+                size, mtime = int(size_text), float(mtime_text)
+        except Exception as e:
+            logger.warning(f"Could not stat {source_path} on {self.config.server_name}: {e}")
+            return None
+
+        checksum = None
+        if self.config.params.get("fetch_checksum"):
+            checksum = self._remote_checksum(source_path)
+        return SourceStat(size=size, mtime=mtime, checksum=checksum)
+
+    def _remote_checksum(self, source_path: str) -> Optional[str]:
+        """Return the SHA-256 of the remote file, computed on the source host."""
+        output = bytearray()
+        try:
+            status, stderr = self._stream_command(
+                f"sha256sum -- {shlex.quote(source_path)}", output.extend
+            )
+        except Exception as e:
+            status, stderr = -1, str(e)
+        if status != 0 or not output.split():
+            logger.warning(
+                f"Could not checksum {source_path} on {self.config.server_name}, "
+                f"comparing size and mtime only: {stderr.strip()}"
+            )
+            return None
+        return output.split()[0].decode("ascii")
+
+    def fetch_from(self, source_path: str, destination_path: Path, offset: int) -> FetchResult:
+        """Download the remote file from ``offset`` onwards into a partial destination."""
+        try:
+            if _shares_inode(destination_path):
+                # Writing in place would change the file it is hardlinked to
+                return self.fetch(source_path, destination_path)
+            if self.uses_sftp:
+                return self._transfer(source_path, destination_path, offset, "resume")
+
+            user = self.server_settings.get("user")
+            host = self.config.server_name
+            cmd = ["ssh", f"{user}@{host}", "tail", "-c", f"+{offset + 1}", source_path]
+            started = time.monotonic()
+            with destination_path.open("ab") as dst:
+                result = subprocess.run(
+                    cmd, stdout=dst, stderr=subprocess.PIPE, timeout=self.scp_timeout
+                )
+            if result.returncode != 0:
+                return FetchResult(
+                    success=False,
+                    error=f"Resume failed: {result.stderr.decode('utf-8', errors='replace')}"
+                )
+            file_size = destination_path.stat().st_size
+            logger.info(f"Resumed {source_path} via SSH at byte {offset} ({file_size - offset} bytes)")
+            return FetchResult(
+                success=True,
+                local_path=destination_path,
+                bytes_transferred=file_size - offset,
+                method="resume",
+                elapsed_seconds=time.monotonic() - started
+            )
+        except subprocess.TimeoutExpired:
+            return FetchResult(success=False, error="SFTP resume timed out")
+        except Exception as e:
+            logger.error(f"SFTP resume failed: {e}")
+            return FetchResult(success=False, error=str(e))
+
+    def _stream_command(self, command: str, sink: Callable[[bytes], None]) -> Tuple[int, str]:
+        """Run a command on the source host, passing its stdout to ``sink`` in chunks.
+
+        Returns:
+            Tuple of (exit status, stderr text)
+        """
+        if HAS_PARAMIKO and self.sftp_factory is None:
+            with get_ssh_pool().transport(
+                self.config.server_name,
+                self.server_settings.get("user"),
+                port=self.port,
+                password=self.server_settings.get("pass"),
+                key_filename=self.config.params.get("key_filename")
+            ) as transport:
+                channel = transport.open_session()
+                try:
+                    # Applies per read, so a slow but steady stream is not cut off
+                    channel.settimeout(self.scp_timeout)
+                    channel.exec_command(command)
+                    for data in iter(lambda: channel.recv(REMOTE_STREAM_CHUNK_SIZE), b""):
+                        sink(data)
+                    stderr = channel.makefile_stderr("rb").read()
+                    status = channel.recv_exit_status()
+                finally:
+                    channel.close()
+            return status, stderr.decode("utf-8", errors="replace")
+
+        user = self.server_settings.get("user")
+        host = self.config.server_name
+        cmd = ["ssh", "-p", str(self.port), f"{user}@{host}", command]
+        with tempfile.TemporaryFile() as stderr_file:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+            try:
+                for data in iter(lambda: proc.stdout.read(REMOTE_STREAM_CHUNK_SIZE), b""):
+                    sink(data)
+                status = proc.wait(timeout=self.scp_timeout)
+            finally:
+                if proc.poll() is None:
+                    proc.kill()
+                proc.stdout.close()
+            stderr_file.seek(0)
+            return status, stderr_file.read().decode("utf-8", errors="replace")
+
+    def fetch_projected(
+        self,
+        source_path: str,
+        destination_path: Path,
+        projection: ColumnProjection,
+        delimiter: str = "\x01",
+        output_delimiter: str = ",",
+        header: Optional[bytes] = None,
+        compress: bool = False
+    ) -> FetchResult:
+        """
+        Fetch only the projected columns of a file, cutting them on the source host.
+
+        The projection runs as ``cut`` (plus ``tr`` and optionally ``gzip``) over
+        SSH and its output is streamed straight into the destination, so only the
+        kept columns cross the network. The destination is in the cut stage's
+        output format, so the caller should skip the local cut.
+
+        Args:
+            source_path: Path of the source file on the remote host
+            destination_path: Local path for the projected file
+            projection: Column projection to apply
+            delimiter: Source field delimiter
+            output_delimiter: Field delimiter of the projected file
+            header: Header line to write before the projected rows, if any
+            compress: Gzip the stream on the source host (decompressed locally)
+
+        Returns:
+            FetchResult whose ``bytes_transferred`` counts bytes received over the wire
+        """
+        try:
+            if not self.server_settings:
+                return FetchResult(
+                    success=False,
+                    error=f"No server settings found for {self.config.server_name}"
+                )
+            command = _remote_projection_command(
+                source_path, projection, delimiter, output_delimiter, compress
+            )
+            logger.info(f"Projecting {source_path} on {self.config.server_name}: {command}")
+
+            started = time.monotonic()
+            destination_path.parent.mkdir(parents=True, exist_ok=True)
+            received = 0
+            decompressor = zlib.decompressobj(wbits=31) if compress else None
+
+            with destination_path.open("wb") as dst:
+                if header:
+                    dst.write(header)
+
+                def sink(data: bytes) -> None:
+                    nonlocal received
+                    received += len(data)
+                    dst.write(decompressor.decompress(data) if decompressor else data)
+
+                status, stderr = self._stream_command(command, sink)
+                if decompressor:
+                    dst.write(decompressor.flush())
+
+            # A pipeline reports only its last command's status, so stderr from
+            # an earlier stage (e.g. a missing source) also counts as a failure
+            if status != 0 or stderr.strip():
+                return FetchResult(
+                    success=False,
+                    error=f"Remote projection failed (exit {status}): {stderr.strip()}"
+                )
+
+            result = FetchResult(
+                success=True,
+                local_path=destination_path,
+                bytes_transferred=received,
+                method="remote_projection",
+                elapsed_seconds=time.monotonic() - started
+            )
+            logger.info(
+                f"Fetched projected {source_path} ({received} bytes received, "
+                f"{destination_path.stat().st_size} bytes written in {result.elapsed_seconds:.1f}s)"
+            )
+            return result
+        except Exception as e:
+            logger.error(f"Remote projection of {source_path} failed: {e}")
+            return FetchResult(success=False, error=str(e))
+
     def test_connection(self) -> bool:
         """Test SFTP connection."""
         try:
+            if self.uses_sftp:
+                with self._sftp() as sftp:
+                    sftp.stat(".")
+                return True
+
             server_settings = self.server_settings
             if not server_settings:
                 return False
@@ -252,6 +1000,7 @@ class ColumnMapResolver:
     def __init__(self, column_map_path: Optional[Path] = None):
         self.column_map_path = column_map_path or (CONF_DIR / "column_map.yaml")
         self._config: Optional[Dict[str, Any]] = None
+        self._projections: Dict[str, Optional[ColumnProjection]] = {}
 
     def _load_config(self) -> Dict[str, Any]:
         """Load the column map configuration."""
@@ -276,6 +1025,16 @@ class ColumnMapResolver:
         domains = config.get("domains", {})
         return domains.get(domain_name)
 
+    def get_projection(self, domain_name: str) -> Optional[ColumnProjection]:
+        """Get the compiled column projection plan for a domain (cached)."""
+        if domain_name in self._projections:
+            return self._projections[domain_name]
+
+        column_config = self.resolve(domain_name)
+        projection = ColumnProjection.from_config(column_config) if column_config else None
+        self._projections[domain_name] = projection
+        return projection
+
     def get_defaults(self) -> Dict[str, Any]:
         """Get default settings."""
         config = self._load_config()
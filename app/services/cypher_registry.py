@@ -0,0 +1,317 @@
+"""Registry of pre-parsed Cypher queries from the .cql files in conf/cypher."""
+from __future__ import annotations
+
+import logging
+import string
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+CYPHER_DIR = PROJECT_ROOT / "conf" / "cypher"
+
+# .cql files that are str.format templates, with the placeholders they may use
+# (literal braces in these files are written doubled, e.g. {{gfcid: row.gfcid}})
+TEMPLATE_PLACEHOLDERS: Dict[str, Tuple[str, ...]] = {
+    "cypher_00_load_transactions.cql": ("file_name",),
+}
+
+# Minimum seconds between checks of the directory for changed files
+DEFAULT_RELOAD_CHECK_SECONDS = 2.0
+
+_BRACKETS = {")": "(", "]": "[", "}": "{"}
+
+
+@dataclass(frozen=True)
+class CypherQuery:
+    """A parsed .cql file: its statements with comments removed."""
+    name: str
+    path: Path
+    mtime: float
+    statements: Tuple[str, ...]
+    is_template: bool = False
+
+    @property
+    def text(self) -> str:
+        """Return the single statement of the file (raises if there are several)."""
+        if len(self.statements) != 1:
+            raise ValueError(f"{self.name} has {len(self.statements)} statements, expected 1")
+        return self.statements[0]
+
+
+def _scan(text: str) -> Iterator[Tuple[str, bool]]:
+    """Yield the characters of a Cypher text outside comments.
+
+    Each character comes with whether it is code, i.e. not inside a string
+    literal or backtick-quoted name. ``//`` comments are dropped up to (not
+    including) the end of line; ``/* */`` comments are dropped entirely.
+    """
+    i = 0
+    n = len(text)
+    quote: Optional[str] = None
+    while i < n:
+        char = text[i]
+        if quote:
+            yield char, False
+            if char == "\\" and quote != "`" and i + 1 < n:
+                yield text[i + 1], False
+                i += 2
+                continue
+            if char == quote:
+                quote = None
+            i += 1
+            continue
+        if char in "'\"`":
+            quote = char
+            yield char, False
+        elif text.startswith("//", i):
+            end = text.find("\n", i)
+            i = n if end == -1 else end
+            continue
+        elif text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            if end == -1:
+                raise ValueError("unterminated /* comment")
+            i = end + 2
+            continue
+        else:
+            yield char, True
+        i += 1
+    if quote:
+        raise ValueError(f"unterminated {quote} quote")
+
+
+def split_statements(text: str) -> List[str]:
+    """
+    Split Cypher text into statements on ``;``, removing comments and blank lines.
+
+    Semicolons inside string literals are not treated as separators. Lines
+    starting with ``//`` are removed even inside strings (such as the inner
+    queries of ``apoc.periodic.iterate``), as the loader always has.
+
+    Args:
+        text: Contents of a .cql file
+
+    Returns:
+        Non-empty statements, without their terminating semicolons
+    """
+    text = "\n".join(line for line in text.split("\n") if not line.strip().startswith("//"))
+    statements: List[str] = []
+    current: List[str] = []
+    for char, is_code in _scan(text):
+        if is_code and char == ";":
+            statements.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+    statements.append("".join(current))
+
+    cleaned = []
+    for statement in statements:
+        lines = [line.rstrip() for line in statement.split("\n") if line.strip()]
+        if lines:
+            cleaned.append("\n".join(lines))
+    return cleaned
+
+
+def _check_brackets(statement: str) -> None:
+    """Raise ValueError if brackets outside string literals are unbalanced."""
+    stack: List[str] = []
+    for char, is_code in _scan(statement):
+        if not is_code:
+            continue
+        if char in "([{":
+            stack.append(char)
+        elif char in _BRACKETS:
+            if not stack or stack.pop() != _BRACKETS[char]:
+                raise ValueError(f"unbalanced '{char}'")
+    if stack:
+        raise ValueError(f"unclosed '{stack[-1]}'")
+
+
+def _validate_template(statement: str, placeholders: Iterable[str]) -> str:
+    """Check a str.format template's placeholders and return it rendered with dummies."""
+    allowed = set(placeholders)
+    fields = {
+        field_name
+        for _, field_name, _, _ in string.Formatter().parse(statement)
+        if field_name is not None
+    }
+    unknown = fields - allowed
+    if unknown:
+        raise ValueError(f"unknown placeholder(s): {', '.join(sorted(unknown))}")
+    return statement.format(**{name: "x" for name in allowed})
+
+
+def parse_cypher_file(path: Path, placeholders: Optional[Iterable[str]] = None) -> CypherQuery:
+    """
+    Read, split and validate a .cql file.
+
+    Validation is syntactic only (balanced quotes, comments and brackets, and
+    known placeholders for templates); the server still parses each query.
+
+    Args:
+        path: Path to the .cql file
+        placeholders: Placeholder names if the file is a str.format template
+
+    Returns:
+        Parsed query
+
+    Raises:
+        ValueError: If the file is malformed
+    """
+    mtime = path.stat().st_mtime
+    statements = split_statements(path.read_text(encoding="utf-8"))
+    is_template = placeholders is not None
+    for number, statement in enumerate(statements, start=1):
+        try:
+            checked = _validate_template(statement, placeholders) if is_template else statement
+            _check_brackets(checked)
+        except (ValueError, IndexError) as e:
+            raise ValueError(f"statement {number}: {e}") from e
+    if is_template and len(statements) > 1:
+        raise ValueError(f"templates must contain one statement, found {len(statements)}")
+    return CypherQuery(
+        name=path.name,
+        path=path,
+        mtime=mtime,
+        statements=tuple(statements),
+        is_template=is_template
+    )
+
+
+class CypherRegistry:
+    """Parse every .cql file in a directory once and serve the cached statements.
+
+    All files are parsed and validated by ``load``, so a malformed file is
+    reported before any data is loaded. Lookups re-check file modification
+    times at most every ``reload_check_seconds`` and re-parse changed, added
+    or removed files; a file that fails validation on reload keeps its last
+    good version.
+    """
+
+    def __init__(
+        self,
+        directory: Path = CYPHER_DIR,
+        templates: Optional[Mapping[str, Iterable[str]]] = None,
+        reload_check_seconds: float = DEFAULT_RELOAD_CHECK_SECONDS
+    ):
+        """
+        Initialize the registry (call ``load`` before use).
+
+        Args:
+            directory: Directory containing the .cql files
+            templates: Template file names with their placeholder names
+            reload_check_seconds: Minimum seconds between modification checks
+        """
+        self.directory = directory
+        self.templates = {
+            name: tuple(placeholders)
+            for name, placeholders in (TEMPLATE_PLACEHOLDERS if templates is None else templates).items()
+        }
+        self.reload_check_seconds = reload_check_seconds
+        self._queries: Dict[str, CypherQuery] = {}
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _parse(self, path: Path) -> CypherQuery:
+        return parse_cypher_file(path, self.templates.get(path.name))
+
+    def load(self) -> "CypherRegistry":
+        """
+        Parse and validate every .cql file in the directory.
+
+        Returns:
+            This registry
+
+        Raises:
+            ValueError: Listing every file that failed validation
+        """
+        queries: Dict[str, CypherQuery] = {}
+        errors: List[str] = []
+        for path in sorted(self.directory.glob("*.cql")):
+            try:
+                queries[path.name] = self._parse(path)
+            except (OSError, ValueError) as e:
+                errors.append(f"{path.name}: {e}")
+        if errors:
+            raise ValueError(f"Invalid Cypher files in {self.directory}: " + "; ".join(errors))
+
+        with self._lock:
+            self._queries = queries
+            self._checked_at = time.monotonic()
+        logger.info(f"Loaded {len(queries)} Cypher files from {self.directory}")
+        return self
+
+    def _refresh(self) -> None:
+        """Re-parse files whose modification time changed since they were loaded."""
+        now = time.monotonic()
+        if now - self._checked_at < self.reload_check_seconds:
+            return
+        self._checked_at = now
+
+        current = {path.name: path for path in self.directory.glob("*.cql")}
+        for name in set(self._queries) - set(current):
+            logger.info(f"Cypher file removed: {name}")
+            del self._queries[name]
+        for name, path in current.items():
+            cached = self._queries.get(name)
+            try:
+                if cached is not None and path.stat().st_mtime == cached.mtime:
+                    continue
+                self._queries[name] = self._parse(path)
+                logger.info(f"Reloaded Cypher file: {name}")
+            except (OSError, ValueError) as e:
+                logger.error(f"Failed to reload Cypher file {name}, keeping previous version: {e}")
+
+    def get(self, name: str) -> Optional[CypherQuery]:
+        """
+        Return a parsed .cql file by file name.
+
+        Args:
+            name: File name within the registry directory
+
+        Returns:
+            Parsed query, or None if there is no such file
+        """
+        with self._lock:
+            self._refresh()
+            return self._queries.get(name)
+
+    def statements(self, name: str) -> Tuple[str, ...]:
+        """Return the statements of a .cql file (empty if missing or empty)."""
+        query = self.get(name)
+        return query.statements if query else ()
+
+    def names(self) -> List[str]:
+        """Return the names of the loaded .cql files."""
+        with self._lock:
+            self._refresh()
+            return sorted(self._queries)
+
+
+_registries: Dict[Path, CypherRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_cypher_registry(directory: Optional[Path] = None) -> CypherRegistry:
+    """
+    Return the shared, loaded registry for a directory (conf/cypher by default).
+
+    The first call for a directory parses and validates all of its files.
+
+    Raises:
+        ValueError: If a .cql file fails validation
+    """
+    directory = (directory or CYPHER_DIR).resolve()
+    with _registries_lock:
+        registry = _registries.get(directory)
+        if registry is None:
+            registry = CypherRegistry(directory).load()
+            _registries[directory] = registry
+        return registry
@@ -21,9 +21,13 @@ from .connectors import (
     ConnectorConfig,
     ConnectorFactory,
     DataMapResolver,
+    FetchCache,
+    REMOTE_DECOMPRESS_COMMANDS,
     SettingsLoader,
+    SFTPConnector,
 )
-from .processors import DataProcessor, ProcessResult
+from .cypher_registry import CypherRegistry, get_cypher_registry
+from .processors import ColumnProjection, DataProcessor, ProcessResult
 from .neo4j_loader import Neo4jLoader, LoadResult, create_loader_from_settings
 
 logger = logging.getLogger(__name__)
@@ -78,6 +82,7 @@ class ImportPipeline:
         column_map_resolver: Optional[ColumnMapResolver] = None,
         settings_loader: Optional[SettingsLoader] = None,
         status_store: Optional[MutableMapping[str, WorkflowState]] = None,
+        cypher_registry: Optional[CypherRegistry] = None,
     ):
         """
         Initialize the import pipeline.
@@ -87,11 +92,14 @@ class ImportPipeline:
             column_map_resolver: Resolver for column mapping configuration
             settings_loader: Loader for application settings
             status_store: Optional store for workflow states
+            cypher_registry: Parsed .cql files (loaded and validated now if omitted,
+                so malformed queries fail at startup rather than mid-load)
         """
         self.data_map_resolver = data_map_resolver or DataMapResolver()
         self.column_map_resolver = column_map_resolver or ColumnMapResolver()
         self.settings_loader = settings_loader or SettingsLoader()
         self.status_store: MutableMapping[str, WorkflowState] = status_store or {}
+        self.cypher_registry = cypher_registry or get_cypher_registry()
 
     def run(
         self,
@@ -140,7 +148,10 @@ class ImportPipeline:
                 )
 
             column_config = self.column_map_resolver.resolve(request.domain_name)
-            if not column_config:
+            projection = None
+            if column_config:
+                projection = self.column_map_resolver.get_projection(request.domain_name)
+            else:
                 # Use defaults if no specific config
                 column_config = self.column_map_resolver.get_defaults()
                 logger.warning(f"Using default column config for {request.domain_name}")
@@ -159,24 +170,33 @@ class ImportPipeline:
                 logger.info("Skipping fetch step")
                 source_path = self._get_source_path(data_config, cob_date)
             else:
-                source_path = self._fetch_file(request, data_config, settings, state)
+                source_path = self._fetch_file(
+                    request, data_config, settings, state, column_config, projection
+                )
                 if not source_path:
                     raise RuntimeError("Failed to fetch source file")
+                if state.metrics.get("remote_projection"):
+                    # The fetched file already holds the cut output
+                    skip_cut = True
 
             state.steps_completed.append("fetch")
-            state.files_created.append(str(source_path))
+            if state.metrics.get("fetch_method") != "in_place":
+                state.files_created.append(str(source_path))
 
             # Step 2 & 3: Cut columns and split
             state.status = WorkflowStatus.CUTTING
             state.current_step = "process"
             self._update_state(state)
 
-            processor = DataProcessor(column_config, dropbox_dir=dropbox_dir)
+            processor = DataProcessor(
+                column_config, dropbox_dir=dropbox_dir, projection=projection
+            )
             process_results = processor.process_file(
                 source_path,
                 cob_date,
                 skip_cut=skip_cut,
-                skip_split=skip_split
+                skip_split=skip_split,
+                progress_callback=self._cut_progress_callback(state)
             )
 
             # Check cut result
@@ -186,6 +206,7 @@ class ImportPipeline:
 
             if cut_result and cut_result.output_path:
                 state.files_created.append(str(cut_result.output_path))
+            if cut_result and not skip_cut:
                 state.metrics["rows_after_cut"] = cut_result.rows_processed
 
             state.steps_completed.append("cut")
@@ -204,6 +225,10 @@ class ImportPipeline:
                 split_files = split_result.output_paths
                 state.files_created.extend([str(p) for p in split_files])
                 state.metrics["split_files_count"] = len(split_files)
+                state.metrics["rows_after_split"] = split_result.rows_processed
+                if split_result.manifest_path:
+                    # Read by the loader to learn each file's GFCIDs without rescanning
+                    state.files_created.append(str(split_result.manifest_path))
 
             state.steps_completed.append("split")
 
@@ -216,7 +241,8 @@ class ImportPipeline:
                 logger.info("Skipping Neo4j load step")
             else:
                 load_result = self._load_to_neo4j(
-                    split_files, settings, state, dropbox_dir, cob_date=cob_date
+                    split_files, settings, state, dropbox_dir, cob_date=cob_date,
+                    column_types=projection.typed_columns if projection else None
                 )
                 if not load_result.success:
                     logger.warning(f"Neo4j load had failures: {load_result.error}")
@@ -267,9 +293,16 @@ class ImportPipeline:
         request: ImportRequest,
         data_config: Dict[str, Any],
         settings: Dict[str, Any],
-        state: WorkflowState
+        state: WorkflowState,
+        column_config: Optional[Dict[str, Any]] = None,
+        projection: Optional[ColumnProjection] = None
     ) -> Optional[Path]:
-        """Fetch the source file using the appropriate connector."""
+        """Fetch the source file using the appropriate connector.
+
+        With the ``remote_projection`` connector param on an SFTP source, only the
+        projected columns are fetched (cut on the source host) and
+        ``state.metrics["remote_projection"]`` is set so the local cut is skipped.
+        """
         try:
             connector_type = data_config.get("connector_type", "linux")
             connector_params = data_config.get("connector_params", {})
@@ -290,13 +323,64 @@ class ImportPipeline:
             # Destination is in the dropbox directory
             dropbox_dir = settings.get("DROPBOX_DIR", "/mnt/nas")
             dest_filename = Path(source_path).name
+
+            remote_projection = self._remote_projection_options(
+                connector, connector_params, column_config, projection
+            )
+            if remote_projection:
+                # The projected fetch is plain CSV even from a compressed source;
+                # a .gz name would make the split try to decompress it
+                dest_name = Path(dest_filename)
+                if dest_name.suffix.lower() in REMOTE_DECOMPRESS_COMMANDS:
+                    dest_name = dest_name.with_suffix("")
+                dest_filename = dest_name.with_suffix(".csv").name
             dest_path = Path(dropbox_dir) / dest_filename
 
-            logger.info(f"Fetching {source_path} to {dest_path}")
-            result = connector.fetch(source_path, dest_path)
+            # Skip or resume the transfer when the source is unchanged since the last fetch
+            variant = remote_projection["variant"] if remote_projection else None
+            cache = FetchCache(dest_path, variant=variant)
+            source_stat = None
+            use_cache = connector_params.get("fetch_cache", True)
+            if use_cache and connector_params.get("fetch_mode") != "in_place":
+                source_stat = connector.stat(source_path)
+
+            if source_stat and cache.is_current(source_path, source_stat):
+                logger.info(f"Source {source_path} unchanged, reusing {dest_path}")
+                state.metrics["bytes_fetched"] = 0
+                state.metrics["fetch_method"] = "cached"
+                state.metrics["remote_projection"] = bool(remote_projection)
+                return dest_path
+
+            resume_offset = cache.resume_offset(source_path, source_stat) if source_stat else 0
+            if source_stat:
+                cache.mark_started(source_path, source_stat)
+
+            if remote_projection:
+                logger.info(f"Fetching projected columns of {source_path} to {dest_path}")
+                result = connector.fetch_projected(
+                    source_path,
+                    dest_path,
+                    projection,
+                    delimiter=remote_projection["delimiter"],
+                    output_delimiter=remote_projection["output_delimiter"],
+                    header=remote_projection["header"],
+                    compress=remote_projection["compress"]
+                )
+            elif resume_offset:
+                logger.info(f"Resuming fetch of {source_path} at byte {resume_offset}")
+                result = connector.fetch_from(source_path, dest_path, resume_offset)
+            else:
+                logger.info(f"Fetching {source_path} to {dest_path}")
+                result = connector.fetch(source_path, dest_path)
 
             if result.success:
+                if source_stat and result.method != "in_place":
+                    cache.mark_complete(source_path, source_stat)
                 state.metrics["bytes_fetched"] = result.bytes_transferred
+                state.metrics["fetch_method"] = result.method
+                state.metrics["remote_projection"] = bool(remote_projection)
+                if result.elapsed_seconds:
+                    state.metrics["fetch_bytes_per_second"] = round(result.bytes_per_second)
                 return result.local_path
             else:
                 logger.error(f"Fetch failed: {result.error}")
@@ -306,17 +390,54 @@ class ImportPipeline:
             logger.error(f"Error in fetch step: {e}")
             return None
 
+    def _remote_projection_options(
+        self,
+        connector: Any,
+        connector_params: Dict[str, Any],
+        column_config: Optional[Dict[str, Any]],
+        projection: Optional[ColumnProjection]
+    ) -> Optional[Dict[str, Any]]:
+        """Return remote projection settings, or None if the source is fetched whole."""
+        if not connector_params.get("remote_projection"):
+            return None
+        if not isinstance(connector, SFTPConnector) or projection is None or not column_config:
+            logger.warning("remote_projection needs an SFTP source and a column projection; fetching whole file")
+            return None
+        if column_config.get("intermediate_format", "csv") != "csv":
+            logger.warning("remote_projection produces CSV; fetching whole file for the Parquet cut")
+            return None
+
+        delimiter = column_config.get("delimiter", "\x01")
+        output_delimiter = column_config.get("output_delimiter", ",")
+        if len(delimiter) != 1 or len(output_delimiter) != 1:
+            logger.warning("remote_projection needs single-character delimiters; fetching whole file")
+            return None
+
+        header = None
+        if not column_config.get("has_header", False):
+            header_line = projection.header(output_delimiter)
+            header = header_line.encode("utf-8") if header_line else None
+        compress = bool(connector_params.get("remote_projection_compress", False))
+        return {
+            "delimiter": delimiter,
+            "output_delimiter": output_delimiter,
+            "header": header,
+            "compress": compress,
+            "variant": f"projection:{projection.cut_fields}:{ord(output_delimiter)}",
+        }
+
     def _load_to_neo4j(
         self,
         file_paths: List[Path],
         settings: Dict[str, Any],
         state: WorkflowState,
         dropbox_dir: str = "/mnt/nas",
-        cob_date: Optional[str] = None
+        cob_date: Optional[str] = None,
+        column_types: Optional[Dict[str, str]] = None
     ) -> LoadResult:
         """Load files to Neo4j and run post-processing (aggregation & relationships)."""
         try:
-            loader = create_loader_from_settings(settings)
+            loader = create_loader_from_settings(settings, cypher_registry=self.cypher_registry)
             if not loader:
                 return LoadResult(
                     success=False,
@@ -328,9 +449,11 @@ class ImportPipeline:
                 base_path = dropbox_dir.rstrip("/") + "/"
                 result = loader.load_files(
                     file_paths,
+                    parallel=loader.load_workers > 1,
                     base_path=base_path,
                     run_post_processing=True,
-                    cob_date=cob_date
+                    cob_date=cob_date,
+                    column_types=column_types
                 )
                 return result
             finally:
@@ -340,6 +463,17 @@ class ImportPipeline:
             logger.error(f"Neo4j load error: {e}")
             return LoadResult(success=False, error=str(e))
 
+    def _cut_progress_callback(self, state: WorkflowState):
+        """Build a callback that records live cut progress in the workflow metrics."""
+        def _report(bytes_read: int, total_bytes: int) -> None:
+            state.metrics["cut_bytes_read"] = bytes_read
+            state.metrics["cut_bytes_total"] = total_bytes
+            state.metrics["cut_progress_pct"] = (
+                round(100.0 * bytes_read / total_bytes, 1) if total_bytes else 100.0
+            )
+
+        return _report
+
     def _update_state(self, state: WorkflowState) -> None:
         """Update the state in the store."""
         self.status_store[state.workflow_id] = state
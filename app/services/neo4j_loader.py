@@ -2,19 +2,23 @@
 from __future__ import annotations
 
 import csv
+import gzip
+import heapq
 import logging
-import multiprocessing
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
 
 from neo4j import Driver, GraphDatabase
+from neo4j.exceptions import TransientError
 
-logger = logging.getLogger(__name__)
+from .cypher_registry import CYPHER_DIR, CypherRegistry, get_cypher_registry
+from .processors import SplitManifest
 
-# Project paths
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-CYPHER_DIR = PROJECT_ROOT / "conf" / "cypher"
+logger = logging.getLogger(__name__)
 
 # Cypher query file mapping
 CYPHER_FILES = {
@@ -23,9 +27,48 @@ CYPHER_FILES = {
     "gfcid": "cypher_03_summary_gfcid.cql",
     "nettingid": "cypher_04_summary_nettingid.cql",
     "relationships": "cypher_05_create_relationships.cql",
+    "transactions_unwind": "cypher_00_unwind_transactions.cql",
+}
+
+# Concurrent file loads (sessions on the shared driver)
+DEFAULT_LOAD_WORKERS = 4
+
+# Retries of a query that failed with a transient error (deadlock, lock timeout)
+DEFAULT_LOAD_MAX_RETRIES = 5
+
+# Base delay before the first retry; doubled on each further attempt
+DEFAULT_LOAD_RETRY_BACKOFF_SECONDS = 0.5
+
+# How transaction rows reach Neo4j: server-side LOAD CSV of the split files, or
+# driver-side batches sent as query parameters (no shared filesystem needed)
+LOAD_MODE_LOAD_CSV = "load_csv"
+LOAD_MODE_UNWIND = "unwind"
+LOAD_MODES = (LOAD_MODE_LOAD_CSV, LOAD_MODE_UNWIND)
+
+# Rows per UNWIND batch (one transaction each)
+DEFAULT_UNWIND_BATCH_SIZE = 5000
+
+# GFCIDs per Summary_GFCID UNWIND statement
+SUMMARY_NODE_BATCH_SIZE = 10000
+
+# Split manifests (<output_prefix>manifest.json) next to the split files
+SPLIT_MANIFEST_GLOB = "*manifest.json"
+
+# Python conversions for typed columns (see column_types in column_map.yaml);
+# other declared types are sent as strings
+_PYTHON_TYPES = {
+    "float64": float,
+    "int64": int,
 }
 
 
+def _open_csv(file_path: Path):
+    """Open a split file (optionally gzip-compressed) for csv reading."""
+    if file_path.suffix == ".gz":
+        return gzip.open(file_path, "rt", newline="", encoding="utf-8")
+    return file_path.open("r", newline="", encoding="utf-8")
+
+
 @dataclass
 class LoadResult:
     """Result of a Neo4j load operation."""
@@ -78,7 +121,14 @@ class Neo4jLoader:
         user: str,
         password: str,
         database: str,
-        query_template: Optional[str] = None
+        query_template: Optional[str] = None,
+        load_workers: int = DEFAULT_LOAD_WORKERS,
+        max_retries: int = DEFAULT_LOAD_MAX_RETRIES,
+        retry_backoff_seconds: float = DEFAULT_LOAD_RETRY_BACKOFF_SECONDS,
+        load_mode: str = LOAD_MODE_LOAD_CSV,
+        unwind_batch_size: int = DEFAULT_UNWIND_BATCH_SIZE,
+        driver: Optional[Driver] = None,
+        cypher_registry: Optional[CypherRegistry] = None
     ):
         """
         Initialize the Neo4j loader.
@@ -89,22 +139,41 @@ class Neo4jLoader:
             password: Database password
             database: Database name
             query_template: Custom Cypher query template (optional)
+            load_workers: Number of files loaded concurrently by load_files(parallel=True)
+            max_retries: Retries of a query that fails with a transient error
+            retry_backoff_seconds: Base delay before retrying (doubled per attempt)
+            load_mode: ``load_csv`` (server reads the files) or ``unwind`` (loader sends rows)
+            unwind_batch_size: Rows per UNWIND batch (a file's batches commit one at
+                a time; unwind loads run in parallel only across files)
+            driver: Existing driver to use instead of connecting (e.g. a stub)
+            cypher_registry: Parsed .cql files (the shared conf/cypher registry by default)
         """
+        if load_mode not in LOAD_MODES:
+            raise ValueError(
+                f"Unknown load_mode '{load_mode}', expected one of: {', '.join(LOAD_MODES)}"
+            )
         self.uri = uri
         self.user = user
         self.password = password
         self.database = database
         self.query_template = query_template or self.DEFAULT_QUERY_TEMPLATE
-        self.driver: Optional[Driver] = None
+        self.load_workers = max(1, load_workers)
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.load_mode = load_mode
+        self.unwind_batch_size = max(1, unwind_batch_size)
+        self.driver: Optional[Driver] = driver
+        self.cypher_registry = cypher_registry or get_cypher_registry()
 
     def connect(self) -> bool:
         """Establish connection to Neo4j."""
         try:
-            self.driver = GraphDatabase.driver(
-                self.uri,
-                auth=(self.user, self.password),
-                database=self.database
-            )
+            if self.driver is None:
+                self.driver = GraphDatabase.driver(
+                    self.uri,
+                    auth=(self.user, self.password),
+                    database=self.database
+                )
             self.driver.verify_connectivity()
             logger.info("Successfully connected to Neo4j database")
             return True
@@ -118,6 +187,39 @@ class Neo4jLoader:
             self.driver.close()
             logger.info("Neo4j connection closed")
 
+    def _run_with_retry(self, query: str, description: str, **parameters: Any) -> Any:
+        """
+        Run a query in its own session, retrying transient failures with backoff.
+
+        Concurrent loads that MERGE the same nodes can deadlock or time out on
+        locks; Neo4j reports these as TransientError and the query can simply be
+        run again (MERGE makes the re-run idempotent).
+
+        Args:
+            query: Cypher query
+            description: What is being run, for log messages
+            **parameters: Query parameters
+
+        Returns:
+            Result summary of the successful run
+        """
+        attempt = 0
+        while True:
+            try:
+                with self.driver.session(database=self.database) as session:
+                    return session.run(query, **parameters).consume()
+            except TransientError as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.retry_backoff_seconds * (2 ** attempt)
+                delay += random.uniform(0, delay)
+                attempt += 1
+                logger.warning(
+                    f"Transient error on {description} (attempt {attempt}/{self.max_retries}), "
+                    f"retrying in {delay:.1f}s: {e}"
+                )
+                time.sleep(delay)
+
     def ensure_constraints(self) -> bool:
         """Create necessary constraints and indexes for all node types."""
         try:
@@ -183,24 +285,26 @@ class Neo4jLoader:
 
         Returns:
             Number of nodes created/ensured
+
+        Raises:
+            Exception: The error of a batch that failed after retries. Loads
+                MATCH these nodes, so rows of a missing node would be dropped
+                silently; callers must not load the files.
         """
         gfcid_list = list({gid for gid in gfcids if gid})
         if not gfcid_list:
             logger.info("No GFCIDs provided for Summary_GFCID creation")
             return 0
 
-        try:
-            with self.driver.session(database=self.database) as session:
-                query = """
-                UNWIND $gfcids AS gfcid
-                MERGE (n:Summary_GFCID {gfcid: gfcid})
-                """
-                session.run(query, gfcids=gfcid_list)
-                logger.info(f"Ensured {len(gfcid_list)} Summary_GFCID nodes exist")
-                return len(gfcid_list)
-        except Exception as e:
-            logger.error(f"Failed to create Summary_GFCID nodes: {e}")
-            return 0
+        query = """
+        UNWIND $gfcids AS gfcid
+        MERGE (n:Summary_GFCID {gfcid: gfcid})
+        """
+        for start in range(0, len(gfcid_list), SUMMARY_NODE_BATCH_SIZE):
+            batch = gfcid_list[start:start + SUMMARY_NODE_BATCH_SIZE]
+            self._run_with_retry(query, "Summary_GFCID creation", gfcids=batch)
+        logger.info(f"Ensured {len(gfcid_list)} Summary_GFCID nodes exist")
+        return len(gfcid_list)
 
     def collect_gfcids_from_file(self, file_path: Path) -> Set[str]:
         """
@@ -214,7 +318,7 @@ class Neo4jLoader:
         """
         gfcids: Set[str] = set()
         try:
-            with file_path.open("r", newline="", encoding="utf-8") as f:
+            with _open_csv(file_path) as f:
                 reader = csv.DictReader(f)
                 if not reader.fieldnames or "gfcid" not in reader.fieldnames:
                     logger.warning(f"File {file_path} does not contain 'gfcid' column")
@@ -234,6 +338,12 @@ class Neo4jLoader:
     # Default base path for Neo4j LOAD CSV
     DEFAULT_BASE_PATH = "/mnt/nas/"
 
+    def _registry(self, cypher_dir: Optional[Path] = None) -> CypherRegistry:
+        """Return the query registry for a .cql directory (this loader's by default)."""
+        if cypher_dir is None or cypher_dir.resolve() == self.cypher_registry.directory.resolve():
+            return self.cypher_registry
+        return get_cypher_registry(cypher_dir)
+
     def _get_transaction_query_template(self, cypher_dir: Optional[Path] = None) -> str:
         """
         Get the transaction query template from .cql file.
@@ -246,49 +356,149 @@ class Neo4jLoader:
         Returns:
             Query template string with {file_name} placeholder
         """
-        if cypher_dir is None:
-            cypher_dir = CYPHER_DIR
-
         cql_filename = CYPHER_FILES.get("transactions")
         if not cql_filename:
             logger.warning("No .cql file configured for transactions, using default template")
             return self.DEFAULT_QUERY_TEMPLATE
 
-        cql_path = cypher_dir / cql_filename
+        query = self._registry(cypher_dir).get(cql_filename)
+        if query is None:
+            logger.warning(f"Transaction cypher file not found: {cql_filename}, using default template")
+            return self.DEFAULT_QUERY_TEMPLATE
 
-        if not cql_path.exists():
-            logger.warning(f"Transaction cypher file not found: {cql_path}, using default template")
+        if not query.statements:
+            logger.warning(f"Empty query in file: {query.path}, using default template")
             return self.DEFAULT_QUERY_TEMPLATE
 
-        try:
-            query = cql_path.read_text(encoding="utf-8")
+        return query.text
+
+    def _get_unwind_query(self, cypher_dir: Optional[Path] = None) -> str:
+        """
+        Get the UNWIND transaction query from its .cql file.
 
-            # Remove comments for cleaner execution
-            lines = []
-            for line in query.split("\n"):
-                stripped = line.strip()
-                if stripped and not stripped.startswith("//"):
-                    lines.append(line)
-            clean_query = "\n".join(lines)
+        Args:
+            cypher_dir: Directory containing .cql files (defaults to conf/cypher/)
 
-            if not clean_query.strip():
-                logger.warning(f"Empty query in file: {cql_path}, using default template")
-                return self.DEFAULT_QUERY_TEMPLATE
+        Returns:
+            Query taking a ``$rows`` list parameter
+        """
+        cql_filename = CYPHER_FILES["transactions_unwind"]
+        query = self._registry(cypher_dir).get(cql_filename)
+        if query is None:
+            raise FileNotFoundError(f"Cypher file not found: {cql_filename}")
+        return query.text
 
-            logger.debug(f"Loaded transaction query from: {cql_path}")
-            return clean_query
+    def _read_row_batches(
+        self,
+        file_path: Path,
+        column_types: Optional[Mapping[str, str]] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Read a split file as batches of row maps for an UNWIND query.
 
-        except Exception as e:
-            logger.error(f"Failed to read transaction query file: {e}, using default template")
-            return self.DEFAULT_QUERY_TEMPLATE
+        Empty fields become None, as LOAD CSV reads them as null. Numeric typed
+        columns are converted to Python numbers; values that do not convert
+        are sent as None.
+
+        Args:
+            file_path: Path to the CSV file
+            column_types: Declared type of each non-string column, by name
 
-    def load_file(self, file_path: Path, base_path: Optional[str] = None) -> LoadResult:
+        Yields:
+            Lists of at most ``unwind_batch_size`` rows
+        """
+        converters = {
+            name: _PYTHON_TYPES[column_type]
+            for name, column_type in (column_types or {}).items()
+            if column_type in _PYTHON_TYPES
+        }
+        batch: List[Dict[str, Any]] = []
+        with _open_csv(file_path) as f:
+            for row in csv.DictReader(f):
+                record: Dict[str, Any] = {}
+                for name, value in row.items():
+                    if not value:
+                        record[name] = None
+                        continue
+                    convert = converters.get(name)
+                    if convert is None:
+                        record[name] = value
+                        continue
+                    try:
+                        record[name] = convert(value)
+                    except ValueError:
+                        record[name] = None
+                batch.append(record)
+                if len(batch) >= self.unwind_batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    def _load_unwind(
+        self,
+        file_path: Path,
+        column_types: Optional[Mapping[str, str]] = None
+    ) -> Tuple[int, int]:
+        """
+        Send a split file to Neo4j as UNWIND batches over the driver.
+
+        Each batch runs in its own session and transaction. Batches are
+        committed one at a time, in file order: rows of one file share
+        Summary_GFCID nodes, so concurrent batches would contend for (and
+        deadlock on) the same locks. The next batch is read and converted
+        while the previous one commits. Parallelism in unwind mode therefore
+        comes only from loading several files at once (``load_workers``, with
+        files that share a GFCID kept apart by ``_load_parallel``).
+
+        Returns:
+            Tuple of (nodes created, relationships created)
+        """
+        query = self._get_unwind_query()
+        nodes_created = 0
+        relationships_created = 0
+        committing: Optional[Future] = None
+
+        def collect(future: Future) -> None:
+            nonlocal nodes_created, relationships_created
+            summary = future.result()
+            nodes_created += summary.counters.nodes_created
+            relationships_created += summary.counters.relationships_created
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="neo4j-unwind") as executor:
+            try:
+                for number, batch in enumerate(self._read_row_batches(file_path, column_types)):
+                    if committing is not None:
+                        collect(committing)
+                    committing = executor.submit(
+                        self._run_with_retry, query, f"{file_path.name} batch {number + 1}", rows=batch
+                    )
+                if committing is not None:
+                    collect(committing)
+            finally:
+                if committing is not None:
+                    committing.cancel()
+
+        return nodes_created, relationships_created
+
+    def load_file(
+        self,
+        file_path: Path,
+        base_path: Optional[str] = None,
+        gfcids: Optional[Iterable[str]] = None,
+        column_types: Optional[Mapping[str, str]] = None,
+        ensure_summary: bool = True
+    ) -> LoadResult:
         """
         Load a single CSV file into Neo4j.
 
         Args:
             file_path: Path to the CSV file
             base_path: Base path to strip from file path for Neo4j LOAD CSV
+            gfcids: GFCIDs in the file, if already known (collected from the file otherwise)
+            column_types: Declared type of each non-string column (unwind mode only)
+            ensure_summary: Create the file's Summary_GFCID nodes first (False when
+                the caller has already created them)
 
         Returns:
             LoadResult with status
@@ -299,40 +509,45 @@ class Neo4jLoader:
                 base_path = self.DEFAULT_BASE_PATH
 
             # Collect GFCIDs and ensure Summary nodes exist
-            gfcids = self.collect_gfcids_from_file(file_path)
-            self.ensure_summary_nodes(gfcids)
+            if ensure_summary:
+                if gfcids is None:
+                    gfcids = self.collect_gfcids_from_file(file_path)
+                self.ensure_summary_nodes(gfcids)
 
-            # Prepare file path for Neo4j LOAD CSV
-            # Use full absolute path for local Neo4j server
-            full_path = str(file_path).replace(" ", "%20")
-
-            # Get query template: use custom template if provided, otherwise load from .cql file
-            if self.query_template != self.DEFAULT_QUERY_TEMPLATE:
-                # User provided a custom template
-                query_template = self.query_template
+            if self.load_mode == LOAD_MODE_UNWIND:
+                nodes_created, relationships_created = self._load_unwind(file_path, column_types)
             else:
-                # Load from .cql file
-                query_template = self._get_transaction_query_template()
+                # Prepare file path for Neo4j LOAD CSV
+                # Use full absolute path for local Neo4j server
+                full_path = str(file_path).replace(" ", "%20")
+
+                # Get query template: use custom template if provided, otherwise load from .cql file
+                if self.query_template != self.DEFAULT_QUERY_TEMPLATE:
+                    # User provided a custom template
+                    query_template = self.query_template
+                else:
+                    # Load from .cql file
+                    query_template = self._get_transaction_query_template()
 
-            # Execute the query
-            query = query_template.format(file_name=full_path)
+                # Execute the query
+                query = query_template.format(file_name=full_path)
 
-            with self.driver.session(database=self.database) as session:
-                result = session.run(query)
-                summary = result.consume()
+                summary = self._run_with_retry(query, file_path.name)
+                nodes_created = summary.counters.nodes_created
+                relationships_created = summary.counters.relationships_created
 
-                logger.info(
-                    f"Loaded {file_path.name}: "
-                    f"nodes={summary.counters.nodes_created}, "
-                    f"relationships={summary.counters.relationships_created}"
-                )
+            logger.info(
+                f"Loaded {file_path.name}: "
+                f"nodes={nodes_created}, "
+                f"relationships={relationships_created}"
+            )
 
-                return LoadResult(
-                    success=True,
-                    files_loaded=1,
-                    nodes_created=summary.counters.nodes_created,
-                    relationships_created=summary.counters.relationships_created
-                )
+            return LoadResult(
+                success=True,
+                files_loaded=1,
+                nodes_created=nodes_created,
+                relationships_created=relationships_created
+            )
 
         except Exception as e:
             logger.error(f"Failed to load {file_path}: {e}")
@@ -346,21 +561,31 @@ class Neo4jLoader:
         self,
         file_paths: List[Path],
         parallel: bool = False,
-        max_workers: int = 4,
+        max_workers: Optional[int] = None,
         base_path: Optional[str] = None,
         run_post_processing: bool = False,
-        cob_date: Optional[str] = None
+        cob_date: Optional[str] = None,
+        column_types: Optional[Mapping[str, str]] = None
     ) -> LoadResult:
         """
         Load multiple CSV files into Neo4j.
 
+        The Summary_GFCID nodes of all files are created up front in one batched
+        UNWIND; if that fails, no file is loaded and every file is reported as
+        failed. Parallel loads never run two files that share a GFCID at the
+        same time, since both would MERGE relationships to the same
+        Summary_GFCID node and contend for its lock. The GFCIDs of each file
+        are taken from the split manifest in its directory when there is one
+        (split by gfcid and not older than the file); other files are scanned.
+
         Args:
             file_paths: List of file paths to load
             parallel: Whether to load files in parallel
-            max_workers: Maximum number of parallel workers
+            max_workers: Maximum number of parallel workers (defaults to load_workers)
             base_path: Base path to strip from file paths
             run_post_processing: Whether to run aggregation and create relationships after loading
             cob_date: COB date for filtering post-processing (format: YYYY-MM-DD)
+            column_types: Declared type of each non-string column (unwind mode only)
 
         Returns:
             LoadResult with aggregated status
@@ -371,13 +596,27 @@ class Neo4jLoader:
         # Ensure constraints exist
         self.ensure_constraints()
 
+        # Create every file's Summary_GFCID nodes at once instead of per file
+        keys_by_index = self._gfcids_by_file(file_paths)
+        try:
+            self.ensure_summary_nodes(set().union(*keys_by_index))
+        except Exception as e:
+            logger.error(f"Failed to create Summary_GFCID nodes, no files loaded: {e}")
+            return LoadResult(
+                success=False,
+                error=f"Summary_GFCID creation failed: {e}",
+                failed_files=[str(file_path) for file_path in file_paths]
+            )
+
         total_nodes = 0
         total_relationships = 0
         failed_files = []
 
         if parallel and len(file_paths) > 1:
-            # Use multiprocessing for parallel loading
-            results = self._load_parallel(file_paths, max_workers, base_path)
+            # Load on a bounded pool of sessions sharing this loader's driver
+            results = self._load_parallel(
+                file_paths, max_workers or self.load_workers, base_path, keys_by_index, column_types
+            )
             for result in results:
                 if result.success:
                     total_nodes += result.nodes_created
@@ -387,7 +626,9 @@ class Neo4jLoader:
         else:
             # Sequential loading
             for file_path in file_paths:
-                result = self.load_file(file_path, base_path)
+                result = self.load_file(
+                    file_path, base_path, column_types=column_types, ensure_summary=False
+                )
                 if result.success:
                     total_nodes += result.nodes_created
                     total_relationships += result.relationships_created
@@ -410,25 +651,121 @@ class Neo4jLoader:
             error=f"{len(failed_files)} files failed" if failed_files else None
         )
 
+    def _manifest_gfcids(self, file_paths: List[Path]) -> Dict[Path, List[str]]:
+        """
+        Read the GFCIDs of split files from the split manifests in their directories.
+
+        Only manifests of splits by ``gfcid`` are used, and only for files not
+        modified after the manifest was written.
+
+        Args:
+            file_paths: Split files to look up
+
+        Returns:
+            GFCIDs of each file found in a manifest, by path
+        """
+        wanted = set(file_paths)
+        file_keys: Dict[Path, List[str]] = {}
+        for directory in {file_path.parent for file_path in file_paths}:
+            for manifest_path in sorted(directory.glob(SPLIT_MANIFEST_GLOB)):
+                try:
+                    manifest = SplitManifest.load(manifest_path)
+                    written = manifest_path.stat().st_mtime
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable split manifest {manifest_path}: {e}")
+                    continue
+                if manifest.key_column != "gfcid":
+                    continue
+                for file_path, keys in manifest.keys_by_path(directory).items():
+                    if file_path in wanted and file_path.stat().st_mtime <= written:
+                        file_keys[file_path] = keys
+        return file_keys
+
+    def _gfcids_by_file(self, file_paths: List[Path]) -> List[Set[str]]:
+        """Return the GFCIDs of each file, scanning files missing from the split manifests."""
+        file_keys = self._manifest_gfcids(file_paths)
+        logger.info(
+            f"GFCIDs of {len(file_keys)}/{len(file_paths)} files read from split manifests"
+        )
+        keys_by_index: List[Set[str]] = []
+        for file_path in file_paths:
+            keys = file_keys.get(file_path)
+            if keys is None:
+                keys = self.collect_gfcids_from_file(file_path)
+            keys_by_index.append({key for key in keys if key})
+        return keys_by_index
+
     def _load_parallel(
         self,
         file_paths: List[Path],
         max_workers: int,
-        base_path: str
+        base_path: Optional[str],
+        keys_by_index: List[Set[str]],
+        column_types: Optional[Mapping[str, str]] = None
     ) -> List[LoadResult]:
-        """Load files in parallel using multiprocessing."""
-        # Note: Each worker needs its own connection
-        # For simplicity, we'll use sequential loading within this implementation
-        # A full parallel implementation would use a worker function
-        results = []
-        for file_path in file_paths:
-            result = self.load_file(file_path, base_path)
-            results.append(result)
+        """
+        Load files concurrently, one session per file on the shared driver.
+
+        The driver is thread-safe and pools its connections; each load_file call
+        opens its own session, so worker threads never share one. A file starts
+        only when none of its GFCIDs belongs to a file still loading; files held
+        back this way are started as soon as their keys are released, ahead of
+        files queued after them. A held-back file is filed under one GFCID it
+        waits for and looked at again only when that GFCID is released, and
+        scheduling stops as soon as every worker is busy, so each completion
+        costs time in the files it unblocks rather than in all pending files.
+
+        Args:
+            file_paths: Files to load
+            max_workers: Maximum number of files loading at once
+            base_path: Base path to strip from file paths
+            keys_by_index: GFCIDs of each file, aligned with ``file_paths``
+            column_types: Declared type of each non-string column (unwind mode only)
+
+        Returns:
+            One LoadResult per file, in the order of ``file_paths``
+        """
+        workers = max(1, min(max_workers, len(file_paths)))
+        logger.info(f"Loading {len(file_paths)} files with {workers} parallel workers")
+        results: List[Optional[LoadResult]] = [None] * len(file_paths)
+        # Files that may be startable, smallest index first (a sorted list is a heap)
+        ready = list(range(len(file_paths)))
+        # Files held back, under one of the locked GFCIDs they are waiting for
+        blocked: Dict[str, List[int]] = {}
+        locked: Set[str] = set()
+        running: Dict[Future, int] = {}
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="neo4j-load") as executor:
+            while ready or running:
+                while ready and len(running) < workers:
+                    index = heapq.heappop(ready)
+                    keys = keys_by_index[index]
+                    held = next((key for key in keys if key in locked), None)
+                    if held is not None:
+                        blocked.setdefault(held, []).append(index)
+                        continue
+                    locked.update(keys)
+                    future = executor.submit(
+                        self.load_file, file_paths[index], base_path,
+                        column_types=column_types, ensure_summary=False
+                    )
+                    running[future] = index
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    for key in keys_by_index[index]:
+                        locked.discard(key)
+                        # Only files waiting on a released key are checked again
+                        for waiter in blocked.pop(key, ()):
+                            heapq.heappush(ready, waiter)
+                    results[index] = future.result()
+
         return results
 
     def run_cypher_file(self, file_path: Path) -> bool:
         """
-        Execute a Cypher query from an external .cql file.
+        Execute the Cypher statements of a .cql file (from the query registry).
 
         Args:
             file_path: Path to the .cql file
@@ -437,33 +774,29 @@ class Neo4jLoader:
             True if successful, False otherwise
         """
         try:
-            if not file_path.exists():
+            query = self._registry(file_path.parent).get(file_path.name)
+            if query is None:
                 logger.error(f"Cypher file not found: {file_path}")
                 return False
 
-            query = file_path.read_text(encoding="utf-8")
-
-            # Remove comments and empty lines for cleaner execution
-            lines = []
-            for line in query.split("\n"):
-                stripped = line.strip()
-                if stripped and not stripped.startswith("//"):
-                    lines.append(line)
-            clean_query = "\n".join(lines)
-
-            if not clean_query.strip():
+            if not query.statements:
                 logger.warning(f"Empty query in file: {file_path}")
                 return True
 
+            # Multi-statement files run statement by statement, in order
+            nodes_created = 0
+            relationships_created = 0
             with self.driver.session(database=self.database) as session:
-                result = session.run(clean_query)
-                summary = result.consume()
-                logger.info(
-                    f"Executed {file_path.name}: "
-                    f"nodes_created={summary.counters.nodes_created}, "
-                    f"relationships_created={summary.counters.relationships_created}"
-                )
-                return True
+                for statement in query.statements:
+                    summary = session.run(statement).consume()
+                    nodes_created += summary.counters.nodes_created
+                    relationships_created += summary.counters.relationships_created
+            logger.info(
+                f"Executed {file_path.name}: "
+                f"nodes_created={nodes_created}, "
+                f"relationships_created={relationships_created}"
+            )
+            return True
 
         except Exception as e:
             logger.error(f"Failed to execute {file_path}: {e}")
@@ -582,12 +915,16 @@ class Neo4jLoader:
         return results
 
 
-def create_loader_from_settings(settings: Dict[str, Any]) -> Optional[Neo4jLoader]:
+def create_loader_from_settings(
+    settings: Dict[str, Any],
+    cypher_registry: Optional[CypherRegistry] = None
+) -> Optional[Neo4jLoader]:
     """
     Create a Neo4jLoader from settings dictionary.
 
     Args:
         settings: Settings dictionary (from settings.yaml)
+        cypher_registry: Parsed .cql files (the shared conf/cypher registry by default)
 
     Returns:
         Neo4jLoader instance or None if configuration is missing
@@ -603,7 +940,20 @@ def create_loader_from_settings(settings: Dict[str, Any]) -> Optional[Neo4jLoade
         logger.error("Missing Neo4j configuration in settings")
         return None
 
-    loader = Neo4jLoader(uri, user, password, database)
+    loader = Neo4jLoader(
+        uri,
+        user,
+        password,
+        database,
+        load_workers=int(neo4j_config.get("LOAD_WORKERS", DEFAULT_LOAD_WORKERS)),
+        max_retries=int(neo4j_config.get("LOAD_MAX_RETRIES", DEFAULT_LOAD_MAX_RETRIES)),
+        retry_backoff_seconds=float(
+            neo4j_config.get("LOAD_RETRY_BACKOFF_SECONDS", DEFAULT_LOAD_RETRY_BACKOFF_SECONDS)
+        ),
+        load_mode=str(neo4j_config.get("LOAD_MODE", LOAD_MODE_LOAD_CSV)).lower(),
+        unwind_batch_size=int(neo4j_config.get("UNWIND_BATCH_SIZE", DEFAULT_UNWIND_BATCH_SIZE)),
+        cypher_registry=cypher_registry
+    )
     if loader.connect():
         return loader
     return None
@@ -1,13 +1,29 @@
 """Data processors for transforming and splitting files."""
 from __future__ import annotations
 
+import bz2
 import csv
+import datetime
+import gzip
+import heapq
+import io
+import json
 import logging
+import mmap
+import multiprocessing
 import os
 import subprocess
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import contextmanager
 from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 import shutil
 
@@ -18,11 +34,599 @@ except ImportError:
     HAS_PANDAS = False
     pd = None
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+    pa = None
+    pc = None
+    pa_csv = None
+    pq = None
+
+if HAS_PYARROW:
+    # Arrow type factories for column_types values
+    _ARROW_TYPES = {
+        "string": pa.string,
+        "float64": pa.float64,
+        "int64": pa.int64,
+        "date": pa.date32,
+    }
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+    HAS_LZ4 = True
+except ImportError:
+    HAS_LZ4 = False
+    lz4_frame = None
+
 # Check if 'cut' command is available (Unix/Linux/macOS)
 HAS_CUT = shutil.which("cut") is not None
 
 logger = logging.getLogger(__name__)
 
+# Files smaller than this are always cut by a single process
+DEFAULT_PARALLEL_CUT_MIN_BYTES = 64 * 1024 * 1024
+
+# Cut timeout is a base allowance plus time for the file at a minimum throughput
+DEFAULT_CUT_TIMEOUT_SECONDS = 600
+DEFAULT_CUT_MIN_BYTES_PER_SECOND = 10 * 1024 * 1024
+
+# Read size used when streaming data into and out of the cut pipeline
+COMMAND_CHUNK_SIZE = 1024 * 1024
+
+# Bytes a parallel cut worker projects between progress updates
+PARALLEL_PROGRESS_BLOCK_BYTES = 8 * 1024 * 1024
+
+# Seconds between progress callbacks while waiting on cut workers
+PROGRESS_INTERVAL_SECONDS = 0.5
+
+# Called with (bytes_read, total_bytes) as the source is consumed
+ProgressCallback = Callable[[int, int], None]
+
+# Split writer pool defaults
+DEFAULT_MAX_OPEN_FILES = 256
+DEFAULT_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Split partition buffering defaults
+DEFAULT_PARTITION_FLUSH_BYTES = 1024 * 1024
+DEFAULT_SPLIT_MEMORY_BUDGET_BYTES = 256 * 1024 * 1024
+
+# Split modes: one file per key value, a fixed number of hash shards, or
+# keys bin-packed into files of roughly a target size
+SPLIT_MODE_KEY = "key"
+SPLIT_MODE_HASH = "hash"
+SPLIT_MODE_BALANCED = "balanced"
+SPLIT_MODES = (SPLIT_MODE_KEY, SPLIT_MODE_HASH, SPLIT_MODE_BALANCED)
+DEFAULT_SHARD_COUNT = 64
+DEFAULT_TARGET_FILE_ROWS = 100000
+
+# Declarable column types (column_types in column_map.yaml); undeclared columns are strings
+COLUMN_TYPE_STRING = "string"
+COLUMN_TYPES = (COLUMN_TYPE_STRING, "float64", "int64", "date")
+TYPE_ERRORS_WARN = "warn"
+TYPE_ERRORS_FAIL = "fail"
+TYPE_ERRORS_MODES = (TYPE_ERRORS_WARN, TYPE_ERRORS_FAIL)
+
+# Leading magic bytes of the compressed source formats read transparently
+COMPRESSION_MAGIC = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+    (b"\x04\x22\x4d\x18", "lz4"),
+)
+
+# Compression for split output files (LOAD CSV reads gzip directly)
+SPLIT_OUTPUT_COMPRESSIONS = (None, "gzip")
+DEFAULT_SPLIT_COMPRESSLEVEL = 6
+
+# Format of the processed file passed from the cut to the split stage
+INTERMEDIATE_FORMAT_CSV = "csv"
+INTERMEDIATE_FORMAT_PARQUET = "parquet"
+DEFAULT_PARQUET_COMPRESSION = "zstd"
+
+# External-sort split: raw line bytes held in memory per sorted run
+DEFAULT_SORT_RUN_BYTES = 64 * 1024 * 1024
+
+
+def _split_output_format(column_config: Dict[str, Any]) -> Tuple[Optional[str], str]:
+    """Read ``split_output_compression`` from a domain config.
+
+    Returns:
+        Tuple of (compression or None, output file suffix)
+    """
+    compression = column_config.get("split_output_compression") or None
+    if compression == "none":
+        compression = None
+    if compression not in SPLIT_OUTPUT_COMPRESSIONS:
+        raise ValueError(f"Unsupported split_output_compression '{compression}'")
+    return compression, ".csv.gz" if compression == "gzip" else ".csv"
+
+
+def _detect_compression(path: Path) -> Optional[str]:
+    """Return the compression format of a file from its magic bytes, or None."""
+    with path.open("rb") as f:
+        magic = f.read(4)
+    for prefix, compression in COMPRESSION_MAGIC:
+        if magic.startswith(prefix):
+            return compression
+    return None
+
+
+@contextmanager
+def _open_source(path: Path) -> Iterator[Tuple[BinaryIO, BinaryIO]]:
+    """Open a source file for streaming reads, decompressing it on the fly.
+
+    Yields:
+        Tuple of (raw file, data stream). The raw file's ``tell()`` gives the
+        progress through the file on disk; the stream yields uncompressed bytes
+        and is the raw file itself when the source is not compressed.
+    """
+    compression = _detect_compression(path)
+    with path.open("rb") as raw:
+        if compression is None:
+            yield raw, raw
+            return
+
+        if compression == "gzip":
+            stream = gzip.GzipFile(fileobj=raw, mode="rb")
+        elif compression == "bz2":
+            stream = bz2.BZ2File(raw, mode="rb")
+        elif compression == "zstd":
+            if not HAS_ZSTD:
+                raise RuntimeError(f"zstandard is required to read {path}")
+            stream = io.BufferedReader(
+                zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True)
+            )
+        else:
+            if not HAS_LZ4:
+                raise RuntimeError(f"lz4 is required to read {path}")
+            stream = lz4_frame.LZ4FrameFile(raw, mode="rb")
+
+        with stream:
+            yield raw, stream
+
+
+def _parse_float(value: str) -> float:
+    number = float(value)
+    if number != number:
+        raise ValueError(f"not a number: {value}")
+    return number
+
+
+def _parse_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        real = float(value)
+        if not real.is_integer():
+            raise ValueError(f"not an integer: {value}")
+        number = int(real)
+    if not -2 ** 63 <= number < 2 ** 63:
+        raise OverflowError(f"out of int64 range: {value}")
+    return number
+
+
+def _parse_date(value: str) -> datetime.date:
+    return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+
+
+# Per-value parsers of the non-string column_types values (see _parse_strings)
+_TYPE_PARSERS: Dict[str, Callable[[str], Any]] = {
+    "float64": _parse_float,
+    "int64": _parse_int,
+    "date": _parse_date,
+}
+
+# Rows converted together by the row-at-a-time split paths
+COERCE_BATCH_ROWS = 10000
+
+
+def _parse_value(parser: Callable[[str], Any], value: Optional[str]) -> Any:
+    """Parse one value, returning None if it is empty or invalid."""
+    if not value:
+        return None
+    try:
+        return parser(value)
+    except (ValueError, OverflowError):
+        return None
+
+
+# Text forms that Arrow's cast parses exactly as the per-value parsers do
+_STRICT_FORMS = {
+    "float64": r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$",
+    "int64": r"^-?\d{1,18}$",
+    "date": r"^\d{4}-\d{2}-\d{2}$",
+}
+
+
+def _parse_strings(values: "pa.Array", column_type: str) -> "pa.Array":
+    """Parse a string column to its declared type; empty or invalid values become null.
+
+    Values in their plain form (the common case) are converted by one
+    ``pyarrow.compute.cast``; the rest ("2.0" as an integer, "2024-1-5",
+    "inf", invalid values) go through the per-value parsers, so both agree
+    on every input. pandas' ``to_numeric`` is not used because its fast
+    float parser is not correctly rounded.
+    """
+    target = _ARROW_TYPES[column_type]()
+    values = pc.if_else(pc.equal(values, ""), pa.scalar(None, pa.string()), values)
+    strict = pc.fill_null(pc.match_substring_regex(values, _STRICT_FORMS[column_type]), False)
+    lenient = pc.and_(pc.invert(strict), values.is_valid())
+    plain = pc.if_else(strict, values, pa.scalar(None, pa.string()))
+    if column_type == "date":
+        stamps = pc.strptime(plain, format="%Y-%m-%d", unit="s", error_is_null=True)
+        typed = pc.cast(stamps, target)
+        # strptime rolls impossible dates such as 2024-02-30 over; they do not round-trip
+        rolled = pc.fill_null(pc.not_equal(pc.cast(typed, pa.string()), plain), False)
+        typed = pc.if_else(rolled, pa.scalar(None, target), typed)
+        lenient = pc.or_(lenient, rolled)
+    else:
+        typed = pc.cast(plain, target)
+    if pc.any(lenient).as_py():
+        parser = _TYPE_PARSERS[column_type]
+        parsed = [
+            _parse_value(parser, value)
+            for value in pc.filter(values, lenient).to_pylist()
+        ]
+        typed = pc.replace_with_mask(typed, lenient, pa.array(parsed, type=target))
+    return typed
+
+
+def _format_typed(typed: "pa.Array") -> List[str]:
+    """Render a typed column as text, as ``str()`` renders each value ("" for nulls).
+
+    Shared by every path that writes typed columns, so pandas, Parquet and
+    row-at-a-time split outputs are byte-identical.
+    """
+    texts = pc.cast(typed, pa.string())
+    if pa.types.is_floating(typed.type):
+        # Arrow prints the same shortest digits as repr() but drops the ".0" of
+        # whole numbers and picks exponent notation by other thresholds
+        whole = pc.and_(pc.invert(pc.match_substring(texts, ".")), pc.is_finite(typed))
+        texts = pc.if_else(whole, pc.binary_join_element_wise(texts, ".0", ""), texts)
+        magnitude = pc.abs(typed)
+        exponent = pc.or_(
+            pc.match_substring(texts, "e"),
+            pc.or_(
+                pc.greater_equal(magnitude, 1e16),
+                pc.and_(pc.less(magnitude, 1e-4), pc.not_equal(magnitude, 0)),
+            ),
+        )
+        exponent = pc.fill_null(exponent, False)
+        if pc.any(exponent).as_py():
+            texts = pc.replace_with_mask(texts, exponent, pa.array(
+                [repr(value) for value in pc.filter(typed, exponent).to_pylist()], pa.string()
+            ))
+    return pc.fill_null(texts, "").to_pylist()
+
+
+class _TypeCoercer:
+    """Convert the declared columns of split rows to their types.
+
+    Enabled by ``coerce_types`` in a domain config. Whole columns are parsed
+    with Arrow compute (see ``_parse_strings``) and rendered by one shared
+    formatter; the row-at-a-time split paths convert ``COERCE_BATCH_ROWS``
+    rows a column at a time. The output therefore does not depend on the
+    split mode. Without pyarrow, values are converted one at a time with the
+    same parsers. A value that fails conversion is blanked and counted per
+    column, or raises ``ValueError`` when ``type_errors`` is "fail".
+    """
+
+    def __init__(self, typed_columns: Dict[str, str], type_errors: str = TYPE_ERRORS_WARN):
+        if type_errors not in TYPE_ERRORS_MODES:
+            raise ValueError(
+                f"Unknown type_errors '{type_errors}', expected one of: {', '.join(TYPE_ERRORS_MODES)}"
+            )
+        self.typed_columns = dict(typed_columns)
+        self.type_errors = type_errors
+        self.invalid: Dict[str, int] = {}
+
+    @classmethod
+    def from_config(
+        cls,
+        column_config: Dict[str, Any],
+        projection: Optional["ColumnProjection"]
+    ) -> Optional["_TypeCoercer"]:
+        """Build the coercer of a domain, or None if coercion is off or nothing is typed."""
+        if not column_config.get("coerce_types", False) or projection is None:
+            return None
+        if not projection.typed_columns:
+            return None
+        return cls(projection.typed_columns, column_config.get("type_errors", TYPE_ERRORS_WARN))
+
+    def positions(self, column_names: Sequence[str]) -> List[Tuple[int, str]]:
+        """Return ``(index, name)`` of the typed columns among ``column_names``."""
+        return [
+            (index, name) for index, name in enumerate(column_names)
+            if name in self.typed_columns
+        ]
+
+    def _invalid(self, name: str, count: int, value: Any) -> None:
+        """Record ``count`` values of a column that failed conversion."""
+        if self.type_errors == TYPE_ERRORS_FAIL:
+            raise ValueError(
+                f"Cannot convert {name} value {value!r} to {self.typed_columns[name]}"
+            )
+        self.invalid[name] = self.invalid.get(name, 0) + count
+
+    def to_arrow(self, name: str, values: "pa.Array") -> "pa.Array":
+        """Parse a string column into an Arrow array of its type."""
+        typed = _parse_strings(values, self.typed_columns[name])
+        if typed.null_count > values.null_count:
+            failed = pc.and_(
+                typed.is_null(), pc.and_(values.is_valid(), pc.not_equal(values, ""))
+            )
+            count = pc.sum(failed).as_py() or 0
+            if count:
+                self._invalid(name, count, pc.filter(values, failed)[0].as_py())
+        return typed
+
+    def format_column(self, name: str, values: Sequence[Optional[str]]) -> List[str]:
+        """Return a column of strings in the canonical form of its type."""
+        if not HAS_PYARROW:
+            return [self.format(name, value) for value in values]
+        array = values if isinstance(values, pa.Array) else pa.array(values, type=pa.string())
+        return _format_typed(self.to_arrow(name, array))
+
+    def format(self, name: str, value: Optional[str]) -> str:
+        """Return one field in the canonical form of its type (used without pyarrow)."""
+        if not value:
+            return ""
+        typed = _parse_value(_TYPE_PARSERS[self.typed_columns[name]], value)
+        if typed is None:
+            self._invalid(name, 1, value)
+            return ""
+        return str(typed)
+
+    def coerce_rows(self, rows: List[Any], positions: Sequence[Tuple[Any, str]]) -> List[Any]:
+        """Convert the typed fields of a batch of rows, a column at a time.
+
+        ``positions`` pairs each typed field's index (or key, for dict rows)
+        with its column name.
+        """
+        if all(isinstance(index, int) for index, _ in positions) and len(set(map(len, rows))) == 1:
+            columns = list(zip(*rows))
+            for index, name in positions:
+                if index < len(columns):
+                    columns[index] = self.format_column(name, columns[index])
+            return [list(row) for row in zip(*columns)]
+        for index, name in positions:
+            if isinstance(index, int):
+                members = [row for row in rows if index < len(row)]
+            else:
+                members = rows
+            if members:
+                converted = self.format_column(name, [row[index] for row in members])
+                for row, value in zip(members, converted):
+                    row[index] = value
+        return rows
+
+    def coerce_batches(
+        self,
+        rows: Iterable[Any],
+        positions: Sequence[Tuple[Any, str]]
+    ) -> Iterator[Any]:
+        """Yield rows with their typed fields converted, ``COERCE_BATCH_ROWS`` at a time."""
+        batch: List[Any] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= COERCE_BATCH_ROWS:
+                yield from self.coerce_rows(batch, positions)
+                batch = []
+        if batch:
+            yield from self.coerce_rows(batch, positions)
+
+    def reset(self) -> None:
+        """Clear the failure counts (call before processing another file)."""
+        self.invalid = {}
+
+    def report(self, source: Path) -> None:
+        """Log the values blanked since the last reset."""
+        if self.invalid:
+            detail = ", ".join(f"{name}={count}" for name, count in self.invalid.items())
+            logger.warning(f"Blanked values that failed type conversion in {source}: {detail}")
+
+
+def _key_histogram(
+    path: Path,
+    delimiter: str,
+    key_index: int,
+    skip_header: bool = False
+) -> Dict[str, List[int]]:
+    """Count rows and bytes per split key value in a delimited file.
+
+    Only the fields up to the key column are split, so the pass is cheap
+    relative to a full parse.
+
+    Returns:
+        Mapping of key value to ``[rows, bytes]``
+    """
+    delim = delimiter.encode("utf-8")
+    histogram: Dict[str, List[int]] = {}
+    with _open_source(path) as (_, f):
+        if skip_header:
+            f.readline()
+        for line in f:
+            parts = line.split(delim, key_index + 1)
+            if len(parts) > key_index:
+                key = parts[key_index].rstrip(b"\r\n").decode("utf-8", errors="replace")
+            else:
+                key = "unknown"
+            counts = histogram.get(key)
+            if counts is None:
+                histogram[key] = [1, len(line)]
+            else:
+                counts[0] += 1
+                counts[1] += len(line)
+    return histogram
+
+
+def _project_mmap_range(
+    mm: mmap.mmap,
+    start: int,
+    end: int,
+    col_indices: Sequence[int],
+    delimiter: bytes,
+    output_delimiter: bytes,
+    dst: BinaryIO
+) -> int:
+    """Write the selected fields of the rows in ``[start, end)`` of a mapped file.
+
+    Fields are located with ``mmap.find`` and written as ``memoryview`` slices,
+    without decoding the row or splitting columns beyond the last one needed.
+
+    Returns:
+        Number of rows written
+    """
+    needed = sorted(set(col_indices))
+    slot = {index: n for n, index in enumerate(needed)}
+    order = [slot[i] for i in col_indices]
+    needed_count = len(needed)
+    find = mm.find
+    write = dst.write
+    view = memoryview(mm)
+    row_count = 0
+    pos = start
+
+    try:
+        while pos < end:
+            line_end = find(b"\n", pos, end)
+            if line_end == -1:
+                line_end = end
+            next_pos = line_end + 1
+
+            content_end = line_end
+            if content_end > pos and mm[content_end - 1] == 13:  # strip "\r"
+                content_end -= 1
+
+            slices: List[Any] = [b""] * needed_count
+            field_start = pos
+            field_index = 0
+            n = 0
+            # Stop scanning once the last needed column has been found
+            while n < needed_count and field_start <= content_end:
+                field_end = find(delimiter, field_start, content_end)
+                if field_end == -1:
+                    field_end = content_end
+                if field_index == needed[n]:
+                    slices[n] = view[field_start:field_end]
+                    n += 1
+                field_index += 1
+                field_start = field_end + len(delimiter)
+
+            write(output_delimiter.join([slices[k] for k in order]))
+            write(b"\n")
+            slices = None
+            row_count += 1
+            pos = next_pos
+    finally:
+        view.release()
+
+    return row_count
+
+
+# Shared count of source bytes projected by the parallel cut workers
+_cut_progress: Optional[Any] = None
+
+
+def _init_cut_worker(progress: Any) -> None:
+    """Process pool initializer: keep the shared progress counter."""
+    global _cut_progress
+    _cut_progress = progress
+
+
+def _cut_byte_range(
+    source_path: str,
+    start: int,
+    end: int,
+    part_path: str,
+    col_indices: Sequence[int],
+    delimiter: str,
+    output_delimiter: str
+) -> Tuple[str, int]:
+    """Project columns for the rows in ``[start, end)`` of the source.
+
+    Runs in a worker process; ``start`` and ``end`` must be newline-aligned.
+    The range is projected in newline-aligned blocks, adding each block's size
+    to the shared progress counter when the pool was given one.
+
+    Returns:
+        Tuple of (part file path, rows written)
+    """
+    row_count = 0
+    with open(source_path, "rb") as src, open(part_path, "wb") as dst:
+        if end <= start:
+            return part_path, 0
+        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = start
+            while pos < end:
+                stop = min(end, pos + PARALLEL_PROGRESS_BLOCK_BYTES)
+                if stop < end:
+                    newline = mm.find(b"\n", stop - 1, end)
+                    stop = end if newline == -1 else newline + 1
+                row_count += _project_mmap_range(
+                    mm,
+                    pos,
+                    stop,
+                    col_indices,
+                    delimiter.encode("utf-8"),
+                    output_delimiter.encode("utf-8"),
+                    dst,
+                )
+                if _cut_progress is not None:
+                    with _cut_progress.get_lock():
+                        _cut_progress.value += stop - pos
+                pos = stop
+
+    return part_path, row_count
+
+
+def _split_byte_ranges(source_path: Path, parts: int) -> List[Tuple[int, int]]:
+    """Split a file into up to ``parts`` contiguous, newline-aligned byte ranges."""
+    size = source_path.stat().st_size
+    boundaries = [0]
+    with source_path.open("rb") as f:
+        for i in range(1, parts):
+            f.seek(max(size * i // parts, boundaries[-1]))
+            f.readline()
+            position = min(f.tell(), size)
+            if position > boundaries[-1]:
+                boundaries.append(position)
+    if boundaries[-1] < size:
+        boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def _append_file(src_path: Path, dst) -> None:
+    """Append the contents of ``src_path`` to the open binary file ``dst``."""
+    with src_path.open("rb") as src:
+        remaining = os.fstat(src.fileno()).st_size
+        if hasattr(os, "copy_file_range"):
+            dst.flush()
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining == 0:
+                    return
+            except OSError:
+                pass
+            dst.seek(0, os.SEEK_END)
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+
 
 @dataclass
 class ProcessResult:
@@ -32,32 +636,587 @@ class ProcessResult:
     output_paths: Optional[List[Path]] = None
     error: Optional[str] = None
     rows_processed: int = 0
+    row_counts: Optional[Dict[Path, int]] = None
+    key_column: Optional[str] = None
+    keys_by_file: Optional[Dict[Path, List[str]]] = None
+    manifest_path: Optional[Path] = None
+
+
+@dataclass
+class SplitManifest:
+    """Split outputs with the keys and row count of each, stored next to the files.
+
+    Written by the splitters as ``<output_prefix>manifest.json`` so the load stage
+    knows every key up front without re-reading the split files. File names are
+    stored relative to the manifest's directory.
+    """
+    key_column: Optional[str]
+    row_counts: Dict[str, int]
+    keys_by_file: Dict[str, List[str]]
+
+    @classmethod
+    def from_result(cls, result: ProcessResult) -> "SplitManifest":
+        """Build the manifest of a successful split result."""
+        return cls(
+            key_column=result.key_column,
+            row_counts={path.name: rows for path, rows in (result.row_counts or {}).items()},
+            keys_by_file={
+                path.name: sorted(keys) for path, keys in (result.keys_by_file or {}).items()
+            }
+        )
+
+    @property
+    def files_by_key(self) -> Dict[str, List[str]]:
+        """Return the file name(s) holding each key."""
+        files_by_key: Dict[str, List[str]] = {}
+        for name, keys in self.keys_by_file.items():
+            for key in keys:
+                files_by_key.setdefault(key, []).append(name)
+        return files_by_key
+
+    def write(self, path: Path) -> None:
+        """Atomically write the manifest as JSON."""
+        record = {
+            "key_column": self.key_column,
+            "total_rows": sum(self.row_counts.values()),
+            "files": {
+                name: {"rows": rows, "keys": self.keys_by_file.get(name, [])}
+                for name, rows in self.row_counts.items()
+            },
+            "keys": self.files_by_key,
+        }
+        temp = path.with_name(f"{path.name}.tmp")
+        with temp.open("w", encoding="utf-8") as f:
+            json.dump(record, f, indent=1)
+        os.replace(temp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "SplitManifest":
+        """Read a manifest written by ``write``."""
+        with path.open("r", encoding="utf-8") as f:
+            record = json.load(f)
+        files = record.get("files", {})
+        return cls(
+            key_column=record.get("key_column"),
+            row_counts={name: int(entry.get("rows", 0)) for name, entry in files.items()},
+            keys_by_file={name: list(entry.get("keys", [])) for name, entry in files.items()}
+        )
+
+    def keys_by_path(self, directory: Path) -> Dict[Path, List[str]]:
+        """Return the keys of each file, keyed by its path under ``directory``."""
+        return {directory / name: keys for name, keys in self.keys_by_file.items()}
+
+
+def _write_split_manifest(result: ProcessResult, output_dir: Path, output_prefix: str) -> None:
+    """Write the manifest of a successful split and record its path on the result."""
+    manifest_path = output_dir / f"{output_prefix}manifest.json"
+    SplitManifest.from_result(result).write(manifest_path)
+    result.manifest_path = manifest_path
+
+
+def _parse_column_spec(spec: str) -> List[int]:
+    """Parse a 1-based cut field list such as ``"2,4-7,9"`` into 0-based indices."""
+    indices: List[int] = []
+    for part in str(spec).split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, _, end = part.partition("-")
+            first, last = int(start), int(end)
+            if first < 1 or last < first:
+                raise ValueError(f"Invalid column range: {part}")
+            indices.extend(range(first - 1, last))
+        else:
+            index = int(part)
+            if index < 1:
+                raise ValueError(f"Invalid column index: {part}")
+            indices.append(index - 1)
+    return indices
+
+
+@dataclass(frozen=True)
+class ColumnProjection:
+    """Compiled column projection plan for a domain.
+
+    Built once from ``required_columns_by_index`` and shared by the cut and split
+    stages. Like ``cut -f``, the selected columns are emitted in ascending order.
+    """
+    indices: Tuple[int, ...]
+    ranges: Tuple[Tuple[int, int], ...]
+    max_index: int
+    column_names: Tuple[str, ...] = ()
+    key_index: int = 0
+    column_types: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_config(cls, column_config: Dict[str, Any]) -> Optional["ColumnProjection"]:
+        """
+        Compile a projection plan from a column_map.yaml domain configuration.
+
+        Args:
+            column_config: Configuration from column_map.yaml for the domain
+
+        Returns:
+            ColumnProjection, or None if no columns are configured
+        """
+        spec = column_config.get("required_columns_by_index", "")
+        indices = sorted(set(_parse_column_spec(spec))) if spec else []
+        if not indices:
+            return None
+
+        # Merge contiguous indices into inclusive (start, end) runs
+        ranges: List[Tuple[int, int]] = []
+        for index in indices:
+            if ranges and ranges[-1][1] == index - 1:
+                ranges[-1] = (ranges[-1][0], index)
+            else:
+                ranges.append((index, index))
+
+        column_names = tuple(column_config.get("column_names", []) or [])
+        split_by_column = column_config.get("split_by_column", "gfcid")
+        if split_by_column in column_names:
+            key_index = column_names.index(split_by_column)
+        else:
+            key_index = int(column_config.get("split_by_column_index", 0))
+
+        declared_types = column_config.get("column_types", {}) or {}
+        for name, column_type in declared_types.items():
+            if name not in column_names:
+                raise ValueError(f"column_types refers to unknown column '{name}'")
+            if column_type not in COLUMN_TYPES:
+                raise ValueError(
+                    f"Unknown type '{column_type}' for column '{name}', "
+                    f"expected one of: {', '.join(COLUMN_TYPES)}"
+                )
+        column_types = tuple(
+            declared_types.get(name, COLUMN_TYPE_STRING) for name in column_names
+        )
+
+        return cls(
+            indices=tuple(indices),
+            ranges=tuple(ranges),
+            max_index=indices[-1],
+            column_names=column_names,
+            key_index=key_index,
+            column_types=column_types,
+        )
+
+    @property
+    def cut_fields(self) -> str:
+        """Return the 1-based field list for ``cut -f`` (e.g. ``"2,4-20,26"``)."""
+        parts = []
+        for start, end in self.ranges:
+            if start == end:
+                parts.append(str(start + 1))
+            else:
+                parts.append(f"{start + 1}-{end + 1}")
+        return ",".join(parts)
+
+    def header(self, delimiter: str = ",") -> Optional[str]:
+        """Return the output header line, or None if no column names are defined."""
+        if not self.column_names:
+            return None
+        return delimiter.join(self.column_names) + "\n"
+
+    @property
+    def typed_columns(self) -> Dict[str, str]:
+        """Return the declared type of each non-string column, by column name."""
+        return {
+            name: column_type
+            for name, column_type in zip(self.column_names, self.column_types)
+            if column_type != COLUMN_TYPE_STRING
+        }
+
+    @property
+    def field_names(self) -> Tuple[str, ...]:
+        """Return a name for every projected column, for formats that require one."""
+        if len(self.column_names) == len(self.indices):
+            return self.column_names
+        return tuple(f"column_{index + 1}" for index in self.indices)
+
+
+class SplitPartitioner:
+    """Map split key values to output file names for the configured split mode.
+
+    - ``key``: one file per key value
+    - ``hash``: ``shard_count`` files, by ``crc32(key) % shard_count``
+    - ``balanced``: keys packed into files of about ``target_file_rows`` rows
+      (or ``target_file_bytes`` bytes) from a per-key histogram, see ``plan``
+
+    Every mode keeps all rows of a key in the same file. Names are memoized
+    per key, which also records the keys written to each file (``keys_by_file``).
+    """
+
+    def __init__(
+        self,
+        split_mode: str = SPLIT_MODE_KEY,
+        shard_count: int = DEFAULT_SHARD_COUNT,
+        target_file_rows: int = DEFAULT_TARGET_FILE_ROWS,
+        target_file_bytes: int = 0
+    ):
+        """
+        Initialize the partitioner.
+
+        Args:
+            split_mode: One of ``SPLIT_MODES``
+            shard_count: Number of output files in hash mode
+            target_file_rows: Target rows per file in balanced mode
+            target_file_bytes: Target bytes per file in balanced mode (overrides rows if set)
+        """
+        if split_mode not in SPLIT_MODES:
+            raise ValueError(
+                f"Unknown split_mode '{split_mode}', expected one of: {', '.join(SPLIT_MODES)}"
+            )
+        if shard_count < 1:
+            raise ValueError(f"shard_count must be at least 1, got {shard_count}")
+        if target_file_rows < 1 and target_file_bytes < 1:
+            raise ValueError("target_file_rows or target_file_bytes must be positive")
+
+        self.split_mode = split_mode
+        self.shard_count = shard_count
+        self.target_file_rows = target_file_rows
+        self.target_file_bytes = target_file_bytes
+        self._key_parts: Dict[str, str] = {}
+        self._names: Dict[Any, str] = {}
+
+    @classmethod
+    def from_config(cls, column_config: Dict[str, Any]) -> "SplitPartitioner":
+        """Build a partitioner from a column_map.yaml domain config."""
+        return cls(
+            split_mode=str(column_config.get("split_mode", SPLIT_MODE_KEY)).lower(),
+            shard_count=int(column_config.get("shard_count", DEFAULT_SHARD_COUNT)),
+            target_file_rows=int(
+                column_config.get("target_file_rows", DEFAULT_TARGET_FILE_ROWS)
+            ),
+            target_file_bytes=int(column_config.get("target_file_bytes", 0) or 0)
+        )
+
+    @property
+    def needs_histogram(self) -> bool:
+        """Whether ``plan`` must be called with a key histogram before splitting."""
+        return self.split_mode == SPLIT_MODE_BALANCED
+
+    def plan(self, histogram: Dict[str, List[int]]) -> int:
+        """Assign keys to balanced output files.
+
+        Keys are placed heaviest first: a key at or above the target gets a
+        file of its own, any other key goes into the least-filled file that
+        still has room, or starts a new file.
+
+        Args:
+            histogram: Mapping of key value to ``[rows, bytes]``
+
+        Returns:
+            Number of output files planned
+        """
+        by_bytes = self.target_file_bytes > 0
+        target = self.target_file_bytes if by_bytes else self.target_file_rows
+        weight_of = (lambda c: c[1]) if by_bytes else (lambda c: c[0])
+
+        self._key_parts = {}
+        self._names = {}
+        open_parts: List[Tuple[int, int]] = []  # heap of (filled, part number)
+        part_count = 0
+
+        for key, counts in sorted(
+            histogram.items(), key=lambda item: weight_of(item[1]), reverse=True
+        ):
+            weight = weight_of(counts)
+            if open_parts and open_parts[0][0] + weight <= target:
+                filled, part = heapq.heappop(open_parts)
+            else:
+                filled, part = 0, part_count
+                part_count += 1
+
+            self._key_parts[key] = f"part{part:03d}"
+            filled += weight
+            if filled < target:
+                heapq.heappush(open_parts, (filled, part))
+
+        return part_count
+
+    def reset(self) -> None:
+        """Forget the keys seen so far (call before splitting another file)."""
+        self._names = {}
+
+    def name(self, key: Any) -> str:
+        """Return the output file suffix for a split key."""
+        part = self._names.get(key)
+        if part is None:
+            part = self._names[key] = self._name(str(key))
+        return part
+
+    def _name(self, key: str) -> str:
+        if self.split_mode == SPLIT_MODE_HASH:
+            shard = zlib.crc32(key.encode("utf-8")) % self.shard_count
+            return f"shard{shard:03d}"
+        if self.split_mode == SPLIT_MODE_BALANCED:
+            part = self._key_parts.get(key)
+            if part is not None:
+                return part
+        return key.replace("/", "_").replace("\\", "_")
+
+    def keys_by_file(
+        self,
+        output_dir: Path,
+        output_prefix: str,
+        output_suffix: str
+    ) -> Dict[Path, List[str]]:
+        """Return the keys named since the last reset, grouped by output file.
+
+        Args:
+            output_dir: Directory of the output files
+            output_prefix: Prefix of the output file names
+            output_suffix: Suffix of the output file names
+
+        Returns:
+            Mapping of output path to the key values it holds
+        """
+        keys_by_file: Dict[Path, List[str]] = {}
+        for key, part in self._names.items():
+            path = output_dir / f"{output_prefix}{part}{output_suffix}"
+            keys_by_file.setdefault(path, []).append(str(key))
+        return keys_by_file
+
+
+class WriterPool:
+    """LRU-bounded pool of append-mode handles for split output files.
+
+    At most ``max_open_files`` handles are kept open; the least recently used
+    handle is closed when the limit is reached and transparently reopened in
+    append mode on its next write. Whether a file already has its header is
+    tracked in memory, so the filesystem is checked once per file per run.
+    """
+
+    def __init__(
+        self,
+        header: Optional[str] = None,
+        max_open_files: int = DEFAULT_MAX_OPEN_FILES,
+        buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE,
+        compression: Optional[str] = None,
+        compresslevel: int = DEFAULT_SPLIT_COMPRESSLEVEL
+    ):
+        """
+        Initialize the writer pool.
+
+        Args:
+            header: Header line written to each newly created file
+            max_open_files: Maximum number of simultaneously open handles
+            buffer_size: Write buffer size per handle in bytes
+            compression: "gzip" to write gzip files (each reopen appends a gzip member)
+            compresslevel: gzip compression level
+        """
+        self.header = header
+        self.max_open_files = max(1, max_open_files)
+        self.buffer_size = buffer_size
+        self.compression = compression
+        self.compresslevel = compresslevel
+        self._handles: "OrderedDict[Path, BinaryIO]" = OrderedDict()
+        self._seen: Set[Path] = set()
+        self.reopen_count = 0
+
+    def get(self, path: Path) -> BinaryIO:
+        """Return an open binary append handle for ``path``, opening it if needed."""
+        handle = self._handles.get(path)
+        if handle is not None:
+            self._handles.move_to_end(path)
+            return handle
+
+        if len(self._handles) >= self.max_open_files:
+            _, evicted = self._handles.popitem(last=False)
+            evicted.close()
+
+        if path in self._seen:
+            self.reopen_count += 1
+            handle = self._open(path)
+        else:
+            file_exists = path.exists()
+            handle = self._open(path)
+            if not file_exists and self.header:
+                handle.write(self.header.encode("utf-8"))
+            self._seen.add(path)
+
+        self._handles[path] = handle
+        return handle
+
+    def _open(self, path: Path) -> BinaryIO:
+        """Open ``path`` for buffered binary appends."""
+        if self.compression == "gzip":
+            return io.BufferedWriter(
+                gzip.GzipFile(path, "ab", compresslevel=self.compresslevel),
+                self.buffer_size
+            )
+        return path.open("ab", buffering=self.buffer_size)
+
+    def write(self, path: Path, data: bytes) -> None:
+        """Append ``data`` to ``path``."""
+        self.get(path).write(data)
+
+    def close(self) -> None:
+        """Flush and close all open handles."""
+        while self._handles:
+            _, handle = self._handles.popitem(last=False)
+            try:
+                handle.close()
+            except Exception:
+                pass
+
+    def __enter__(self) -> "WriterPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class PartitionBuffer:
+    """Accumulate split output per partition and flush it in large writes.
+
+    Rows are appended to a ``bytearray`` per output file. A partition is written
+    out once it exceeds ``flush_bytes``, and every partition is written out when
+    the total buffered size reaches ``memory_budget_bytes``.
+    """
+
+    def __init__(
+        self,
+        pool: WriterPool,
+        flush_bytes: int = DEFAULT_PARTITION_FLUSH_BYTES,
+        memory_budget_bytes: int = DEFAULT_SPLIT_MEMORY_BUDGET_BYTES
+    ):
+        """
+        Initialize the partition buffer.
+
+        Args:
+            pool: Writer pool used to write flushed partitions
+            flush_bytes: Size at which a single partition is flushed
+            memory_budget_bytes: Total buffered size at which all partitions are flushed
+        """
+        self.pool = pool
+        self.flush_bytes = flush_bytes
+        self.memory_budget_bytes = memory_budget_bytes
+        self._buffers: Dict[Path, bytearray] = {}
+        self.buffered_bytes = 0
+
+    def append(self, path: Path, data: bytes) -> None:
+        """Buffer ``data`` for ``path``, flushing if a size threshold is reached."""
+        buffer = self._buffers.get(path)
+        if buffer is None:
+            buffer = self._buffers[path] = bytearray()
+        buffer += data
+        self.buffered_bytes += len(data)
+
+        if len(buffer) >= self.flush_bytes:
+            self.flush(path)
+        elif self.buffered_bytes >= self.memory_budget_bytes:
+            self.flush_all()
+
+    def flush(self, path: Path) -> None:
+        """Write out and release the buffered data for ``path``."""
+        buffer = self._buffers.pop(path, None)
+        if buffer:
+            self.pool.write(path, buffer)
+            self.buffered_bytes -= len(buffer)
+
+    def flush_all(self) -> None:
+        """Write out all buffered partitions."""
+        for path in list(self._buffers):
+            self.flush(path)
+
+    def close(self) -> None:
+        """Flush all partitions and close the writer pool."""
+        try:
+            self.flush_all()
+        finally:
+            self.pool.close()
+
+    def __enter__(self) -> "PartitionBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class _BufferedRowWriter:
+    """File-like adapter that lets ``csv.writer`` append to a partition buffer."""
+
+    def __init__(self, buffer: PartitionBuffer, path: Path):
+        self.buffer = buffer
+        self.path = path
+
+    def write(self, data: str) -> None:
+        self.buffer.append(self.path, data.encode("utf-8"))
 
 
 class ColumnCutter:
     """Cut specific columns from a delimited file."""
 
-    def __init__(self, column_config: Dict[str, Any]):
+    def __init__(
+        self,
+        column_config: Dict[str, Any],
+        projection: Optional[ColumnProjection] = None
+    ):
         """
         Initialize the column cutter.
 
         Args:
             column_config: Configuration from column_map.yaml for the domain
+            projection: Pre-compiled projection plan (compiled from config if omitted)
         """
         self.column_config = column_config
         self.delimiter = column_config.get("delimiter", "\x01")
         self.output_delimiter = column_config.get("output_delimiter", ",")
         self.has_header = column_config.get("has_header", False)
-        self.columns_to_extract = column_config.get("required_columns_by_index", "")
+        self.projection = projection or ColumnProjection.from_config(column_config)
         self.column_names = column_config.get("column_names", [])
+        # Number of worker processes for cutting (0 = one per CPU core)
+        self.workers = int(column_config.get("cut_workers", 1))
+        self.parallel_min_bytes = int(
+            column_config.get("parallel_cut_min_bytes", DEFAULT_PARALLEL_CUT_MIN_BYTES)
+        )
+        self.timeout_seconds = float(
+            column_config.get("cut_timeout_seconds", DEFAULT_CUT_TIMEOUT_SECONDS)
+        )
+        self.min_bytes_per_second = int(
+            column_config.get("cut_min_bytes_per_second", DEFAULT_CUT_MIN_BYTES_PER_SECOND)
+        )
+        self.intermediate_format = str(
+            column_config.get("intermediate_format", INTERMEDIATE_FORMAT_CSV)
+        ).lower()
+        self.parquet_compression = column_config.get(
+            "parquet_compression", DEFAULT_PARQUET_COMPRESSION
+        )
+        if self.intermediate_format == INTERMEDIATE_FORMAT_PARQUET and not HAS_PYARROW:
+            logger.warning("intermediate_format 'parquet' requires pyarrow, using CSV")
+        self.coercer = _TypeCoercer.from_config(column_config, self.projection)
+
+    @property
+    def writes_parquet(self) -> bool:
+        """Whether the processed output is written as Parquet."""
+        return (
+            self.intermediate_format == INTERMEDIATE_FORMAT_PARQUET
+            and HAS_PYARROW
+            and self.projection is not None
+        )
+
+    def _worker_count(self) -> int:
+        """Return the number of worker processes to use for cutting."""
+        if self.workers == 0:
+            return os.cpu_count() or 1
+        return max(1, self.workers)
 
-    def process(self, source_path: Path, destination_path: Path) -> ProcessResult:
+    def process(
+        self,
+        source_path: Path,
+        destination_path: Path,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> ProcessResult:
         """
         Cut columns from source file and save to destination.
 
         Args:
             source_path: Path to the source file
             destination_path: Path for the output file
+            progress_callback: Optional callback receiving (bytes_read, total_bytes)
 
         Returns:
             ProcessResult with status and output path
@@ -73,9 +1232,23 @@ class ColumnCutter:
             destination_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Use cut command for efficiency with large files (if available)
-            if self.columns_to_extract:
-                if HAS_CUT:
-                    result = self._cut_with_command(source_path, destination_path)
+            if self.writes_parquet:
+                result = self._cut_to_parquet(
+                    source_path, destination_path, progress_callback
+                )
+            elif self.projection:
+                if (
+                    self._worker_count() > 1
+                    and source_path.stat().st_size >= self.parallel_min_bytes
+                    and _detect_compression(source_path) is None
+                ):
+                    result = self._cut_parallel(
+                        source_path, destination_path, progress_callback
+                    )
+                elif HAS_CUT:
+                    result = self._cut_with_command(
+                        source_path, destination_path, progress_callback
+                    )
                 else:
                     logger.info("'cut' command not available, using Python fallback")
                     result = self._cut_with_python(source_path, destination_path)
@@ -89,48 +1262,199 @@ class ColumnCutter:
             logger.error(f"Column cutting failed: {e}")
             return ProcessResult(success=False, error=str(e))
 
-    def _cut_with_command(self, source_path: Path, destination_path: Path) -> ProcessResult:
-        """Use the cut command for efficient column extraction."""
-        try:
-            # Build cut command
-            # cut -d $'\x01' -f 2,4,5,6 source > dest
-            delimiter_escaped = self.delimiter
-            if self.delimiter == "\x01":
-                delimiter_escaped = "$'\\x01'"
-
-            cmd = f"cut -d {delimiter_escaped} -f {self.columns_to_extract} '{source_path}'"
-
-            # If we need to change the output delimiter
-            if self.output_delimiter != self.delimiter:
-                # Convert delimiter using tr or sed
-                if self.output_delimiter == ",":
-                    cmd += f" | tr '{self.delimiter}' ','"
-                else:
-                    cmd += f" | sed 's/{self.delimiter}/{self.output_delimiter}/g'"
+    def _cut_to_parquet(
+        self,
+        source_path: Path,
+        destination_path: Path,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> ProcessResult:
+        """Cut columns with the Arrow CSV reader and write them as Parquet row groups.
 
-            cmd += f" > '{destination_path}'"
+        Only the projected columns are read; the rest of each row is skipped by
+        the reader. With ``coerce_types`` on, typed columns are converted by
+        the shared coercer and stored natively; otherwise every column is a
+        string. Batches are streamed, so memory is bounded by the reader block
+        size.
+        """
+        names = list(self.projection.field_names)
+        include = [f"f{index}" for index in self.projection.indices]
+        coercer = self.coercer
+        typed_columns = coercer.typed_columns if coercer else {}
+        arrow_types = [
+            _ARROW_TYPES[typed_columns.get(name, COLUMN_TYPE_STRING)]() for name in names
+        ]
+        typed_positions = coercer.positions(names) if coercer else []
+        if coercer:
+            coercer.reset()
+        total_bytes = source_path.stat().st_size
+        rows = 0
+
+        read_options = pa_csv.ReadOptions(
+            autogenerate_column_names=True,
+            skip_rows=1 if self.has_header else 0
+        )
+        parse_options = pa_csv.ParseOptions(delimiter=self.delimiter, quote_char=False)
+        convert_options = pa_csv.ConvertOptions(
+            include_columns=include,
+            column_types={column: pa.string() for column in include},
+            strings_can_be_null=False
+        )
 
-            # Execute the command
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=600
+        with _open_source(source_path) as (raw, src):
+            reader = pa_csv.open_csv(
+                src,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options
             )
+            schema = pa.schema(list(zip(names, arrow_types)))
+            with pq.ParquetWriter(
+                destination_path, schema, compression=self.parquet_compression
+            ) as writer:
+                for batch in reader:
+                    columns = list(batch.columns)
+                    for index, name in typed_positions:
+                        columns[index] = coercer.to_arrow(name, columns[index])
+                    writer.write_batch(pa.RecordBatch.from_arrays(columns, schema=schema))
+                    rows += batch.num_rows
+                    if progress_callback:
+                        progress_callback(raw.tell(), total_bytes)
+
+        if coercer:
+            coercer.report(source_path)
+        logger.info(f"Cut {rows} rows from {source_path} to Parquet {destination_path}")
+        return ProcessResult(
+            success=True,
+            output_path=destination_path,
+            rows_processed=rows
+        )
 
-            if result.returncode != 0:
-                return ProcessResult(
-                    success=False,
-                    error=f"Cut command failed: {result.stderr}"
-                )
+    def _cut_timeout(self, source_size: int) -> float:
+        """Return the cut timeout in seconds, scaled by the source file size."""
+        return self.timeout_seconds + source_size / max(1, self.min_bytes_per_second)
 
-            # Count rows processed
-            row_count = self._count_lines(destination_path)
+    def _cut_with_command(
+        self,
+        source_path: Path,
+        destination_path: Path,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> ProcessResult:
+        """Use a cut (| tr) subprocess pipeline for efficient column extraction.
 
-            # Add header if column names are defined
-            if self.column_names and not self.has_header:
-                self._add_header(destination_path)
+        An uncompressed source is opened as ``cut``'s stdin, so its bytes never
+        pass through Python; a compressed one is decompressed and fed to
+        ``cut`` from a thread. A monitor thread reports progress from the
+        source file offset and kills the pipeline at the timeout. The projected
+        output is read back to count rows as it is written to the destination.
+        """
+        if len(self.delimiter) != 1 or len(self.output_delimiter) != 1:
+            # cut and tr only handle single-character delimiters
+            return self._cut_with_python(source_path, destination_path)
+
+        processes: List[subprocess.Popen] = []
+        try:
+            total_bytes = source_path.stat().st_size
+            timeout = self._cut_timeout(total_bytes)
+            deadline = time.monotonic() + timeout
+            cut_argv = ["cut", "-d", self.delimiter, "-f", self.projection.cut_fields]
+            tr_argv = None
+            if self.output_delimiter != self.delimiter:
+                tr_argv = ["tr", self.delimiter, self.output_delimiter]
+
+            with destination_path.open("wb") as dst, \
+                    tempfile.TemporaryFile() as stderr, \
+                    _open_source(source_path) as (raw, src):
+                header = self._header_line()
+                if header:
+                    dst.write(header)
+
+                compressed = src is not raw
+                cut_proc = subprocess.Popen(
+                    cut_argv,
+                    stdin=subprocess.PIPE if compressed else raw,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr,
+                )
+                processes.append(cut_proc)
+                output = cut_proc.stdout
+                if tr_argv:
+                    tr_proc = subprocess.Popen(
+                        tr_argv, stdin=cut_proc.stdout, stdout=subprocess.PIPE, stderr=stderr
+                    )
+                    processes.append(tr_proc)
+                    # Let tr own the pipe so cut gets SIGPIPE if tr exits
+                    cut_proc.stdout.close()
+                    output = tr_proc.stdout
+
+                stop = threading.Event()
+                timed_out = threading.Event()
+                feed_errors: List[BaseException] = []
+
+                def feed() -> None:
+                    try:
+                        shutil.copyfileobj(src, cut_proc.stdin, COMMAND_CHUNK_SIZE)
+                    except BrokenPipeError:
+                        pass
+                    except BaseException as e:
+                        feed_errors.append(e)
+                    finally:
+                        try:
+                            cut_proc.stdin.close()
+                        except BrokenPipeError:
+                            pass
+
+                def monitor() -> None:
+                    while not stop.wait(PROGRESS_INTERVAL_SECONDS):
+                        if progress_callback:
+                            progress_callback(os.lseek(raw.fileno(), 0, os.SEEK_CUR), total_bytes)
+                        if time.monotonic() > deadline:
+                            timed_out.set()
+                            for proc in processes:
+                                proc.kill()
+                            return
+
+                threads = [threading.Thread(target=monitor, daemon=True)]
+                if compressed:
+                    threads.append(threading.Thread(target=feed, daemon=True))
+                for thread in threads:
+                    thread.start()
+
+                # cut emits one newline-terminated line per input line
+                row_count = 0
+                try:
+                    while True:
+                        chunk = output.read(COMMAND_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        dst.write(chunk)
+                        row_count += chunk.count(b"\n")
+                    output.close()
+
+                    for proc in processes:
+                        proc.wait(timeout=max(1.0, deadline - time.monotonic()))
+                finally:
+                    stop.set()
+                    for proc in processes:
+                        if proc.poll() is None:
+                            proc.kill()
+                    for thread in threads:
+                        thread.join()
+
+                if timed_out.is_set():
+                    raise subprocess.TimeoutExpired(cut_argv, timeout)
+                if feed_errors:
+                    raise feed_errors[0]
+
+                failed = [proc for proc in processes if proc.returncode != 0]
+                if failed:
+                    stderr.seek(0)
+                    message = stderr.read().decode("utf-8", errors="replace").strip()
+                    return ProcessResult(
+                        success=False,
+                        error=f"Cut command failed: {message or failed[0].returncode}"
+                    )
+                if progress_callback:
+                    progress_callback(total_bytes, total_bytes)
 
             logger.info(f"Successfully cut columns from {source_path} to {destination_path} ({row_count} rows)")
             return ProcessResult(
@@ -143,25 +1467,43 @@ class ColumnCutter:
             return ProcessResult(success=False, error="Cut operation timed out")
         except Exception as e:
             return ProcessResult(success=False, error=str(e))
+        finally:
+            for proc in processes:
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
 
     def _cut_with_python(self, source_path: Path, destination_path: Path) -> ProcessResult:
-        """Pure Python fallback for column extraction (used when 'cut' is unavailable)."""
+        """Pure Python fallback for column extraction (used when 'cut' is unavailable).
+
+        The source is memory-mapped and projected at the byte level, so rows are
+        never decoded and columns after the last required one are not scanned.
+        """
+        if _detect_compression(source_path):
+            # Compressed sources cannot be mapped; project the decompressed stream
+            return self._cut_stream(source_path, destination_path)
+
         try:
-            # Parse column indices (1-based in config, convert to 0-based)
-            col_indices = [int(c) - 1 for c in self.columns_to_extract.split(",")]
+            col_indices = self.projection.indices
             row_count = 0
 
-            with source_path.open("r", encoding="utf-8", errors="replace") as src:
-                with destination_path.open("w", encoding="utf-8") as dst:
-                    for line in src:
-                        fields = line.rstrip("\n\r").split(self.delimiter)
-                        selected = [fields[i] if i < len(fields) else "" for i in col_indices]
-                        dst.write(self.output_delimiter.join(selected) + "\n")
-                        row_count += 1
-
-            # Add header if column names are defined
-            if self.column_names and not self.has_header:
-                self._add_header(destination_path)
+            with source_path.open("rb") as src:
+                with destination_path.open("wb") as dst:
+                    header = self._header_line()
+                    if header:
+                        dst.write(header)
+                    size = os.fstat(src.fileno()).st_size
+                    if size:
+                        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            row_count = _project_mmap_range(
+                                mm,
+                                0,
+                                size,
+                                col_indices,
+                                self.delimiter.encode("utf-8"),
+                                self.output_delimiter.encode("utf-8"),
+                                dst,
+                            )
 
             logger.info(f"Successfully cut columns (Python) from {source_path} to {destination_path} ({row_count} rows)")
             return ProcessResult(
@@ -173,11 +1515,120 @@ class ColumnCutter:
         except Exception as e:
             return ProcessResult(success=False, error=str(e))
 
+    def _cut_stream(self, source_path: Path, destination_path: Path) -> ProcessResult:
+        """Project columns line by line from a (decompressed) source stream."""
+        try:
+            col_indices = self.projection.indices
+            # Columns after the last required one are left unsplit
+            max_split = self.projection.max_index + 1
+            delimiter = self.delimiter.encode("utf-8")
+            output_delimiter = self.output_delimiter.encode("utf-8")
+            row_count = 0
+
+            with _open_source(source_path) as (_, src), destination_path.open("wb") as dst:
+                header = self._header_line()
+                if header:
+                    dst.write(header)
+                for line in src:
+                    fields = line.rstrip(b"\r\n").split(delimiter, max_split)
+                    dst.write(output_delimiter.join(
+                        [fields[i] if i < len(fields) else b"" for i in col_indices]
+                    ))
+                    dst.write(b"\n")
+                    row_count += 1
+
+            logger.info(f"Successfully cut columns (stream) from {source_path} to {destination_path} ({row_count} rows)")
+            return ProcessResult(
+                success=True,
+                output_path=destination_path,
+                rows_processed=row_count
+            )
+
+        except Exception as e:
+            return ProcessResult(success=False, error=str(e))
+
+    def _cut_parallel(
+        self,
+        source_path: Path,
+        destination_path: Path,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> ProcessResult:
+        """Cut columns using a process pool over newline-aligned byte ranges.
+
+        Workers add the bytes they have projected to a shared counter, which
+        is reported to ``progress_callback`` while waiting for them.
+        """
+        part_paths: List[Path] = []
+        try:
+            col_indices = self.projection.indices
+            total_bytes = source_path.stat().st_size
+            ranges = _split_byte_ranges(source_path, self._worker_count())
+            part_paths = [
+                destination_path.with_name(f"{destination_path.name}.part{i:04d}")
+                for i in range(len(ranges))
+            ]
+            progress = multiprocessing.Value("q", 0) if progress_callback else None
+
+            with ProcessPoolExecutor(
+                max_workers=len(ranges) or 1,
+                initializer=_init_cut_worker,
+                initargs=(progress,)
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        _cut_byte_range,
+                        str(source_path),
+                        start,
+                        end,
+                        str(part_path),
+                        col_indices,
+                        self.delimiter,
+                        self.output_delimiter,
+                    )
+                    for (start, end), part_path in zip(ranges, part_paths)
+                ]
+                pending = set(futures)
+                while pending:
+                    _, pending = wait(
+                        pending, timeout=PROGRESS_INTERVAL_SECONDS, return_when=FIRST_COMPLETED
+                    )
+                    if progress_callback:
+                        progress_callback(progress.value, total_bytes)
+                row_count = sum(future.result()[1] for future in futures)
+
+            # Concatenate the parts in order
+            with destination_path.open("wb") as dst:
+                header = self._header_line()
+                if header:
+                    dst.write(header)
+                for part_path in part_paths:
+                    _append_file(part_path, dst)
+
+            logger.info(
+                f"Successfully cut columns ({len(ranges)} workers) from {source_path} "
+                f"to {destination_path} ({row_count} rows)"
+            )
+            return ProcessResult(
+                success=True,
+                output_path=destination_path,
+                rows_processed=row_count
+            )
+
+        except Exception as e:
+            return ProcessResult(success=False, error=str(e))
+        finally:
+            for part_path in part_paths:
+                try:
+                    part_path.unlink()
+                except FileNotFoundError:
+                    pass
+
     def _convert_delimiter(self, source_path: Path, destination_path: Path) -> ProcessResult:
         """Convert file delimiter without cutting columns."""
         try:
             row_count = 0
-            with source_path.open("r", encoding="utf-8", errors="replace") as src:
+            with _open_source(source_path) as (_, stream):
+                src = io.TextIOWrapper(stream, encoding="utf-8", errors="replace")
                 with destination_path.open("w", encoding="utf-8") as dst:
                     for line in src:
                         converted = line.replace(self.delimiter, self.output_delimiter)
@@ -193,53 +1644,87 @@ class ColumnCutter:
         except Exception as e:
             return ProcessResult(success=False, error=str(e))
 
-    def _count_lines(self, file_path: Path) -> int:
-        """Count lines in a file."""
-        try:
-            result = subprocess.run(
-                ["wc", "-l", str(file_path)],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                return int(result.stdout.strip().split()[0])
-        except Exception:
-            pass
-        return 0
-
-    def _add_header(self, file_path: Path) -> None:
-        """Add header row to a file."""
-        try:
-            header = self.output_delimiter.join(self.column_names)
-            temp_path = file_path.with_suffix(".tmp")
-
-            with file_path.open("r") as src:
-                with temp_path.open("w") as dst:
-                    dst.write(header + "\n")
-                    dst.write(src.read())
-
-            temp_path.replace(file_path)
-            logger.debug(f"Added header to {file_path}")
-        except Exception as e:
-            logger.warning(f"Failed to add header: {e}")
+    def _header_line(self) -> Optional[bytes]:
+        """Return the encoded header line, or None if no header is needed."""
+        if self.projection and not self.has_header:
+            header = self.projection.header(self.output_delimiter)
+            return header.encode("utf-8") if header else None
+        return None
 
 
 class FileSplitter:
     """Split a file by a key column into multiple files."""
 
-    def __init__(self, column_config: Dict[str, Any]):
+    def __init__(
+        self,
+        column_config: Dict[str, Any],
+        projection: Optional[ColumnProjection] = None
+    ):
         """
         Initialize the file splitter.
 
         Args:
             column_config: Configuration from column_map.yaml for the domain
+            projection: Pre-compiled projection plan (compiled from config if omitted)
         """
         self.column_config = column_config
+        self.projection = projection or ColumnProjection.from_config(column_config)
         self.delimiter = column_config.get("output_delimiter", ",")
         self.split_by_column = column_config.get("split_by_column", "gfcid")
-        self.split_by_column_index = column_config.get("split_by_column_index", 0)
+        self.split_by_column_index = (
+            self.projection.key_index if self.projection
+            else column_config.get("split_by_column_index", 0)
+        )
         self.column_names = column_config.get("column_names", [])
+        self.partitioner = SplitPartitioner.from_config(column_config)
         self.chunk_size = column_config.get("chunk_size", 50000)
+        self.max_open_files = int(column_config.get("max_open_files", DEFAULT_MAX_OPEN_FILES))
+        self.write_buffer_size = int(
+            column_config.get("write_buffer_size", DEFAULT_WRITE_BUFFER_SIZE)
+        )
+        self.partition_flush_bytes = int(
+            column_config.get("partition_flush_bytes", DEFAULT_PARTITION_FLUSH_BYTES)
+        )
+        self.memory_budget_bytes = int(
+            column_config.get("split_memory_budget_bytes", DEFAULT_SPLIT_MEMORY_BUDGET_BYTES)
+        )
+        self.output_compression, self.output_suffix = _split_output_format(column_config)
+        self.coercer = _TypeCoercer.from_config(column_config, self.projection)
+        self.external_sort = bool(column_config.get("external_sort_split", False))
+        self.sort_run_bytes = int(column_config.get("sort_run_bytes", DEFAULT_SORT_RUN_BYTES))
+        self.sort_temp_dir = column_config.get("sort_temp_dir")
+
+    def _plan_partitions(self, source_path: Path) -> None:
+        """Run the key histogram pass when the split mode needs one."""
+        if not self.partitioner.needs_histogram:
+            return
+
+        has_header = bool(self.column_names)
+        key_index = self.split_by_column_index
+        if has_header:
+            with _open_source(source_path) as (_, stream):
+                header_line = stream.readline().decode("utf-8", errors="replace")
+            header_fields = header_line.rstrip("\r\n").split(self.delimiter)
+            if self.split_by_column in header_fields:
+                key_index = header_fields.index(self.split_by_column)
+
+        histogram = _key_histogram(source_path, self.delimiter, key_index, skip_header=has_header)
+        file_count = self.partitioner.plan(histogram)
+        logger.info(f"Planned {len(histogram)} keys into {file_count} balanced files")
+
+    def _partition_buffer(self, header: Optional[str] = None) -> PartitionBuffer:
+        """Create a partition buffer over a writer pool using this splitter's limits."""
+        pool = WriterPool(
+            header=header,
+            max_open_files=self.max_open_files,
+            buffer_size=self.write_buffer_size,
+            compression=self.output_compression
+        )
+        return PartitionBuffer(
+            pool,
+            flush_bytes=self.partition_flush_bytes,
+            memory_budget_bytes=self.memory_budget_bytes
+        )
 
     def process(
         self,
@@ -269,11 +1754,30 @@ class FileSplitter:
 
             # Ensure output directory exists
             output_dir.mkdir(parents=True, exist_ok=True)
-
-            # Use pandas for chunked processing
-            output_paths = self._split_with_pandas(
-                source_path, output_dir, output_prefix, cob_date
-            )
+            self.partitioner.reset()
+            if self.coercer:
+                self.coercer.reset()
+
+            if source_path.suffix == ".parquet":
+                if not HAS_PYARROW:
+                    return ProcessResult(
+                        success=False,
+                        error="pyarrow is required to split Parquet files"
+                    )
+                # Plans balanced partitions from the key column itself
+                row_counts = self._split_parquet(source_path, output_dir, output_prefix)
+            elif self.external_sort:
+                self._plan_partitions(source_path)
+                row_counts = self._split_with_external_sort(
+                    source_path, output_dir, output_prefix
+                )
+            else:
+                self._plan_partitions(source_path)
+                # Use pandas for chunked processing
+                row_counts = self._split_with_pandas(
+                    source_path, output_dir, output_prefix, cob_date
+                )
+            output_paths = list(row_counts)
 
             if not output_paths:
                 return ProcessResult(
@@ -281,12 +1785,21 @@ class FileSplitter:
                     error="No output files generated"
                 )
 
+            if self.coercer:
+                self.coercer.report(source_path)
             logger.info(f"Split {source_path} into {len(output_paths)} files")
-            return ProcessResult(
+            result = ProcessResult(
                 success=True,
                 output_paths=output_paths,
-                rows_processed=sum(self._count_lines(p) for p in output_paths)
+                rows_processed=sum(row_counts.values()),
+                row_counts=row_counts,
+                key_column=self.split_by_column,
+                keys_by_file=self.partitioner.keys_by_file(
+                    output_dir, output_prefix, self.output_suffix
+                )
             )
+            _write_split_manifest(result, output_dir, output_prefix)
+            return result
 
         except Exception as e:
             logger.error(f"File splitting failed: {e}")
@@ -298,13 +1811,17 @@ class FileSplitter:
         output_dir: Path,
         output_prefix: str,
         cob_date: str
-    ) -> List[Path]:
-        """Split file using pandas for chunked processing."""
+    ) -> Dict[Path, int]:
+        """Split file using pandas for chunked processing.
+
+        Returns:
+            Row counts per output file, in creation order
+        """
         if not HAS_PANDAS:
             return self._split_with_csv(source_path, output_dir, output_prefix, cob_date)
 
-        output_paths = []
-        file_handles: Dict[str, Any] = {}
+        row_counts: Dict[Path, int] = {}
+        buffer = self._partition_buffer()
 
         try:
             # Determine if file has header
@@ -332,54 +1849,37 @@ class FileSplitter:
                 else:
                     split_col = chunk.columns[self.split_by_column_index]
 
-                # Group by the split column
-                for group_key, group_df in chunk.groupby(split_col):
-                    # Sanitize the group key for filename
-                    safe_key = str(group_key).replace("/", "_").replace("\\", "_")
-                    output_filename = f"{output_prefix}{safe_key}.csv"
-                    output_path = output_dir / output_filename
-
-                    # Check if we need to write header
-                    file_exists = output_path.exists()
-
-                    # Append to file
-                    group_df.to_csv(
-                        output_path,
-                        mode="a",
-                        header=not file_exists,
-                        index=False
-                    )
+                if buffer.pool.header is None:
+                    buffer.pool.header = ",".join(str(c) for c in chunk.columns) + "\n"
+
+                if self.coercer:
+                    for _, name in self.coercer.positions(list(chunk.columns)):
+                        chunk[name] = self.coercer.format_column(
+                            name, pa.array(chunk[name], type=pa.string()) if HAS_PYARROW else chunk[name]
+                        )
+
+                # Group by the output file name, resolved once per distinct key
+                # (which also records the raw keys in the partitioner)
+                keys = chunk[split_col]
+                names = {key: self.partitioner.name(key) for key in keys.unique()}
+                grouper = keys.map(names)
+
+                for part, group_df in chunk.groupby(grouper):
+                    output_path = output_dir / f"{output_prefix}{part}{self.output_suffix}"
+
+                    # Buffer the group; the pool writes the header on first flush
+                    data = group_df.to_csv(header=False, index=False)
+                    buffer.append(output_path, data.encode("utf-8"))
 
-                    if output_path not in output_paths:
-                        output_paths.append(output_path)
+                    row_counts[output_path] = row_counts.get(output_path, 0) + len(group_df)
 
-            return output_paths
+            return row_counts
 
         except Exception as e:
             logger.error(f"Pandas split failed: {e}")
             raise
         finally:
-            # Close any open file handles
-            for handle in file_handles.values():
-                try:
-                    handle.close()
-                except Exception:
-                    pass
-
-    def _count_lines(self, file_path: Path) -> int:
-        """Count lines in a file (excluding header)."""
-        try:
-            result = subprocess.run(
-                ["wc", "-l", str(file_path)],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                count = int(result.stdout.strip().split()[0])
-                return max(0, count - 1)  # Subtract header
-        except Exception:
-            pass
-        return 0
+            buffer.close()
 
     def _split_with_csv(
         self,
@@ -387,10 +1887,19 @@ class FileSplitter:
         output_dir: Path,
         output_prefix: str,
         cob_date: str
-    ) -> List[Path]:
-        """Split file using standard library csv module (fallback when pandas unavailable)."""
-        output_paths = []
-        file_handles: Dict[str, Any] = {}
+    ) -> Dict[Path, int]:
+        """Split file using standard library csv module (fallback when pandas unavailable).
+
+        Returns:
+            Row counts per output file, in creation order
+        """
+        row_counts: Dict[Path, int] = {}
+        key_paths: Dict[str, Path] = {}
+        # csv.writer terminates rows with "\r\n"; match it for the header line
+        buffer = self._partition_buffer(
+            ",".join(self.column_names) + "\r\n" if self.column_names else None
+        )
+        writers: Dict[Path, Any] = {}
 
         try:
             with source_path.open("r", newline="", encoding="utf-8", errors="replace") as f:
@@ -401,56 +1910,466 @@ class FileSplitter:
                     reader = csv.DictReader(f, delimiter=self.delimiter)
                     fieldnames = reader.fieldnames
                     split_col = self.split_by_column
+                    # Dict rows: typed fields are addressed by name
+                    typed_fields = [
+                        (name, name) for _, name in self.coercer.positions(fieldnames or [])
+                    ] if self.coercer else []
                 else:
                     reader = csv.reader(f, delimiter=self.delimiter)
                     fieldnames = None
                     split_col_idx = self.split_by_column_index
+                    typed_fields = []
 
-                for row in reader:
+                rows = self.coercer.coerce_batches(reader, typed_fields) if typed_fields else reader
+                for row in rows:
                     # Get the split key
                     if has_header:
                         key = row.get(split_col, "unknown")
                     else:
                         key = row[split_col_idx] if len(row) > split_col_idx else "unknown"
 
-                    # Sanitize key for filename
-                    safe_key = str(key).replace("/", "_").replace("\\", "_")
-                    output_filename = f"{output_prefix}{safe_key}.csv"
-                    output_path = output_dir / output_filename
+                    # Resolve the output path for this key
+                    output_path = key_paths.get(key)
+                    if output_path is None:
+                        output_path = output_dir / f"{output_prefix}{self.partitioner.name(key)}{self.output_suffix}"
+                        key_paths[key] = output_path
+                        if output_path not in writers:
+                            row_counts[output_path] = 0
+                            writers[output_path] = csv.writer(
+                                _BufferedRowWriter(buffer, output_path)
+                            )
+
+                    # Buffer the row for its partition
+                    writer = writers[output_path]
+                    if has_header:
+                        writer.writerow(row.values())
+                    else:
+                        writer.writerow(row)
+                    row_counts[output_path] += 1
 
-                    # Get or create file handle
-                    if safe_key not in file_handles:
-                        file_exists = output_path.exists()
-                        handle = output_path.open("a", newline="", encoding="utf-8")
-                        writer = csv.writer(handle)
+            buffer.flush_all()
+            if buffer.pool.reopen_count:
+                logger.info(f"Split writer pool reopened {buffer.pool.reopen_count} evicted files")
+            return row_counts
 
-                        # Write header if needed
-                        if not file_exists and self.column_names:
-                            writer.writerow(self.column_names)
+        except Exception as e:
+            logger.error(f"CSV split failed: {e}")
+            raise
+        finally:
+            buffer.close()
 
-                        file_handles[safe_key] = {"handle": handle, "writer": writer}
+    def _split_parquet(
+        self,
+        source_path: Path,
+        output_dir: Path,
+        output_prefix: str
+    ) -> Dict[Path, int]:
+        """Split a Parquet processed file, materializing CSV only for the output files.
 
-                        if output_path not in output_paths:
-                            output_paths.append(output_path)
+        Partitions are planned from the key column alone; rows are then read a
+        batch at a time and each partition's rows are encoded with
+        ``csv.writer``, quoting values only where needed like the other paths.
 
-                    # Write the row
-                    if has_header:
-                        file_handles[safe_key]["writer"].writerow(row.values())
-                    else:
-                        file_handles[safe_key]["writer"].writerow(row)
+        Returns:
+            Row counts per output file, in creation order
+        """
+        parquet_file = pq.ParquetFile(source_path)
+        names = parquet_file.schema_arrow.names
+        if self.split_by_column in names:
+            key_column = self.split_by_column
+        else:
+            key_column = names[self.split_by_column_index]
+
+        if self.partitioner.needs_histogram:
+            keys = parquet_file.read(columns=[key_column]).column(key_column)
+            metadata = parquet_file.metadata
+            row_bytes = sum(
+                metadata.row_group(i).total_byte_size for i in range(metadata.num_row_groups)
+            ) / max(1, metadata.num_rows)
+            histogram = {
+                str(item["values"]): [item["counts"], int(item["counts"] * row_bytes)]
+                for item in keys.value_counts().to_pylist()
+            }
+            file_count = self.partitioner.plan(histogram)
+            logger.info(f"Planned {len(histogram)} keys into {file_count} balanced files")
+
+        row_counts: Dict[Path, int] = {}
+        buffer = self._partition_buffer(self.delimiter.join(names) + "\n")
 
-            return output_paths
+        try:
+            for batch in parquet_file.iter_batches(batch_size=self.chunk_size):
+                # Typed columns go through the same formatter as the pandas split
+                rows = zip(*[
+                    column.to_pylist() if pa.types.is_string(column.type)
+                    else _format_typed(column)
+                    for column in batch.columns
+                ])
+                rows_by_part: Dict[str, List[Tuple[Any, ...]]] = {}
+                for key, row in zip(batch.column(key_column).to_pylist(), rows):
+                    rows_by_part.setdefault(self.partitioner.name(key), []).append(row)
+
+                for part, part_rows in rows_by_part.items():
+                    output_path = output_dir / f"{output_prefix}{part}{self.output_suffix}"
+                    data = io.StringIO()
+                    csv.writer(data, delimiter=self.delimiter, lineterminator="\n").writerows(part_rows)
+                    buffer.append(output_path, data.getvalue().encode("utf-8"))
+                    row_counts[output_path] = row_counts.get(output_path, 0) + len(part_rows)
+
+            return row_counts
 
         except Exception as e:
-            logger.error(f"CSV split failed: {e}")
+            logger.error(f"Parquet split failed: {e}")
             raise
         finally:
-            # Close all file handles
-            for data in file_handles.values():
-                try:
-                    data["handle"].close()
-                except Exception:
-                    pass
+            buffer.close()
+
+    def _split_with_external_sort(
+        self,
+        source_path: Path,
+        output_dir: Path,
+        output_prefix: str
+    ) -> Dict[Path, int]:
+        """Split file by sorting rows on their output file and key, in bounded memory.
+
+        Rows are collected into runs of about ``sort_run_bytes``, each run is
+        sorted and spilled to a temporary file, and the runs are k-way merged.
+        The merged stream visits each output file once, so every file is written
+        in a single sequential pass. Row order within a key is preserved.
+
+        Returns:
+            Row counts per output file, in creation order
+        """
+        delim = self.delimiter.encode("utf-8")
+        has_header = bool(self.column_names)
+        key_index = self.split_by_column_index
+        header: Optional[str] = None
+        typed_positions: List[Tuple[int, str]] = []
+
+        def record(line: bytes) -> Tuple[str, str, bytes]:
+            parts = line.split(delim, key_index + 1)
+            if len(parts) > key_index:
+                key = parts[key_index].rstrip(b"\r\n").decode("utf-8", errors="replace")
+            else:
+                key = "unknown"
+            return self.partitioner.name(key), key, line
+
+        sort_key = itemgetter(0, 1)
+        temp_root = self.sort_temp_dir or str(output_dir)
+
+        with tempfile.TemporaryDirectory(prefix=".split-sort-", dir=temp_root) as tmp_dir:
+            runs: List[Path] = []
+            run: List[Tuple[str, str, bytes]] = []
+            run_bytes = 0
+
+            with _open_source(source_path) as (_, src):
+                if has_header:
+                    header_line = src.readline().decode("utf-8", errors="replace")
+                    header = header_line.rstrip("\r\n") + "\n"
+                    header_fields = header_line.rstrip("\r\n").split(self.delimiter)
+                    if self.split_by_column in header_fields:
+                        key_index = header_fields.index(self.split_by_column)
+                    if self.coercer:
+                        typed_positions = self.coercer.positions(header_fields)
+
+                lines: Iterable[bytes] = src
+                if typed_positions:
+                    rows = self.coercer.coerce_batches(
+                        (
+                            line.rstrip(b"\r\n").decode("utf-8", errors="replace").split(self.delimiter)
+                            for line in src
+                        ),
+                        typed_positions
+                    )
+                    lines = (self.delimiter.join(fields).encode("utf-8") for fields in rows)
+
+                for line in lines:
+                    if not line.endswith(b"\n"):
+                        line += b"\n"
+                    run.append(record(line))
+                    run_bytes += len(line)
+                    if run_bytes >= self.sort_run_bytes:
+                        runs.append(self._spill_run(run, sort_key, tmp_dir, len(runs)))
+                        run = []
+                        run_bytes = 0
+
+            if runs:
+                if run:
+                    runs.append(self._spill_run(run, sort_key, tmp_dir, len(runs)))
+                    run = []
+                # Merge in passes so no more than max_open_files runs are open at once
+                fan_in = max(2, self.max_open_files)
+                while len(runs) > fan_in:
+                    runs = [
+                        self._merge_runs(runs[i:i + fan_in], record, sort_key, tmp_dir)
+                        for i in range(0, len(runs), fan_in)
+                    ]
+                run_files = [path.open("rb") for path in runs]
+                merged = heapq.merge(
+                    *[(record(line) for line in f) for f in run_files], key=sort_key
+                )
+            else:
+                run_files = []
+                run.sort(key=sort_key)
+                merged = iter(run)
+
+            logger.debug(f"External sort split merging {max(len(runs), 1)} runs")
+
+            row_counts: Dict[Path, int] = {}
+            # Files arrive one after another, so a single open handle suffices
+            pool = WriterPool(
+                header=header,
+                max_open_files=1,
+                buffer_size=self.write_buffer_size,
+                compression=self.output_compression
+            )
+            try:
+                current_part = None
+                handle = None
+                count = 0
+                for part, _, line in merged:
+                    if part != current_part:
+                        if current_part is not None:
+                            row_counts[output_dir / f"{output_prefix}{current_part}{self.output_suffix}"] = count
+                        current_part = part
+                        handle = pool.get(output_dir / f"{output_prefix}{part}{self.output_suffix}")
+                        count = 0
+                    handle.write(line)
+                    count += 1
+                if current_part is not None:
+                    row_counts[output_dir / f"{output_prefix}{current_part}{self.output_suffix}"] = count
+            finally:
+                pool.close()
+                for f in run_files:
+                    f.close()
+
+        return row_counts
+
+    @staticmethod
+    def _spill_run(
+        run: List[Tuple[str, str, bytes]],
+        sort_key: Callable,
+        tmp_dir: str,
+        run_number: int
+    ) -> Path:
+        """Sort a run in memory and write its lines to a temporary file."""
+        run.sort(key=sort_key)
+        path = Path(tmp_dir) / f"run{run_number:05d}"
+        with path.open("wb") as f:
+            f.writelines(line for _, _, line in run)
+        return path
+
+    @staticmethod
+    def _merge_runs(
+        runs: List[Path],
+        record: Callable[[bytes], Tuple[str, str, bytes]],
+        sort_key: Callable,
+        tmp_dir: str
+    ) -> Path:
+        """Merge sorted run files into a single sorted run file."""
+        handles = [path.open("rb") for path in runs]
+        try:
+            out_fd, out_name = tempfile.mkstemp(prefix="merge", dir=tmp_dir)
+            with os.fdopen(out_fd, "wb") as out:
+                for _, _, line in heapq.merge(
+                    *[(record(line) for line in f) for f in handles], key=sort_key
+                ):
+                    out.write(line)
+        finally:
+            for f in handles:
+                f.close()
+        for path in runs:
+            path.unlink()
+        return Path(out_name)
+
+
+class StreamingCutSplitter:
+    """Cut columns and split by key column in a single pass over the source.
+
+    The raw delimited source is read once; each row is projected onto
+    ``required_columns_by_index`` and appended straight to its per-key output
+    file, so no intermediate processed file is written to disk.
+    """
+
+    def __init__(
+        self,
+        column_config: Dict[str, Any],
+        projection: Optional[ColumnProjection] = None
+    ):
+        """
+        Initialize the streaming cut+split engine.
+
+        Args:
+            column_config: Configuration from column_map.yaml for the domain
+            projection: Pre-compiled projection plan (compiled from config if omitted)
+        """
+        self.column_config = column_config
+        self.delimiter = column_config.get("delimiter", "\x01")
+        self.output_delimiter = column_config.get("output_delimiter", ",")
+        self.has_header = column_config.get("has_header", False)
+        self.column_names = column_config.get("column_names", [])
+        self.split_by_column = column_config.get("split_by_column", "gfcid")
+        self.split_by_column_index = column_config.get("split_by_column_index", 0)
+        self.partitioner = SplitPartitioner.from_config(column_config)
+        self.output_compression, self.output_suffix = _split_output_format(column_config)
+        self.projection = projection or ColumnProjection.from_config(column_config)
+        self.max_open_files = int(column_config.get("max_open_files", DEFAULT_MAX_OPEN_FILES))
+        self.write_buffer_size = int(
+            column_config.get("write_buffer_size", DEFAULT_WRITE_BUFFER_SIZE)
+        )
+        self.partition_flush_bytes = int(
+            column_config.get("partition_flush_bytes", DEFAULT_PARTITION_FLUSH_BYTES)
+        )
+        self.memory_budget_bytes = int(
+            column_config.get("split_memory_budget_bytes", DEFAULT_SPLIT_MEMORY_BUDGET_BYTES)
+        )
+        self.coercer = _TypeCoercer.from_config(column_config, self.projection)
+
+    def _key_index(self) -> int:
+        """Return the position of the split key within the projected row."""
+        if self.projection:
+            return self.projection.key_index
+        if self.column_names and self.split_by_column in self.column_names:
+            return self.column_names.index(self.split_by_column)
+        return self.split_by_column_index
+
+    def process(
+        self,
+        source_path: Path,
+        output_dir: Path,
+        output_prefix: str,
+        cob_date: str
+    ) -> ProcessResult:
+        """
+        Cut columns from the source and split rows by key column.
+
+        Args:
+            source_path: Path to the raw source file
+            output_dir: Directory for output files
+            output_prefix: Prefix for output filenames
+            cob_date: COB date for filename
+
+        Returns:
+            ProcessResult with list of output files
+        """
+        if not source_path.exists():
+            return ProcessResult(
+                success=False,
+                error=f"Source file not found: {source_path}"
+            )
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        col_indices = self.projection.indices if self.projection else None
+        # Columns after the last projected one are left unsplit (-1: split all)
+        max_split = self.projection.max_index + 1 if self.projection else -1
+        key_index = self._key_index()
+        self.partitioner.reset()
+        if self.partitioner.needs_histogram:
+            # Histogram the raw source on the key's source column
+            raw_key_index = col_indices[key_index] if col_indices is not None else key_index
+            histogram = _key_histogram(
+                source_path, self.delimiter, raw_key_index, skip_header=self.has_header
+            )
+            file_count = self.partitioner.plan(histogram)
+            logger.info(f"Planned {len(histogram)} keys into {file_count} balanced files")
+
+        # Like ColumnCutter: a source header is projected, otherwise column names are used
+        header = (
+            self.output_delimiter.join(self.column_names) + "\n"
+            if self.column_names and not self.has_header else None
+        )
+
+        row_counts: Dict[Path, int] = {}
+        key_paths: Dict[str, Path] = {}
+        buffer = PartitionBuffer(
+            WriterPool(
+                header=header,
+                max_open_files=self.max_open_files,
+                buffer_size=self.write_buffer_size,
+                compression=self.output_compression
+            ),
+            flush_bytes=self.partition_flush_bytes,
+            memory_budget_bytes=self.memory_budget_bytes
+        )
+        out_delim = self.output_delimiter
+        row_count = 0
+        coercer = self.coercer
+        typed_positions: List[Tuple[int, str]] = []
+        if coercer:
+            coercer.reset()
+            if not self.has_header:
+                typed_positions = coercer.positions(self.column_names)
+
+        try:
+            try:
+                with _open_source(source_path) as (_, stream):
+                    src = io.TextIOWrapper(stream, encoding="utf-8", errors="replace")
+                    if self.has_header:
+                        fields = src.readline().rstrip("\n\r").split(self.delimiter, max_split)
+                        if col_indices is not None:
+                            fields = [fields[i] if i < len(fields) else "" for i in col_indices]
+                        buffer.pool.header = out_delim.join(fields) + "\n"
+                        if coercer:
+                            typed_positions = coercer.positions(fields)
+
+                    def projected_rows() -> Iterator[List[str]]:
+                        for line in src:
+                            fields = line.rstrip("\n\r").split(self.delimiter, max_split)
+                            if col_indices is not None:
+                                fields = [fields[i] if i < len(fields) else "" for i in col_indices]
+                            yield fields
+
+                    rows = projected_rows()
+                    if typed_positions:
+                        rows = coercer.coerce_batches(rows, typed_positions)
+
+                    for fields in rows:
+                        key = fields[key_index] if key_index < len(fields) else "unknown"
+
+                        output_path = key_paths.get(key)
+                        if output_path is None:
+                            output_path = output_dir / f"{output_prefix}{self.partitioner.name(key)}{self.output_suffix}"
+                            key_paths[key] = output_path
+                            row_counts.setdefault(output_path, 0)
+
+                        buffer.append(output_path, (out_delim.join(fields) + "\n").encode("utf-8"))
+                        row_counts[output_path] += 1
+                        row_count += 1
+            finally:
+                buffer.close()
+
+        except Exception as e:
+            logger.error(f"Streaming cut+split failed: {e}")
+            return ProcessResult(success=False, error=str(e))
+
+        output_paths = list(row_counts)
+        if not output_paths:
+            return ProcessResult(
+                success=False,
+                error="No output files generated"
+            )
+
+        if coercer:
+            coercer.report(source_path)
+        logger.info(
+            f"Cut and split {source_path} into {len(output_paths)} files in one pass "
+            f"({row_count} rows)"
+        )
+        result = ProcessResult(
+            success=True,
+            output_paths=output_paths,
+            rows_processed=row_count,
+            row_counts=row_counts,
+            key_column=self.split_by_column,
+            keys_by_file=self.partitioner.keys_by_file(
+                output_dir, output_prefix, self.output_suffix
+            )
+        )
+        try:
+            _write_split_manifest(result, output_dir, output_prefix)
+        except OSError as e:
+            return ProcessResult(success=False, error=f"Failed to write split manifest: {e}")
+        return result
 
 
 class DataProcessor:
@@ -459,25 +2378,35 @@ class DataProcessor:
     # Default dropbox directory (can be overridden via settings)
     DEFAULT_DROPBOX_DIR = "/mnt/nas"
 
-    def __init__(self, column_config: Dict[str, Any], dropbox_dir: Optional[str] = None):
+    def __init__(
+        self,
+        column_config: Dict[str, Any],
+        dropbox_dir: Optional[str] = None,
+        projection: Optional[ColumnProjection] = None
+    ):
         """
         Initialize the data processor.
 
         Args:
             column_config: Configuration from column_map.yaml for the domain
             dropbox_dir: Base directory for output files (default: /mnt/nas)
+            projection: Pre-compiled projection plan shared by all stages
         """
         self.column_config = column_config
         self.dropbox_dir = dropbox_dir or self.DEFAULT_DROPBOX_DIR
-        self.cutter = ColumnCutter(column_config)
-        self.splitter = FileSplitter(column_config)
+        self.projection = projection or ColumnProjection.from_config(column_config)
+        self.cutter = ColumnCutter(column_config, self.projection)
+        self.splitter = FileSplitter(column_config, self.projection)
+        self.fused_splitter = StreamingCutSplitter(column_config, self.projection)
+        self.fused_cut_split = column_config.get("fused_cut_split", False)
 
     def process_file(
         self,
         source_path: Path,
         cob_date: str,
         skip_cut: bool = False,
-        skip_split: bool = False
+        skip_split: bool = False,
+        progress_callback: Optional[ProgressCallback] = None
     ) -> Dict[str, ProcessResult]:
         """
         Process a file through the full pipeline.
@@ -487,6 +2416,7 @@ class DataProcessor:
             cob_date: COB date for output paths
             skip_cut: Skip the column cutting step
             skip_split: Skip the file splitting step
+            progress_callback: Optional cut progress callback (bytes_read, total_bytes)
 
         Returns:
             Dictionary of results for each step
@@ -516,10 +2446,28 @@ class DataProcessor:
 
         current_file = source_path
 
+        # Fused mode: cut and split in a single pass, no intermediate file
+        if self.fused_cut_split and not skip_cut and not skip_split:
+            fused_result = self.fused_splitter.process(
+                current_file, split_dir, split_prefix, cob_date
+            )
+            results["cut"] = ProcessResult(
+                success=fused_result.success,
+                error=fused_result.error,
+                rows_processed=fused_result.rows_processed
+            )
+            if fused_result.success:
+                results["split"] = fused_result
+            return results
+
         # Step 1: Cut columns
         if not skip_cut:
             cut_output = processed_dir / processed_file
-            results["cut"] = self.cutter.process(current_file, cut_output)
+            if self.cutter.writes_parquet:
+                cut_output = cut_output.with_suffix(".parquet")
+            results["cut"] = self.cutter.process(
+                current_file, cut_output, progress_callback
+            )
             if not results["cut"].success:
                 return results
             current_file = cut_output
@@ -0,0 +1,7 @@
+"""Shared pytest configuration: make the ``app`` package importable."""
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
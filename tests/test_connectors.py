@@ -0,0 +1,282 @@
+"""Tests for the connectors and configuration resolvers."""
+import errno
+import gzip
+import os
+import subprocess
+from pathlib import Path
+
+import yaml
+
+from app.services import connectors
+from app.services.processors import ColumnProjection
+from app.services.connectors import (
+    ColumnMapResolver,
+    ConnectorConfig,
+    FetchCache,
+    LinuxConnector,
+    SFTPConnector,
+    SourceStat,
+)
+
+
+def _write_column_map(path: Path, domains) -> Path:
+    path.write_text(yaml.safe_dump({"domains": domains}), encoding="utf-8")
+    return path
+
+
+def test_column_map_resolver_compiles_projection_once_per_domain(tmp_path):
+    column_map = _write_column_map(tmp_path / "column_map.yaml", {
+        "trades": {
+            "required_columns_by_index": "9,2,4-6,5",
+            "column_names": ["gfcid", "a", "b", "c", "d"],
+            "split_by_column": "c",
+        },
+    })
+    resolver = ColumnMapResolver(column_map)
+
+    projection = resolver.get_projection("trades")
+
+    assert projection.indices == (1, 3, 4, 5, 8)
+    assert projection.ranges == ((1, 1), (3, 5), (8, 8))
+    assert projection.cut_fields == "2,4-6,9"
+    assert projection.max_index == 8
+    assert projection.key_index == 3
+    assert resolver.get_projection("trades") is projection
+    assert resolver.get_projection("missing") is None
+
+
+def _linux_connector(**params) -> LinuxConnector:
+    return LinuxConnector(ConnectorConfig(connector_type="linux", params=params), {})
+
+
+def test_linux_resume_never_appends_to_a_hardlinked_source(tmp_path):
+    source = tmp_path / "source.dat"
+    source.write_bytes(b"0123456789")
+    destination = tmp_path / "dropbox" / "source.dat"
+    connector = _linux_connector()
+
+    fetched = connector.fetch(str(source), destination)
+    assert fetched.method == "hardlink" and os.path.samefile(source, destination)
+
+    resumed = connector.fetch_from(str(source), destination, 4)
+
+    assert resumed.success
+    assert source.read_bytes() == b"0123456789"
+    assert destination.read_bytes() == b"0123456789"
+
+
+def test_copy_fallback_does_not_write_through_an_existing_hardlink(tmp_path, monkeypatch):
+    other = tmp_path / "yesterday.dat"
+    other.write_bytes(b"yesterday")
+    destination = tmp_path / "dropbox.dat"
+    os.link(other, destination)
+    source = tmp_path / "today.dat"
+    source.write_bytes(b"today's data")
+
+    def no_hardlink(src, dst):
+        raise OSError(errno.EXDEV, "cross-device link")
+
+    monkeypatch.setattr(connectors, "_hardlink", no_hardlink)
+    method = connectors._link_or_copy(source, destination)
+
+    assert method != "hardlink"
+    assert destination.read_bytes() == b"today's data"
+    assert other.read_bytes() == b"yesterday"
+    assert not list(tmp_path.glob(".*.fetch"))
+
+
+def test_fetch_cache_skips_unchanged_sources_and_resumes_partial_fetches(tmp_path):
+    destination = tmp_path / "source.dat"
+    stat = SourceStat(size=10, mtime=1000.0, checksum="abc")
+    cache = FetchCache(destination)
+
+    cache.mark_started("/src/source.dat", stat)
+    destination.write_bytes(b"0123")
+    assert not cache.is_current("/src/source.dat", stat)
+    assert cache.resume_offset("/src/source.dat", stat) == 4
+    assert cache.resume_offset("/src/source.dat", SourceStat(size=10, mtime=2000.0)) == 0
+
+    destination.write_bytes(b"0123456789")
+    cache.mark_complete("/src/source.dat", stat)
+    assert cache.is_current("/src/source.dat", stat)
+    assert cache.resume_offset("/src/source.dat", stat) == 0
+    assert not cache.is_current("/src/other.dat", stat)
+    assert not cache.is_current("/src/source.dat", SourceStat(size=11, mtime=1000.0))
+    assert not cache.is_current("/src/source.dat", SourceStat(size=10, mtime=1000.0, checksum="def"))
+    assert not FetchCache(destination, variant="projection").is_current("/src/source.dat", stat)
+
+    destination.write_bytes(b"01234")
+    assert not cache.is_current("/src/source.dat", stat)
+
+
+class _LocalSFTPFile:
+    def __init__(self, path, calls):
+        self._file = open(path, "rb")
+        self._calls = calls
+
+    def readv(self, chunks, max_concurrent_prefetch_requests=None):
+        self._calls.append((list(chunks), max_concurrent_prefetch_requests))
+        for offset, length in chunks:
+            self._file.seek(offset)
+            yield self._file.read(length)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._file.close()
+
+
+class LocalSFTPClient:
+    """Serves paths on the local filesystem through the SFTPClient calls the connector uses."""
+
+    def __init__(self, readv_calls):
+        self.readv_calls = readv_calls
+
+    def stat(self, path):
+        return os.stat(path)
+
+    def open(self, path, mode="r"):
+        return _LocalSFTPFile(path, self.readv_calls)
+
+    def close(self):
+        pass
+
+
+def _sftp_connector(readv_calls, **params):
+    config = ConnectorConfig(connector_type="sftp", server_name="etl-01", params=params)
+    return SFTPConnector(config, {}, sftp_factory=lambda: LocalSFTPClient(readv_calls))
+
+
+def test_sftp_fetch_downloads_ranges_with_bounded_readv(tmp_path):
+    source = tmp_path / "source.dat"
+    payload = os.urandom(5 * connectors.SFTP_REQUEST_SIZE + 123)
+    source.write_bytes(payload)
+    calls = []
+    connector = _sftp_connector(
+        calls, sftp_parallel_parts=3, sftp_parallel_min_bytes=1, sftp_max_requests=4
+    )
+
+    result = connector.fetch(str(source), tmp_path / "out" / "source.dat")
+
+    assert result.success and result.method == "sftp"
+    assert result.bytes_transferred == len(payload)
+    assert (tmp_path / "out" / "source.dat").read_bytes() == payload
+    assert len(calls) == 3
+    assert {limit for _, limit in calls} == {4}
+    requested = sorted(chunk for chunks, _ in calls for chunk in chunks)
+    assert all(length <= connectors.SFTP_REQUEST_SIZE for _, length in requested)
+    assert sum(length for _, length in requested) == len(payload)
+
+
+def test_sftp_resume_appends_remaining_bytes_sequentially(tmp_path):
+    source = tmp_path / "source.dat"
+    payload = os.urandom(3 * connectors.SFTP_REQUEST_SIZE)
+    source.write_bytes(payload)
+    destination = tmp_path / "out.dat"
+    destination.write_bytes(payload[:1000] + b"stale tail")
+    calls = []
+    connector = _sftp_connector(calls, sftp_parallel_parts=4, sftp_parallel_min_bytes=1 << 40)
+
+    result = connector.fetch_from(str(source), destination, 1000)
+
+    assert result.success and result.method == "resume"
+    assert result.bytes_transferred == len(payload) - 1000
+    assert destination.read_bytes() == payload
+    assert len(calls) == 1
+    assert calls[0][0][0][0] == 1000
+    assert calls[0][1] == connectors.DEFAULT_SFTP_MAX_REQUESTS
+
+
+def test_sftp_stat_checksums_on_the_source_host_when_requested(tmp_path, monkeypatch):
+    source = tmp_path / "source.dat"
+    source.write_bytes(b"0123456789")
+    commands = []
+
+    def stream_command(self, command, sink):
+        commands.append(command)
+        sink(b"84d89877f0d4041efb6bf91a16f0248f2fd573e6af05c19f96bedb9f882f7882  ")
+        sink(str(source).encode() + b"\n")
+        return 0, ""
+
+    monkeypatch.setattr(SFTPConnector, "_stream_command", stream_command)
+
+    plain = _sftp_connector([]).stat(str(source))
+    checked = _sftp_connector([], fetch_checksum=True).stat(str(source))
+
+    assert plain.size == checked.size == 10
+    assert plain.checksum is None
+    assert checked.checksum == "84d89877f0d4041efb6bf91a16f0248f2fd573e6af05c19f96bedb9f882f7882"
+    assert commands == [f"sha256sum -- {source}"]
+
+
+def test_sftp_stat_falls_back_to_size_and_mtime_when_checksum_fails(tmp_path, monkeypatch):
+    source = tmp_path / "source.dat"
+    source.write_bytes(b"0123456789")
+    monkeypatch.setattr(
+        SFTPConnector, "_stream_command", lambda self, command, sink: (127, "sha256sum: not found")
+    )
+
+    stat = _sftp_connector([], fetch_checksum=True).stat(str(source))
+
+    assert stat.size == 10 and stat.checksum is None
+
+
+def _run_locally(self, command, sink):
+    """Stand in for the source host by running the remote command in a local shell."""
+    result = subprocess.run(["sh", "-c", command], capture_output=True)
+    sink(result.stdout)
+    return result.returncode, result.stderr.decode()
+
+
+PROJECTION = ColumnProjection.from_config({
+    "required_columns_by_index": "4,1-2",
+    "column_names": ["gfcid", "amount", "name"],
+})
+
+
+def test_remote_projection_command_quotes_paths_and_control_delimiters():
+    command = connectors._remote_projection_command(
+        "/data/in bound/trades.dat.gz", PROJECTION, compress=True
+    )
+
+    assert command == (
+        "gzip -dc -- '/data/in bound/trades.dat.gz' "
+        "| cut -d \"$(printf '\\001')\" -f 1-2,4 "
+        "| tr \"$(printf '\\001')\" , "
+        "| gzip -c -1"
+    )
+
+
+def test_fetch_projected_matches_a_local_cut(tmp_path, monkeypatch):
+    rows = [["G1", "10", "x", "alpha", "z"], ["G2", "20", "y", "beta", "z"]]
+    text = "".join("\x01".join(row) + "\n" for row in rows)
+    (tmp_path / "plain.dat").write_text(text)
+    with gzip.open(tmp_path / "packed.dat.gz", "wt") as f:
+        f.write(text)
+    monkeypatch.setattr(SFTPConnector, "_stream_command", _run_locally)
+    connector = _sftp_connector([])
+    connector.server_settings = {"user": "loader"}
+
+    for name, compress in (("plain.dat", False), ("packed.dat.gz", True)):
+        destination = tmp_path / "out" / f"{name}.csv"
+        result = connector.fetch_projected(
+            str(tmp_path / name), destination, PROJECTION,
+            header=b"gfcid,amount,name\n", compress=compress
+        )
+
+        assert result.success and result.method == "remote_projection"
+        assert destination.read_text() == "gfcid,amount,name\nG1,10,alpha\nG2,20,beta\n"
+
+
+def test_fetch_projected_reports_remote_errors(tmp_path, monkeypatch):
+    monkeypatch.setattr(SFTPConnector, "_stream_command", _run_locally)
+    connector = _sftp_connector([])
+    connector.server_settings = {"user": "loader"}
+
+    result = connector.fetch_projected(
+        str(tmp_path / "missing.dat"), tmp_path / "out.csv", PROJECTION
+    )
+
+    assert not result.success
+    assert "Remote projection failed" in result.error
@@ -0,0 +1,100 @@
+"""Tests for the Cypher query registry."""
+import os
+import re
+
+import pytest
+
+from app.services.cypher_registry import (
+    CYPHER_DIR,
+    CypherRegistry,
+    parse_cypher_file,
+    split_statements,
+)
+
+
+def test_split_statements_ignores_semicolons_in_strings_and_comments():
+    text = (
+        "// header comment; not a statement\n"
+        "MATCH (n {name: 'a;b'}) /* inline; comment */ RETURN n;\n"
+        "\n"
+        "CALL apoc.periodic.iterate(\"MATCH (n) RETURN n\", \"SET n.x = ';'\", {});\n"
+        ";\n"
+    )
+
+    assert split_statements(text) == [
+        "MATCH (n {name: 'a;b'})  RETURN n",
+        "CALL apoc.periodic.iterate(\"MATCH (n) RETURN n\", \"SET n.x = ';'\", {})",
+    ]
+
+
+@pytest.mark.parametrize("text, message", [
+    ("MATCH (n RETURN n;", "unclosed '('"),
+    ("MATCH (n)] RETURN n;", "unbalanced ']'"),
+    ("RETURN 'open;", "unterminated ' quote"),
+    ("RETURN 1 /* open", "unterminated /* comment"),
+])
+def test_malformed_files_are_rejected(tmp_path, text, message):
+    path = tmp_path / "bad.cql"
+    path.write_text(text, encoding="utf-8")
+
+    with pytest.raises(ValueError, match=re.escape(message)):
+        parse_cypher_file(path)
+
+
+def test_templates_only_allow_known_placeholders(tmp_path):
+    path = tmp_path / "load.cql"
+    path.write_text("LOAD CSV FROM 'file://{file_name}' AS row MERGE (n {{id: row[0]}})", "utf-8")
+
+    query = parse_cypher_file(path, ("file_name",))
+    assert query.is_template
+    assert query.text.format(file_name="/x.csv") == (
+        "LOAD CSV FROM 'file:///x.csv' AS row MERGE (n {id: row[0]})"
+    )
+
+    path.write_text("LOAD CSV FROM '{file_name}' AS row RETURN {limit}", "utf-8")
+    with pytest.raises(ValueError, match="unknown placeholder"):
+        parse_cypher_file(path, ("file_name",))
+
+
+def test_load_reports_every_invalid_file(tmp_path):
+    (tmp_path / "a.cql").write_text("RETURN (1;", "utf-8")
+    (tmp_path / "b.cql").write_text("RETURN 1;", "utf-8")
+    (tmp_path / "c.cql").write_text("RETURN [1;", "utf-8")
+
+    with pytest.raises(ValueError) as excinfo:
+        CypherRegistry(tmp_path, templates={}).load()
+
+    assert "a.cql" in str(excinfo.value) and "c.cql" in str(excinfo.value)
+    assert "b.cql" not in str(excinfo.value)
+
+
+def _touch_later(path, seconds):
+    mtime = path.stat().st_mtime + seconds
+    os.utime(path, (mtime, mtime))
+
+
+def test_reload_picks_up_changes_and_keeps_last_good_version(tmp_path):
+    path = tmp_path / "query.cql"
+    path.write_text("RETURN 1;", "utf-8")
+    registry = CypherRegistry(tmp_path, templates={}, reload_check_seconds=0).load()
+    assert registry.statements("query.cql") == ("RETURN 1",)
+
+    path.write_text("RETURN 2;\nRETURN 3;", "utf-8")
+    _touch_later(path, 1)
+    assert registry.statements("query.cql") == ("RETURN 2", "RETURN 3")
+
+    path.write_text("RETURN (4;", "utf-8")
+    _touch_later(path, 2)
+    assert registry.statements("query.cql") == ("RETURN 2", "RETURN 3")
+
+    (tmp_path / "added.cql").write_text("RETURN 5;", "utf-8")
+    path.unlink()
+    assert registry.names() == ["added.cql"]
+    assert registry.get("query.cql") is None
+
+
+def test_shipped_cypher_files_are_valid():
+    registry = CypherRegistry(CYPHER_DIR).load()
+
+    assert "cypher_00_load_transactions.cql" in registry.names()
+    assert registry.get("cypher_00_load_transactions.cql").is_template
@@ -0,0 +1,81 @@
+"""Tests for the import pipeline, run end to end on local files."""
+import csv
+import gzip
+import json
+import subprocess
+from datetime import date
+from pathlib import Path
+
+import yaml
+
+from app.services.connectors import (
+    ColumnMapResolver,
+    DataMapResolver,
+    SettingsLoader,
+    SFTPConnector,
+)
+from app.services.import_pipeline import ImportPipeline, ImportRequest, WorkflowStatus
+
+DELIM = "\x01"
+
+
+def _run_locally(self, command, sink):
+    """Stand in for the source host by running the remote command in a local shell."""
+    result = subprocess.run(["sh", "-c", command], capture_output=True)
+    sink(result.stdout)
+    return result.returncode, result.stderr.decode()
+
+
+def _pipeline(tmp_path: Path, source_template: str, connector_params) -> ImportPipeline:
+    data_map = tmp_path / "data_map.csv"
+    with data_map.open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow([
+            "domain_type", "domain_name", "connector_type", "connector_params",
+            "source_file_path_template",
+        ])
+        writer.writerow(["CURATED", "trades", "sftp", json.dumps(connector_params), source_template])
+
+    column_map = tmp_path / "column_map.yaml"
+    column_map.write_text(yaml.safe_dump({"domains": {"trades": {
+        "delimiter": DELIM,
+        "required_columns_by_index": "3,1",
+        "column_names": ["gfcid", "amount"],
+        "split_by_column": "gfcid",
+    }}}), encoding="utf-8")
+
+    settings = tmp_path / "settings.yaml"
+    settings.write_text(yaml.safe_dump({
+        "DROPBOX_DIR": str(tmp_path / "dropbox"),
+        "LINUX_SERVERS": {"etl": {"user": "loader"}},
+    }), encoding="utf-8")
+
+    return ImportPipeline(
+        data_map_resolver=DataMapResolver(data_map),
+        column_map_resolver=ColumnMapResolver(column_map),
+        settings_loader=SettingsLoader(settings),
+    )
+
+
+def test_remote_projection_of_a_gzipped_source_is_split_as_plain_csv(tmp_path, monkeypatch):
+    monkeypatch.setattr(SFTPConnector, "_stream_command", _run_locally)
+    rows = [["1.5", "x", "G1"], ["2.5", "y", "G2"], ["3.5", "z", "G1"]]
+    with gzip.open(tmp_path / "trades_20240131.dat.gz", "wt", encoding="utf-8") as handle:
+        handle.writelines(DELIM.join(row) + "\n" for row in rows)
+
+    for compress in (False, True):
+        pipeline = _pipeline(tmp_path, str(tmp_path / "trades_{cob_date}.dat.gz"), {
+            "server_name": "etl",
+            "remote_projection": True,
+            "remote_projection_compress": compress,
+            "fetch_cache": False,
+        })
+
+        state = pipeline.run(ImportRequest("CURATED", "trades", date(2024, 1, 31)), skip_load=True)
+
+        assert state.status == WorkflowStatus.COMPLETED, state.message
+        assert state.metrics["fetch_method"] == "remote_projection"
+        fetched = Path(state.files_created[0])
+        assert fetched.name == "trades_20240131.csv"
+        assert fetched.read_text(encoding="utf-8").splitlines()[0] == "gfcid,amount"
+        assert state.metrics["rows_after_split"] == 3
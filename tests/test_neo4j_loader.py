@@ -0,0 +1,297 @@
+"""Tests for the Neo4j loader, run against an in-memory stand-in driver."""
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from neo4j.exceptions import TransientError
+
+from app.services.neo4j_loader import Neo4jLoader
+from app.services.processors import SplitManifest
+
+LOAD_CSV_FILE = re.compile(r"file://(\S+?)'")
+
+
+class FakeDriver:
+    """Records every query; ``on_run`` may raise or block to simulate the server."""
+
+    def __init__(self, on_run=None):
+        self.on_run = on_run
+        self.queries = []
+        self.lock = threading.Lock()
+
+    def session(self, database=None):
+        return FakeSession(self)
+
+    def verify_connectivity(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def run(self, query, **parameters):
+        with self.driver.lock:
+            self.driver.queries.append((query, parameters))
+        if self.driver.on_run is not None:
+            self.driver.on_run(query, parameters)
+        rows = len(parameters.get("rows", ())) or 1
+        counters = SimpleNamespace(nodes_created=rows, relationships_created=rows)
+        return SimpleNamespace(consume=lambda: SimpleNamespace(counters=counters))
+
+
+def _loader(driver, **kwargs):
+    kwargs.setdefault("retry_backoff_seconds", 0)
+    return Neo4jLoader("bolt://stub", "neo4j", "secret", "test", driver=driver, **kwargs)
+
+
+def _write_split(path, gfcids):
+    lines = ["transaction_id,gfcid,cob_date"]
+    lines += [f"T{path.stem}{n},{gfcid},2024-01-31" for n, gfcid in enumerate(gfcids)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def _loaded_files(driver):
+    return [
+        match.group(1)
+        for query, _ in driver.queries
+        for match in [LOAD_CSV_FILE.search(query)]
+        if match
+    ]
+
+
+def test_parallel_load_runs_every_file_once_and_sums_counters(tmp_path):
+    files = [_write_split(tmp_path / f"part_{n}.csv", [f"G{n}"]) for n in range(6)]
+    driver = FakeDriver()
+
+    result = _loader(driver, load_workers=3).load_files(files, parallel=True)
+
+    assert result.success
+    assert result.files_loaded == 6
+    assert result.nodes_created == result.relationships_created == 6
+    assert sorted(_loaded_files(driver)) == sorted(str(path) for path in files)
+
+
+def test_transient_errors_are_retried_until_max_retries(tmp_path):
+    flaky = _write_split(tmp_path / "flaky.csv", ["G1"])
+    broken = _write_split(tmp_path / "broken.csv", ["G2"])
+    failures = {str(flaky): 2, str(broken): 10}
+
+    def on_run(query, parameters):
+        match = LOAD_CSV_FILE.search(query)
+        if match and failures[match.group(1)] > 0:
+            failures[match.group(1)] -= 1
+            raise TransientError("DeadlockDetected")
+
+    driver = FakeDriver(on_run)
+    result = _loader(driver, max_retries=3).load_files([flaky, broken], parallel=True)
+
+    assert not result.success
+    assert result.files_loaded == 1
+    assert result.failed_files == [str(broken)]
+    assert _loaded_files(driver).count(str(flaky)) == 3
+    assert _loaded_files(driver).count(str(broken)) == 4
+
+
+def test_files_sharing_a_gfcid_never_load_at_the_same_time(tmp_path):
+    keys = {
+        "a": ["G1", "G2"], "b": ["G2"], "c": ["G3"], "d": ["G1", "G4"],
+        "e": ["G5"], "f": ["G3", "G5"], "g": ["G6"],
+    }
+    files = {_write_split(tmp_path / f"{name}.csv", gfcids): gfcids for name, gfcids in keys.items()}
+    keys_by_file = {str(path): set(gfcids) for path, gfcids in files.items()}
+    active = {}
+    overlaps = []
+    peak = 0
+    lock = threading.Lock()
+
+    def on_run(query, parameters):
+        nonlocal peak
+        match = LOAD_CSV_FILE.search(query)
+        if not match:
+            return
+        name = match.group(1)
+        with lock:
+            overlaps.extend(
+                (name, other) for other, held in active.items() if held & keys_by_file[name]
+            )
+            active[name] = keys_by_file[name]
+            peak = max(peak, len(active))
+        time.sleep(0.02)
+        with lock:
+            del active[name]
+
+    driver = FakeDriver(on_run)
+    result = _loader(driver, load_workers=4).load_files(list(files), parallel=True)
+
+    assert result.success and result.files_loaded == len(files)
+    assert overlaps == []
+    assert peak > 1
+
+
+def test_held_back_files_start_as_soon_as_their_gfcids_are_released(tmp_path):
+    keys = {"a": ["G1"], "b": ["G1"], "c": ["G2"], "d": ["G3"], "e": ["G2", "G4"]}
+    files = [_write_split(tmp_path / f"{name}.csv", gfcids) for name, gfcids in keys.items()]
+    release = {str(path): threading.Event() for path in files}
+    started = []
+
+    def on_run(query, parameters):
+        match = LOAD_CSV_FILE.search(query)
+        if match:
+            started.append(Path(match.group(1)).stem)
+            assert release[match.group(1)].wait(5)
+
+    driver = FakeDriver(on_run)
+    loader = _loader(driver)
+
+    def finish(name):
+        release[str(tmp_path / f"{name}.csv")].set()
+
+    def wait_for(count):
+        deadline = time.monotonic() + 5
+        while len(started) < count and time.monotonic() < deadline:
+            time.sleep(0.005)
+        return list(started)
+
+    outcome = {}
+    runner = threading.Thread(target=lambda: outcome.update(
+        result=loader._load_parallel(files, 2, None, [set(gfcids) for gfcids in keys.values()])
+    ))
+    runner.start()
+
+    assert wait_for(2) == ["a", "c"]
+    finish("a")
+    # b waited on G1 and goes ahead of d, which was queued after it
+    assert wait_for(3) == ["a", "c", "b"]
+    finish("c")
+    assert wait_for(4) == ["a", "c", "b", "d"]
+    for name in ("b", "d"):
+        finish(name)
+    assert wait_for(5) == ["a", "c", "b", "d", "e"]
+    finish("e")
+    runner.join(5)
+
+    assert [result.success for result in outcome["result"]] == [True] * 5
+
+
+def _clauses_after_row_source(text):
+    lines = [line.strip() for line in text.splitlines()]
+    start = next(n for n, line in enumerate(lines) if line.startswith("WITH row WHERE"))
+    return [line for line in lines[start:] if not line.startswith("}")]
+
+
+def test_unwind_query_matches_the_load_csv_template():
+    registry = _loader(FakeDriver()).cypher_registry
+    load_csv = registry.get("cypher_00_load_transactions.cql").text.format(file_name="/x.csv")
+    unwind = registry.get("cypher_00_unwind_transactions.cql").text
+
+    assert "LOAD CSV" in load_csv and unwind.startswith("UNWIND $rows AS row")
+    assert _clauses_after_row_source(unwind) == _clauses_after_row_source(load_csv)
+
+
+def test_unwind_mode_commits_batches_of_a_file_in_order_one_at_a_time(tmp_path):
+    split = tmp_path / "part.csv"
+    split.write_text(
+        "transaction_id,gfcid,mtm_usd_amount,obligor_name\n"
+        "T1,G1,1.5,Acme\nT2,G1,,Acme\nT3,G1,oops,\nT4,G2,4,Beta\nT5,G2,5,Beta\n",
+        encoding="utf-8",
+    )
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def on_run(query, parameters):
+        nonlocal running, peak
+        if "rows" not in parameters:
+            return
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    driver = FakeDriver(on_run)
+    loader = _loader(driver, load_mode="unwind", unwind_batch_size=2)
+
+    result = loader.load_file(split, column_types={"mtm_usd_amount": "float64"})
+
+    batches = [parameters["rows"] for _, parameters in driver.queries if "rows" in parameters]
+    assert result.success and result.nodes_created == 5
+    assert [[row["transaction_id"] for row in batch] for batch in batches] == [
+        ["T1", "T2"], ["T3", "T4"], ["T5"]
+    ]
+    assert [row["mtm_usd_amount"] for batch in batches for row in batch] == [1.5, None, None, 4.0, 5.0]
+    assert batches[1][0]["obligor_name"] is None
+    assert peak == 1
+
+
+def test_load_files_reads_gfcids_from_the_split_manifest(tmp_path, monkeypatch):
+    files = [_write_split(tmp_path / f"trades_{n}.csv", [f"G{n}", "G9"]) for n in range(3)]
+    SplitManifest(
+        key_column="gfcid",
+        row_counts={path.name: 2 for path in files},
+        keys_by_file={path.name: [f"G{n}", "G9"] for n, path in enumerate(files)},
+    ).write(tmp_path / "trades_manifest.json")
+    SplitManifest(
+        key_column="cagid", row_counts={files[0].name: 2}, keys_by_file={files[0].name: ["C1"]}
+    ).write(tmp_path / "other_manifest.json")
+    # Rewritten after the manifest, so its keys must come from the file itself
+    stale = files[2]
+    _write_split(stale, ["G7"])
+    later = os.stat(tmp_path / "trades_manifest.json").st_mtime + 10
+    os.utime(stale, (later, later))
+
+    scanned = []
+    original = Neo4jLoader.collect_gfcids_from_file
+
+    def collect(self, file_path):
+        scanned.append(file_path)
+        return original(self, file_path)
+
+    monkeypatch.setattr(Neo4jLoader, "collect_gfcids_from_file", collect)
+    driver = FakeDriver()
+    loader = _loader(driver)
+
+    assert loader._gfcids_by_file(files) == [{"G0", "G9"}, {"G1", "G9"}, {"G7"}]
+    assert scanned == [stale]
+
+    result = loader.load_files(files)
+
+    summary_keys = {
+        gfcid
+        for _, parameters in driver.queries
+        for gfcid in parameters.get("gfcids", ())
+    }
+    assert result.success
+    assert summary_keys == {"G0", "G1", "G7", "G9"}
+
+
+def test_load_files_fails_without_loading_when_summary_nodes_cannot_be_created(tmp_path):
+    files = [_write_split(tmp_path / f"part_{n}.csv", [f"G{n}"]) for n in range(2)]
+
+    def on_run(query, parameters):
+        if "gfcids" in parameters:
+            raise TransientError("LockClient terminated")
+
+    driver = FakeDriver(on_run)
+    result = _loader(driver, max_retries=1).load_files(files, parallel=True)
+
+    assert not result.success
+    assert "Summary_GFCID" in result.error
+    assert result.files_loaded == 0
+    assert result.failed_files == [str(path) for path in files]
+    assert _loaded_files(driver) == []
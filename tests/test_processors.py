@@ -0,0 +1,494 @@
+"""Tests for the cut and split processors."""
+import bz2
+import csv
+import gzip
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from app.services import processors
+from app.services.processors import (
+    HAS_CUT,
+    ColumnCutter,
+    DataProcessor,
+    PartitionBuffer,
+    SplitManifest,
+    StreamingCutSplitter,
+    WriterPool,
+)
+
+DELIM = "\x01"
+
+
+def _column_config(**overrides) -> Dict:
+    config = {
+        "delimiter": DELIM,
+        "output_delimiter": ",",
+        "required_columns_by_index": "1,3,4",
+        "column_names": ["gfcid", "amount", "name"],
+        "split_by_column": "gfcid",
+    }
+    config.update(overrides)
+    return config
+
+
+def _source_rows(count: int = 40, keys: int = 7) -> List[List[str]]:
+    return [
+        [f"G{i % keys}", f"x{i}", f"{i}.5", f"name{i}", "unused"]
+        for i in range(count)
+    ]
+
+
+def _write_source(path: Path, rows: List[List[str]], header: List[str] = None) -> Path:
+    lines = [DELIM.join(header)] if header else []
+    lines += [DELIM.join(row) for row in rows]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def _read_split(paths) -> Dict[str, str]:
+    return {Path(p).name: Path(p).read_text(encoding="utf-8") for p in paths}
+
+
+def test_fused_cut_split_matches_two_stage_output(tmp_path):
+    source = _write_source(tmp_path / "source.dat", _source_rows())
+
+    two_stage = DataProcessor(_column_config(), dropbox_dir=str(tmp_path / "a"))
+    fused = DataProcessor(_column_config(fused_cut_split=True), dropbox_dir=str(tmp_path / "b"))
+    expected = two_stage.process_file(source, "20240101")["split"]
+    actual = fused.process_file(source, "20240101")["split"]
+
+    assert expected.success and actual.success
+    assert actual.rows_processed == 40
+    assert _read_split(actual.output_paths) == _read_split(expected.output_paths)
+
+
+@pytest.mark.parametrize("has_header", [False, True])
+def test_streaming_splitter_honours_has_header(tmp_path, has_header):
+    rows = _source_rows(count=10, keys=2)
+    header = ["gfcid", "x", "amount", "name", "unused"] if has_header else None
+    source = _write_source(tmp_path / "source.dat", rows, header)
+    config = _column_config(has_header=has_header)
+
+    result = StreamingCutSplitter(config).process(source, tmp_path / "split", "p-", "20240101")
+
+    assert result.success
+    assert result.rows_processed == 10
+    content = (tmp_path / "split" / "p-G0.csv").read_text().splitlines()
+    assert content[0] == "gfcid,amount,name"
+    assert content[1:] == [f"G0,{i}.5,name{i}" for i in range(0, 10, 2)]
+
+
+def test_streaming_splitter_does_not_swallow_interrupts(tmp_path, monkeypatch):
+    source = _write_source(tmp_path / "source.dat", _source_rows(count=3))
+    splitter = StreamingCutSplitter(_column_config())
+
+    def interrupt(key):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(splitter.partitioner, "name", interrupt)
+    with pytest.raises(KeyboardInterrupt):
+        splitter.process(source, tmp_path / "split", "p-", "20240101")
+
+
+def test_parallel_cut_matches_serial_and_reports_progress(tmp_path, monkeypatch):
+    source = _write_source(tmp_path / "source.dat", _source_rows(count=5000))
+    total = source.stat().st_size
+    serial = ColumnCutter(_column_config())
+    parallel = ColumnCutter(_column_config(cut_workers=3, parallel_cut_min_bytes=0))
+    progress = []
+    parallel_runs = []
+    cut_parallel = ColumnCutter._cut_parallel
+
+    def spy(self, *args, **kwargs):
+        parallel_runs.append(self)
+        return cut_parallel(self, *args, **kwargs)
+
+    monkeypatch.setattr(ColumnCutter, "_cut_parallel", spy)
+
+    expected = serial.process(source, tmp_path / "serial.csv")
+    result = parallel.process(
+        source, tmp_path / "parallel.csv", lambda done, size: progress.append((done, size))
+    )
+
+    assert parallel_runs == [parallel]
+    assert result.success and result.rows_processed == 5000
+    assert (tmp_path / "parallel.csv").read_bytes() == (tmp_path / "serial.csv").read_bytes()
+    assert expected.rows_processed == 5000
+    assert progress and progress[-1] == (total, total)
+    assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+
+
+@pytest.mark.parametrize("has_header", [False, True])
+def test_cut_writes_a_single_header_line_first(tmp_path, has_header):
+    header = ["gfcid", "x", "amount", "name", "unused"] if has_header else None
+    source = _write_source(tmp_path / "source.dat", _source_rows(count=3), header)
+
+    result = ColumnCutter(_column_config(has_header=has_header)).process(
+        source, tmp_path / "cut.csv"
+    )
+
+    assert result.success
+    assert (tmp_path / "cut.csv").read_text().splitlines() == [
+        "gfcid,amount,name",
+        "G0,0.5,name0",
+        "G1,1.5,name1",
+        "G2,2.5,name2",
+    ]
+
+
+def test_mmap_projector_handles_crlf_short_rows_and_missing_newline(tmp_path):
+    source = tmp_path / "source.dat"
+    source.write_bytes(
+        DELIM.join(["G1", "x", "1.5", "café", "u"]).encode("utf-8") + b"\r\n"
+        + DELIM.join(["G2", "x", "2.5"]).encode("utf-8") + b"\n"
+        + DELIM.join(["G3", "x", "3.5", "last", "u"]).encode("utf-8")
+    )
+
+    result = ColumnCutter(_column_config())._cut_with_python(source, tmp_path / "cut.csv")
+
+    assert result.success and result.rows_processed == 3
+    assert (tmp_path / "cut.csv").read_bytes().decode("utf-8").split("\n") == [
+        "gfcid,amount,name",
+        "G1,1.5,café",
+        "G2,2.5,",
+        "G3,3.5,last",
+        "",
+    ]
+
+
+@pytest.mark.skipif(not HAS_CUT, reason="cut command not available")
+@pytest.mark.parametrize("compressed", [False, True])
+def test_cut_command_pipeline_matches_python_projection(tmp_path, compressed):
+    plain = _write_source(tmp_path / "source.dat", _source_rows(count=2000))
+    source = plain
+    if compressed:
+        source = tmp_path / "source.dat.gz"
+        source.write_bytes(gzip.compress(plain.read_bytes()))
+    cutter = ColumnCutter(_column_config())
+    progress = []
+
+    result = cutter._cut_with_command(
+        source, tmp_path / "command.csv", lambda done, size: progress.append((done, size))
+    )
+    cutter._cut_with_python(plain, tmp_path / "python.csv")
+
+    assert result.success, result.error
+    assert result.rows_processed == 2000
+    assert (tmp_path / "command.csv").read_bytes() == (tmp_path / "python.csv").read_bytes()
+    assert progress[-1] == (source.stat().st_size, source.stat().st_size)
+
+
+def _data_lines(path: Path) -> List[str]:
+    return Path(path).read_text(encoding="utf-8").splitlines()[1:]
+
+
+@pytest.mark.parametrize("fused", [False, True])
+def test_split_row_counts_match_written_rows(tmp_path, fused):
+    source = _write_source(tmp_path / "source.dat", _source_rows(count=100, keys=9))
+    processor = DataProcessor(_column_config(fused_cut_split=fused), dropbox_dir=str(tmp_path))
+
+    results = processor.process_file(source, "20240101")
+    split = results["split"]
+
+    assert results["cut"].rows_processed == 100
+    assert split.rows_processed == 100
+    assert split.row_counts == {path: len(_data_lines(path)) for path in split.output_paths}
+
+
+def test_writer_pool_reopens_evicted_files_without_repeating_header(tmp_path):
+    paths = [tmp_path / f"part{i}.csv" for i in range(5)]
+
+    with WriterPool(header="h\n", max_open_files=2) as pool:
+        for round_number in range(3):
+            for path in paths:
+                pool.write(path, f"{path.stem}-{round_number}\n".encode())
+                assert len(pool._handles) <= 2
+
+    assert pool.reopen_count > 0
+    for path in paths:
+        assert path.read_text().splitlines() == ["h"] + [f"{path.stem}-{n}" for n in range(3)]
+
+
+def test_partition_buffer_flushes_per_partition_and_at_memory_budget(tmp_path):
+    small, large = tmp_path / "small.csv", tmp_path / "large.csv"
+    buffer = PartitionBuffer(WriterPool(), flush_bytes=10, memory_budget_bytes=16)
+
+    buffer.append(small, b"abc\n")
+    assert set(buffer._buffers) == {small} and buffer.buffered_bytes == 4
+
+    # A partition reaching flush_bytes is written out on its own
+    buffer.append(large, b"0123456789\n")
+    assert set(buffer._buffers) == {small} and buffer.buffered_bytes == 4
+
+    # Reaching the memory budget writes out every partition
+    buffer.append(large, b"x\n")
+    buffer.append(small, b"def\n")
+    assert buffer.buffered_bytes == 10
+    buffer.append(large, b"yyyyyy\n")
+    assert buffer.buffered_bytes == 0 and not buffer._buffers
+    buffer.close()
+
+    assert small.read_bytes() == b"abc\ndef\n"
+    assert large.read_bytes() == b"0123456789\nx\nyyyyyy\n"
+
+
+SPLIT_PATHS = ["pandas", "csv", "external_sort", "fused", "parquet"]
+
+
+def _split_with(tmp_path, monkeypatch, split_path: str, source: Path, **overrides):
+    """Run the full cut+split through one of the split implementations."""
+    if split_path == "csv":
+        monkeypatch.setattr(processors, "HAS_PANDAS", False)
+    elif split_path == "external_sort":
+        overrides.update(external_sort_split=True, sort_run_bytes=256)
+    elif split_path == "fused":
+        overrides.update(fused_cut_split=True)
+    elif split_path == "parquet":
+        overrides.update(intermediate_format="parquet")
+    processor = DataProcessor(_column_config(**overrides), dropbox_dir=str(tmp_path / split_path))
+    result = processor.process_file(source, "20240101")["split"]
+    assert result.success, result.error
+    return result
+
+
+def _assert_keys_match_files(result, source_keys) -> None:
+    """Every row must sit in the file that keys_by_file lists its key under."""
+    assert set(result.keys_by_file) == set(result.output_paths)
+    seen = set()
+    for path, keys in result.keys_by_file.items():
+        written = {line.split(",")[0] for line in _data_lines(path)}
+        assert written == set(keys), path.name
+        assert not seen & written, "a key was written to more than one file"
+        seen |= written
+    assert seen == set(source_keys)
+
+    manifest = SplitManifest.load(result.manifest_path)
+    assert manifest.keys_by_path(result.manifest_path.parent) == {
+        path: sorted(keys) for path, keys in result.keys_by_file.items()
+    }
+
+
+@pytest.mark.parametrize("split_path", SPLIT_PATHS)
+@pytest.mark.parametrize("split_mode", ["key", "hash"])
+def test_split_keys_by_file_matches_file_contents(tmp_path, monkeypatch, split_path, split_mode):
+    rows = _source_rows(count=600, keys=150)
+    source = _write_source(tmp_path / "source.dat", rows)
+
+    result = _split_with(
+        tmp_path, monkeypatch, split_path, source, split_mode=split_mode, shard_count=8
+    )
+
+    _assert_keys_match_files(result, {row[0] for row in rows})
+    if split_mode == "hash":
+        assert len(result.output_paths) == 8
+        assert all(path.name.startswith("split_20240101-shard") for path in result.output_paths)
+
+
+@pytest.mark.parametrize("split_path", SPLIT_PATHS)
+def test_balanced_split_packs_keys_into_target_size_files(tmp_path, monkeypatch, split_path):
+    # One heavy key of 120 rows plus 60 keys of 3 rows each
+    rows = [["HEAVY", "x", f"{i}.5", f"n{i}", "u"] for i in range(120)]
+    rows += [[f"K{i % 60}", "x", f"{i}.5", f"n{i}", "u"] for i in range(180)]
+    source = _write_source(tmp_path / "source.dat", rows)
+
+    result = _split_with(
+        tmp_path, monkeypatch, split_path, source, split_mode="balanced", target_file_rows=50
+    )
+
+    _assert_keys_match_files(result, {row[0] for row in rows})
+    sizes = sorted(result.row_counts.values())
+    assert sizes[-1] == 120  # the heavy key gets a file of its own
+    assert sizes[:-1] == [36, 48, 48, 48]
+
+
+def test_balanced_parquet_split_plans_from_the_key_column_only(tmp_path, monkeypatch):
+    rows = _source_rows(count=300, keys=40)
+    source = _write_source(tmp_path / "source.dat", rows)
+
+    def text_histogram(*args, **kwargs):
+        raise AssertionError("the Parquet intermediate was scanned as text")
+
+    monkeypatch.setattr(processors, "_key_histogram", text_histogram)
+    result = _split_with(
+        tmp_path, monkeypatch, "parquet", source, split_mode="balanced", target_file_rows=50
+    )
+
+    _assert_keys_match_files(result, {row[0] for row in rows})
+
+
+def test_external_sort_split_merges_many_runs_and_keeps_row_order(tmp_path, monkeypatch):
+    source = _write_source(tmp_path / "source.dat", _source_rows(count=400, keys=13))
+    expected = _split_with(tmp_path, monkeypatch, "pandas", source)
+
+    sorted_split = DataProcessor(
+        _column_config(external_sort_split=True, sort_run_bytes=200, max_open_files=3),
+        dropbox_dir=str(tmp_path / "sorted")
+    ).process_file(source, "20240101")["split"]
+
+    assert sorted_split.success, sorted_split.error
+    assert sorted_split.row_counts == {
+        tmp_path / "sorted" / "20240101" / "split" / path.name: rows
+        for path, rows in expected.row_counts.items()
+    }
+    assert _read_split(sorted_split.output_paths) == _read_split(expected.output_paths)
+    assert not list((tmp_path / "sorted").rglob(".split-sort-*"))
+
+
+def test_parquet_split_quotes_values_containing_delimiters(tmp_path):
+    rows = [
+        ["G1", "x", "7,5", 'say "hi"', "u"],
+        ["G1", "x", "8", "plain", "u"],
+        ["G2", "x", "9", "tab\tvalue", "u"],
+    ]
+    source = _write_source(tmp_path / "source.dat", rows)
+    processor = DataProcessor(
+        _column_config(intermediate_format="parquet"), dropbox_dir=str(tmp_path)
+    )
+
+    result = processor.process_file(source, "20240101")["split"]
+
+    assert result.success, result.error
+    parsed = []
+    for path in sorted(result.output_paths):
+        with path.open(newline="", encoding="utf-8") as f:
+            parsed += list(csv.reader(f))[1:]
+    assert parsed == [[row[0], row[2], row[3]] for row in rows]
+
+
+def _parsed_split(result) -> Dict[str, List[List[str]]]:
+    parsed = {}
+    for path in result.output_paths:
+        with Path(path).open(newline="", encoding="utf-8") as f:
+            parsed[Path(path).name] = list(csv.reader(f))
+    return parsed
+
+
+def _typed_rows() -> List[List[str]]:
+    amounts = ["1.5", "abc", "", "2", "1e3", "7.25"]
+    return [[f"G{i % 2}", "x", amount, f"n{i}", "u"] for i, amount in enumerate(amounts)]
+
+
+TYPED = {"column_types": {"amount": "float64"}}
+
+
+def test_type_coercion_output_does_not_depend_on_split_path(tmp_path, monkeypatch):
+    source = _write_source(tmp_path / "source.dat", _typed_rows())
+
+    outputs = {
+        split_path: _parsed_split(
+            _split_with(tmp_path, monkeypatch, split_path, source, coerce_types=True, **TYPED)
+        )
+        for split_path in SPLIT_PATHS
+    }
+
+    expected = {
+        "split_20240101-G0.csv": [
+            ["gfcid", "amount", "name"], ["G0", "1.5", "n0"], ["G0", "", "n2"], ["G0", "1000.0", "n4"]
+        ],
+        "split_20240101-G1.csv": [
+            ["gfcid", "amount", "name"], ["G1", "", "n1"], ["G1", "2.0", "n3"], ["G1", "7.25", "n5"]
+        ],
+    }
+    for split_path, output in outputs.items():
+        assert output == expected, split_path
+
+
+def test_int_and_date_coercion_is_identical_across_split_paths(tmp_path, monkeypatch):
+    amounts = ["1", "2.0", "2.5", "x", "", "1e3"]
+    dates = ["2024-01-31", "31/01/2024", "", "2024-02-30", "2024-12-01", "2024-1-5"]
+    rows = [[f"G{i % 2}", "x", amount, day, "u"] for i, (amount, day) in enumerate(zip(amounts, dates))]
+    source = _write_source(tmp_path / "source.dat", rows)
+    types = {"column_types": {"amount": "int64", "name": "date"}}
+
+    outputs = {
+        split_path: _parsed_split(
+            _split_with(tmp_path, monkeypatch, split_path, source, coerce_types=True, **types)
+        )
+        for split_path in SPLIT_PATHS
+    }
+
+    expected = {
+        "split_20240101-G0.csv": [
+            ["gfcid", "amount", "name"], ["G0", "1", "2024-01-31"], ["G0", "", ""],
+            ["G0", "", "2024-12-01"],
+        ],
+        "split_20240101-G1.csv": [
+            ["gfcid", "amount", "name"], ["G1", "2", ""], ["G1", "", ""], ["G1", "1000", "2024-01-05"],
+        ],
+    }
+    for split_path, output in outputs.items():
+        assert output == expected, split_path
+
+
+def test_vectorized_coercion_matches_the_per_value_parsers():
+    values = [
+        "0", "-0", "1000", "1e15", "1e16", "1e-4", "1e-5", "123.456", "0.1", "inf", "nan",
+        "+3", " 7", "1_000", "12345678901234567.5", "", None, "abc",
+    ]
+    coercer = processors._TypeCoercer({"amount": "float64"})
+
+    expected = [coercer.format("amount", value) for value in values]
+    per_value_invalid = dict(coercer.invalid)
+    coercer.reset()
+
+    assert coercer.format_column("amount", values) == expected
+    assert coercer.invalid == per_value_invalid == {"amount": 2}
+    assert expected[:8] == ["0.0", "-0.0", "1000.0", "1000000000000000.0", "1e+16", "0.0001", "1e-05", "123.456"]
+
+
+@pytest.mark.parametrize("split_path", SPLIT_PATHS)
+def test_type_coercion_is_off_by_default(tmp_path, monkeypatch, split_path):
+    rows = _typed_rows()
+    source = _write_source(tmp_path / "source.dat", rows)
+
+    output = _parsed_split(_split_with(tmp_path, monkeypatch, split_path, source, **TYPED))
+
+    written = sorted(row[1] for rows_ in output.values() for row in rows_[1:])
+    assert written == sorted(row[2] for row in rows)
+
+
+@pytest.mark.parametrize("split_path", SPLIT_PATHS)
+def test_type_errors_fail_aborts_every_split_path(tmp_path, monkeypatch, split_path):
+    source = _write_source(tmp_path / "source.dat", _typed_rows())
+    if split_path == "csv":
+        monkeypatch.setattr(processors, "HAS_PANDAS", False)
+    overrides = {
+        "external_sort": {"external_sort_split": True},
+        "fused": {"fused_cut_split": True},
+        "parquet": {"intermediate_format": "parquet"},
+    }.get(split_path, {})
+    processor = DataProcessor(
+        _column_config(coerce_types=True, type_errors="fail", **TYPED, **overrides),
+        dropbox_dir=str(tmp_path)
+    )
+
+    results = processor.process_file(source, "20240101")
+
+    failed = results.get("split") or results["cut"]
+    assert not failed.success
+    assert "amount" in failed.error and "'abc'" in failed.error
+
+
+@pytest.mark.parametrize("compress", [gzip.compress, bz2.compress], ids=["gzip", "bz2"])
+@pytest.mark.parametrize("fused", [False, True])
+def test_compressed_sources_and_gzip_split_output(tmp_path, compress, fused):
+    plain = _write_source(tmp_path / "source.dat", _source_rows(count=50))
+    source = tmp_path / "source.dat.z"
+    source.write_bytes(compress(plain.read_bytes()))
+
+    expected = DataProcessor(_column_config(), dropbox_dir=str(tmp_path / "plain"))
+    expected_split = expected.process_file(plain, "20240101")["split"]
+    processor = DataProcessor(
+        _column_config(fused_cut_split=fused, split_output_compression="gzip"),
+        dropbox_dir=str(tmp_path / "compressed")
+    )
+    split = processor.process_file(source, "20240101")["split"]
+
+    assert split.success, split.error
+    assert all(path.name.endswith(".csv.gz") for path in split.output_paths)
+    assert {
+        path.name[:-len(".gz")]: gzip.decompress(path.read_bytes()).decode("utf-8")
+        for path in split.output_paths
+    } == _read_split(expected_split.output_paths)
@@ -0,0 +1,175 @@
+"""Tests for fetching CSV headers and SFTP datasets over the shared SSH pool."""
+import io
+from types import SimpleNamespace
+
+import pytest
+
+from app.config.settings import Settings
+from app.libs.data_connector.context import DataSetContext
+from app.libs.linux import ssh, ssh_pool
+from app.libs.linux.ssh import SSHCSVHeaderFetcher
+from app.libs.linux.ssh_pool import SSHConnectionPool
+
+FILES = {
+    "/data/trades.csv": b"gfcid, amount ,name\nG1,1.5,Acme\n",
+    "/data/limits.csv": b"gfcid,limit\nG1,100\n",
+}
+
+
+class FakeChannel:
+    def __init__(self, transport):
+        self.transport = transport
+        self.stdout = b""
+
+    def settimeout(self, timeout):
+        pass
+
+    def exec_command(self, command):
+        self.transport.commands.append(command)
+        # Only ``head -n 1 <path>`` is run by the header fetcher
+        self.stdout = FILES[command.split()[-1]].splitlines(keepends=True)[0]
+
+    def makefile(self, mode):
+        return io.BytesIO(self.stdout)
+
+    def makefile_stderr(self, mode):
+        return io.BytesIO()
+
+    def recv_exit_status(self):
+        return 0
+
+    def close(self):
+        pass
+
+
+class FakeTransport:
+    def __init__(self):
+        self.active = True
+        self.commands = []
+
+    def set_keepalive(self, interval):
+        pass
+
+    def is_active(self):
+        return self.active
+
+    def open_session(self, timeout=None):
+        return FakeChannel(self)
+
+
+class FakeSSHClient:
+    instances = []
+
+    def __init__(self):
+        self.policy = None
+        self.connect_args = None
+        self.transport = None
+        FakeSSHClient.instances.append(self)
+
+    def load_system_host_keys(self, filename=None):
+        pass
+
+    def set_missing_host_key_policy(self, policy):
+        self.policy = policy
+
+    def connect(self, hostname, **kwargs):
+        self.connect_args = dict(kwargs, hostname=hostname)
+        self.transport = FakeTransport()
+
+    def get_transport(self):
+        return self.transport
+
+    def close(self):
+        self.transport.active = False
+
+
+class FakeRemoteFile(io.BytesIO):
+    def prefetch(self):
+        pass
+
+
+class FakeSFTPClient:
+    opened = []
+
+    def __init__(self, transport):
+        self.transport = transport
+
+    @classmethod
+    def from_transport(cls, transport):
+        return cls(transport)
+
+    def open(self, path, mode):
+        FakeSFTPClient.opened.append((self.transport, path))
+        return FakeRemoteFile(FILES[path])
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    FakeSSHClient.instances = []
+    FakeSFTPClient.opened = []
+    monkeypatch.setattr(ssh_pool, "paramiko", SimpleNamespace(
+        SSHClient=FakeSSHClient,
+        SFTPClient=FakeSFTPClient,
+        RejectPolicy=lambda: "reject",
+        AutoAddPolicy=lambda: "auto-add",
+    ))
+    shared = SSHConnectionPool()
+    monkeypatch.setattr(ssh, "get_ssh_pool", lambda: shared)
+    yield shared
+    shared.close_all()
+
+
+def test_header_fetches_reuse_one_pooled_transport(pool):
+    settings = Settings(LINUX_SERVERS={
+        "etl": {
+            "user": "loader",
+            "pass": "secret",
+            "host": "etl-01",
+            "csv_files": {"curated": {"Trades": "/data/trades.csv", "Limits": "/data/limits.csv"}},
+        },
+    })
+    fetcher = SSHCSVHeaderFetcher(settings)
+
+    trades = fetcher.fetch_file_headers("CURATED", "Trades", "etl")
+    limits = fetcher.fetch_file_headers("CURATED", "Limits", "etl")
+
+    assert trades == {"CURATED": {"Trades": ["gfcid", "amount", "name"]}}
+    assert limits == {"CURATED": {"Limits": ["gfcid", "limit"]}}
+    client, = FakeSSHClient.instances
+    assert pool.connect_count == 1
+    assert client.transport.commands == ["head -n 1 /data/trades.csv", "head -n 1 /data/limits.csv"]
+    # Authenticates and checks host keys as the fetcher always has
+    assert client.policy == "auto-add"
+    assert client.connect_args["hostname"] == "etl-01"
+    assert client.connect_args["username"] == "loader"
+    assert client.connect_args["password"] == "secret"
+    assert client.connect_args["look_for_keys"] is True
+
+
+def test_sftp_datasets_reuse_one_pooled_transport(pool, tmp_path, monkeypatch):
+    pytest.importorskip("requests")
+    from app.libs.data_connector import connector
+
+    monkeypatch.setattr(connector, "get_ssh_pool", lambda: pool)
+    data_connector = connector.DataConnector(Settings(OUTPUT_DIR=str(tmp_path)))
+    options = {"host": "sftp-01", "username": "loader", "key_filename": "/keys/id_rsa", "password": "unused"}
+
+    frames = [
+        data_connector._fetch_sftp(DataSetContext("lead", "sftp", "Feeds", path, options))
+        for path in ("/data/trades.csv", "/data/limits.csv")
+    ]
+
+    assert list(frames[0].columns) == ["gfcid", " amount ", "name"]
+    assert list(frames[1].columns) == ["gfcid", "limit"]
+    client, = FakeSSHClient.instances
+    assert pool.connect_count == 1
+    assert [transport for transport, _ in FakeSFTPClient.opened] == [client.transport] * 2
+    # Only the configured key is offered, and unknown hosts are accepted
+    assert client.policy == "auto-add"
+    assert client.connect_args["key_filename"] == "/keys/id_rsa"
+    assert client.connect_args["password"] is None
+    assert client.connect_args["allow_agent"] is False
+    assert client.connect_args["look_for_keys"] is False
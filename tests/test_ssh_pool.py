@@ -0,0 +1,275 @@
+"""Tests for the shared SSH connection pool."""
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.libs.linux import ssh_pool
+from app.libs.linux.ssh_pool import SSHConnectionPool
+
+
+class FakeTransport:
+    def __init__(self):
+        self.active = True
+        self.keepalive = None
+
+    def set_keepalive(self, interval):
+        self.keepalive = interval
+
+    def is_active(self):
+        return self.active
+
+
+class FakeSSHClient:
+    """Records how the pool sets up and authenticates each connection."""
+
+    instances = []
+    refuse = None
+    on_connect = None
+
+    def __init__(self):
+        self.known_hosts = "unset"
+        self.policy = None
+        self.connect_args = None
+        self.closed = False
+        self.transport = None
+        FakeSSHClient.instances.append(self)
+
+    def load_system_host_keys(self, filename=None):
+        self.known_hosts = filename
+
+    def set_missing_host_key_policy(self, policy):
+        self.policy = policy
+
+    def connect(self, hostname, **kwargs):
+        if FakeSSHClient.on_connect is not None:
+            FakeSSHClient.on_connect(hostname)
+        if FakeSSHClient.refuse:
+            raise FakeSSHClient.refuse
+        self.connect_args = dict(kwargs, hostname=hostname)
+        self.transport = FakeTransport()
+
+    def get_transport(self):
+        return self.transport
+
+    def close(self):
+        self.closed = True
+        if self.transport is not None:
+            self.transport.active = False
+
+
+class RejectPolicy:
+    pass
+
+
+class AutoAddPolicy:
+    pass
+
+
+@pytest.fixture
+def fake_paramiko(monkeypatch):
+    FakeSSHClient.instances = []
+    FakeSSHClient.refuse = None
+    FakeSSHClient.on_connect = None
+    fake = SimpleNamespace(
+        SSHClient=FakeSSHClient, RejectPolicy=RejectPolicy, AutoAddPolicy=AutoAddPolicy
+    )
+    monkeypatch.setattr(ssh_pool, "paramiko", fake)
+    return fake
+
+
+def test_connections_verify_host_keys_and_try_agent_and_default_keys(fake_paramiko):
+    pool = SSHConnectionPool(keepalive=15, known_hosts_file="/etc/ssh/ssh_known_hosts")
+
+    # LINUX_SERVERS entries usually carry only a user name
+    with pool.transport("etl-01", "loader") as transport:
+        client = FakeSSHClient.instances[0]
+        assert transport is client.transport
+
+    assert client.known_hosts == "/etc/ssh/ssh_known_hosts"
+    assert isinstance(client.policy, RejectPolicy)
+    assert client.connect_args["hostname"] == "etl-01"
+    assert client.connect_args["port"] == 22
+    assert client.connect_args["username"] == "loader"
+    assert client.connect_args["password"] is None
+    assert client.connect_args["key_filename"] is None
+    assert client.connect_args["allow_agent"] is True
+    assert client.connect_args["look_for_keys"] is True
+    assert client.transport.keepalive == 15
+
+
+def test_pool_reuses_live_connections_and_replaces_dead_ones(fake_paramiko):
+    pool = SSHConnectionPool()
+
+    with pool.transport("etl-01", "loader"):
+        pass
+    with pool.transport("etl-01", "loader", key_filename="/keys/id_ed25519"):
+        pass
+    assert pool.connect_count == 1
+    assert len(pool) == 1
+
+    FakeSSHClient.instances[0].transport.active = False
+    with pool.transport("etl-01", "loader"):
+        pass
+    assert pool.connect_count == 2
+    assert FakeSSHClient.instances[0].closed
+
+    with pool.transport("etl-02", "loader"):
+        pass
+    assert len(pool) == 2
+
+    pool.close_all()
+    assert len(pool) == 0
+    assert all(client.closed for client in FakeSSHClient.instances)
+
+
+def test_failed_connection_is_closed_and_not_pooled(fake_paramiko):
+    FakeSSHClient.refuse = OSError("Server 'etl-01' not found in known_hosts")
+    pool = SSHConnectionPool()
+
+    with pytest.raises(OSError, match="known_hosts"):
+        with pool.transport("etl-01", "loader"):
+            pass
+
+    assert FakeSSHClient.instances[0].closed
+    assert len(pool) == 0
+    assert pool.connect_count == 0
+
+
+def test_host_key_policy_and_auth_options_are_applied_per_connection(fake_paramiko):
+    pool = SSHConnectionPool()
+
+    with pool.transport(
+        "etl-01", "loader", password="secret", missing_host_key_policy="auto-add",
+        allow_agent=False, look_for_keys=False,
+    ):
+        pass
+    with pool.transport("etl-01", "loader"):
+        pass
+
+    auto_add, strict = FakeSSHClient.instances
+    assert isinstance(auto_add.policy, AutoAddPolicy)
+    assert auto_add.connect_args["allow_agent"] is False
+    assert auto_add.connect_args["look_for_keys"] is False
+    # A connection accepted under auto-add is not reused by a strict caller
+    assert isinstance(strict.policy, RejectPolicy)
+    assert pool.connect_count == 2
+
+    with pytest.raises(ValueError, match="missing_host_key_policy"):
+        with pool.transport("etl-01", "loader", missing_host_key_policy="trust-me"):
+            pass
+
+
+def test_handshakes_run_outside_the_pool_lock(fake_paramiko):
+    slow_started = threading.Event()
+    finish_slow = threading.Event()
+
+    def on_connect(hostname):
+        if hostname == "slow":
+            slow_started.set()
+            assert finish_slow.wait(5)
+
+    FakeSSHClient.on_connect = on_connect
+    pool = SSHConnectionPool()
+    transports = []
+
+    def lease_slow():
+        with pool.transport("slow", "loader") as transport:
+            transports.append(transport)
+
+    callers = [threading.Thread(target=lease_slow) for _ in range(3)]
+    for caller in callers:
+        caller.start()
+    assert slow_started.wait(5)
+
+    # Another server is reachable while the slow handshake is in progress
+    with pool.transport("fast", "loader"):
+        pass
+    assert pool.connect_count == 1
+
+    finish_slow.set()
+    for caller in callers:
+        caller.join(5)
+    # Callers that arrived during the handshake share its transport
+    assert len(transports) == 3 and len(set(map(id, transports))) == 1
+    assert pool.connect_count == 2
+
+
+def test_waiters_see_a_failed_handshake(fake_paramiko):
+    started = threading.Event()
+    finish = threading.Event()
+
+    def on_connect(hostname):
+        started.set()
+        assert finish.wait(5)
+        raise OSError("Connection refused")
+
+    FakeSSHClient.on_connect = on_connect
+    pool = SSHConnectionPool()
+    errors = []
+
+    def lease():
+        try:
+            with pool.transport("etl-01", "loader"):
+                pass
+        except OSError as exc:
+            errors.append(exc)
+
+    callers = [threading.Thread(target=lease) for _ in range(2)]
+    for caller in callers:
+        caller.start()
+    assert started.wait(5)
+    finish.set()
+    for caller in callers:
+        caller.join(5)
+
+    assert len(errors) == 2
+    assert len(FakeSSHClient.instances) == 1
+    assert len(pool) == 0
+
+
+def test_idle_connections_are_closed_on_release(fake_paramiko):
+    pool = SSHConnectionPool(idle_timeout=0)
+
+    with pool.transport("etl-01", "loader"):
+        assert len(pool) == 1
+
+    assert FakeSSHClient.instances[0].closed
+    assert len(pool) == 0
+
+
+def test_reaper_closes_idle_connections_without_further_calls(fake_paramiko):
+    pool = SSHConnectionPool(idle_timeout=0.05)
+
+    with pool.transport("etl-01", "loader"):
+        pass
+
+    deadline = time.monotonic() + 5
+    while len(pool) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert FakeSSHClient.instances[0].closed
+    assert len(pool) == 0
+
+
+def test_close_all_closes_transports_that_are_still_leased(fake_paramiko):
+    pool = SSHConnectionPool()
+
+    with pool.transport("etl-01", "loader"):
+        pool.close_all()
+        assert FakeSSHClient.instances[0].closed
+    assert len(pool) == 0
+
+
+def test_pooled_transports_are_closed_at_exit(fake_paramiko, monkeypatch):
+    hooks = []
+    monkeypatch.setattr(ssh_pool.atexit, "register", lambda *hook: hooks.append(hook))
+    pool = SSHConnectionPool()
+
+    with pool.transport("etl-01", "loader"):
+        pass
+    for func, *args in hooks:
+        func(*args)
+
+    assert FakeSSHClient.instances[0].closed
+    assert len(pool) == 0